@@ -2,7 +2,9 @@ from dharitri_sdk.adapters.query_runner_adapter import QueryRunnerAdapter
 from dharitri_sdk.converters.transactions_converter import \
     TransactionsConverter
 from dharitri_sdk.core.account import AccountNonceHolder
-from dharitri_sdk.core.address import Address, AddressComputer, AddressFactory
+from dharitri_sdk.core.address import (Address, AddressComputer,
+                                       AddressFactory, AddressPool,
+                                       addresses_to_bech32)
 from dharitri_sdk.core.code_metadata import CodeMetadata
 from dharitri_sdk.core.config import LibraryConfig
 from dharitri_sdk.core.contract_query import ContractQuery
@@ -45,20 +47,41 @@ from dharitri_sdk.core.transactions_outcome_parsers.transaction_events_parser im
     TransactionEventsParser
 from dharitri_sdk.network_providers.api_network_provider import \
     ApiNetworkProvider
+from dharitri_sdk.network_providers.async_api_network_provider import \
+    AsyncApiNetworkProvider
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.block_driven_transaction_awaiter import \
+    BlockDrivenTransactionAwaiter
+from dharitri_sdk.network_providers.completion_detector import \
+    TransactionCompletionDetector
 from dharitri_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.hyperblock_stream import (
+    FileCheckpointStore, HyperblockStream)
+from dharitri_sdk.network_providers.immutable_data_cache import (
+    FileImmutableDataStore, ImmutableDataCache, SQLiteImmutableDataStore)
+from dharitri_sdk.network_providers.multi_endpoint_network_provider import \
+    MultiEndpointNetworkProvider
+from dharitri_sdk.network_providers.network_metadata_cache import \
+    NetworkMetadataCache
+from dharitri_sdk.network_providers.polling_schedule import (
+    FixedPollingSchedule, RoundAlignedPollingSchedule)
 from dharitri_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
 from dharitri_sdk.network_providers.resources import GenericResponse
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
 from dharitri_sdk.network_providers.transaction_awaiter import \
     TransactionAwaiter
 from dharitri_sdk.network_providers.transaction_decoder import (
     TransactionDecoder, TransactionMetadata)
 from dharitri_sdk.wallet.mnemonic import Mnemonic
+from dharitri_sdk.wallet.transaction_signing_engine import (
+    SigningReport, TransactionSigningEngine)
 from dharitri_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
 from dharitri_sdk.wallet.user_pem import UserPEM
 from dharitri_sdk.wallet.user_signer import UserSigner
-from dharitri_sdk.wallet.user_verifer import UserVerifier
+from dharitri_sdk.wallet.user_verifer import UserVerifier, verify_transactions
 from dharitri_sdk.wallet.user_wallet import UserWallet
 from dharitri_sdk.wallet.validator_keys import (ValidatorPublicKey,
                                                 ValidatorSecretKey)
@@ -67,7 +90,7 @@ from dharitri_sdk.wallet.validator_signer import ValidatorSigner
 from dharitri_sdk.wallet.validator_verifier import ValidatorVerifier
 
 __all__ = [
-    "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer",
+    "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer", "AddressPool", "addresses_to_bech32",
     "Transaction", "TransactionPayload", "TransactionComputer",
     "Message", "MessageComputer", "CodeMetadata", "TokenPayment",
     "ContractQuery", "ContractQueryBuilder",
@@ -85,5 +108,10 @@ __all__ = [
     "find_events_by_identifier", "find_events_by_first_topic", "SmartContractTransactionsOutcomeParser", "TransactionAwaiter",
     "SmartContractQueriesController", "SmartContractQuery", "SmartContractQueryResponse",
     "TransactionDecoder", "TransactionMetadata", "TransactionEventsParser", "NetworkProviderConfig",
-    "LibraryConfig"
+    "LibraryConfig", "AsyncProxyNetworkProvider", "AsyncApiNetworkProvider", "RetryPolicy",
+    "MultiEndpointNetworkProvider", "NetworkMetadataCache",
+    "ImmutableDataCache", "SQLiteImmutableDataStore", "FileImmutableDataStore",
+    "HyperblockStream", "FileCheckpointStore", "FixedPollingSchedule", "RoundAlignedPollingSchedule",
+    "BlockDrivenTransactionAwaiter", "TransactionCompletionDetector",
+    "TransactionSigningEngine", "SigningReport", "verify_transactions"
 ]
@@ -1,5 +1,7 @@
 from dharitri_sdk.core.account import AccountNonceHolder
-from dharitri_sdk.core.address import Address, AddressComputer, AddressFactory
+from dharitri_sdk.core.address import (Address, AddressComputer,
+                                       AddressFactory, AddressPool,
+                                       addresses_to_bech32)
 from dharitri_sdk.core.code_metadata import CodeMetadata
 from dharitri_sdk.core.config import LibraryConfig
 from dharitri_sdk.core.contract_query import ContractQuery
@@ -42,7 +44,7 @@ from dharitri_sdk.core.transactions_outcome_parsers.transaction_events_parser im
     TransactionEventsParser
 
 __all__ = [
-    "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer",
+    "AccountNonceHolder", "Address", "AddressFactory", "AddressComputer", "AddressPool", "addresses_to_bech32",
     "Transaction", "TransactionPayload", "TransactionComputer",
     "Message", "MessageComputer", "CodeMetadata", "TokenPayment",
     "ContractQuery", "ContractQueryBuilder",
@@ -1,9 +1,11 @@
 import logging
-from typing import Optional, Protocol, Tuple
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Protocol, Sequence, Tuple
 
 from Cryptodome.Hash import keccak
 
-from dharitri_sdk.core import bech32
+from dharitri_sdk.core import bech32_codec
 from dharitri_sdk.core.config import LibraryConfig
 from dharitri_sdk.core.constants import METACHAIN_ID
 from dharitri_sdk.core.errors import ErrBadAddress, ErrBadPubkeyLength
@@ -12,6 +14,7 @@ SC_HEX_PUBKEY_PREFIX = "0" * 16
 PUBKEY_LENGTH = 32
 PUBKEY_STRING_LENGTH = PUBKEY_LENGTH * 2  # hex-encoded
 BECH32_LENGTH = 62
+DEFAULT_ADDRESS_POOL_MAX_SIZE = 100_000
 
 logger = logging.getLogger("address")
 
@@ -25,7 +28,9 @@ class IAddress(Protocol):
 
 
 class Address:
-    """An Address, as an immutable object."""
+    """An Address, as an immutable object. Its bech32 representation is computed once, on first use."""
+
+    __slots__ = ("pubkey", "hrp", "_bech32")
 
     def __init__(self, pubkey: bytes, hrp: Optional[str] = None) -> None:
         """Creates an address object, given a sequence of bytes and the human readable part(hrp).
@@ -38,15 +43,39 @@ class Address:
 
         self.pubkey = bytes(pubkey)
         self.hrp = hrp if hrp else LibraryConfig.default_address_hrp
+        self._bech32: Optional[str] = None
 
     @classmethod
     def new_from_bech32(cls, value: str) -> 'Address':
         """Creates an address object from the bech32 representation of an address.
+        If `LibraryConfig.address_pool` is set, the (interned) address is taken from the pool.
 
         Args:
             value (str): the bech32 address representation"""
+        pool = LibraryConfig.address_pool
+        if pool is not None and cls is Address:
+            return pool.get_from_bech32(value)
+
+        return cls._create_from_bech32(value)
+
+    @classmethod
+    def _create_from_bech32(cls, value: str) -> 'Address':
         hrp, pubkey = _decode_bech32(value)
-        return cls(pubkey, hrp)
+        address = cls(pubkey, hrp)
+
+        # A valid (lowercase) bech32 string is the canonical representation of the address.
+        if value.islower():
+            address._bech32 = value
+
+        return address
+
+    @classmethod
+    def new_many_from_bech32(cls, values: Sequence[str]) -> List['Address']:
+        """Creates many address objects from their bech32 representations.
+
+        Args:
+            values (Sequence[str]): the bech32 address representations"""
+        return [cls.new_from_bech32(value) for value in values]
 
     @classmethod
     def from_bech32(cls, value: str) -> 'Address':
@@ -78,10 +107,9 @@ class Address:
 
     def to_bech32(self) -> str:
         """Returns the bech32 representation of the address"""
-        converted = bech32.convertbits(self.pubkey, 8, 5)
-        assert converted is not None
-        encoded = bech32.bech32_encode(self.hrp, converted)
-        return encoded
+        if self._bech32 is None:
+            self._bech32 = bech32_codec.encode(self.hrp, self.pubkey)
+        return self._bech32
 
     def bech32(self) -> str:
         """The `bech32()` method is deprecated. Please us `to_bech32()` instead"""
@@ -108,6 +136,47 @@ class Address:
         return self.get_public_key()
 
 
+class AddressPool:
+    """Interns the addresses (by their bech32 representation), so that repeated addresses (e.g. from network responses) share a single instance.
+    The least recently used addresses are evicted once the pool is full."""
+
+    def __init__(self, max_size: int = DEFAULT_ADDRESS_POOL_MAX_SIZE) -> None:
+        """
+        Args:
+            max_size (int): the maximum number of addresses held by the pool"""
+        self.max_size = max_size
+        self._addresses: "OrderedDict[str, Address]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_from_bech32(self, value: str) -> Address:
+        """Returns the (interned) address object of the bech32 representation of an address.
+
+        Args:
+            value (str): the bech32 address representation"""
+        with self._lock:
+            address = self._addresses.get(value)
+            if address is not None:
+                self._addresses.move_to_end(value)
+                return address
+
+        address = Address._create_from_bech32(value)
+
+        with self._lock:
+            address = self._addresses.setdefault(value, address)
+            while len(self._addresses) > self.max_size:
+                self._addresses.popitem(last=False)
+
+        return address
+
+    def get_size(self) -> int:
+        """Returns the number of addresses held by the pool"""
+        return len(self._addresses)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._addresses.clear()
+
+
 class AddressFactory:
     """A factory used to create address objects."""
 
@@ -175,20 +244,28 @@ class AddressComputer:
 
 
 def is_valid_bech32(value: str, expected_hrp: str) -> bool:
-    hrp, value_bytes = bech32.bech32_decode(value)
+    hrp, value_bytes = bech32_codec.decode(value)
     return hrp == expected_hrp and value_bytes is not None
 
 
+def addresses_to_bech32(addresses: Sequence[IAddress]) -> List[str]:
+    """Returns the bech32 representations of many addresses.
+
+    Args:
+        addresses (Sequence[IAddress]): the addresses"""
+    # The addresses of the library have their bech32 representation memoized.
+    return [
+        address.to_bech32() if isinstance(address, Address) else bech32_codec.encode(address.get_hrp(), address.get_public_key())
+        for address in addresses
+    ]
+
+
 def _decode_bech32(value: str) -> Tuple[str, bytes]:
-    hrp, value_bytes = bech32.bech32_decode(value)
+    hrp, value_bytes = bech32_codec.decode(value)
     if hrp is None or value_bytes is None:
         raise ErrBadAddress(value)
 
-    decoded_bytes = bech32.convertbits(value_bytes, 5, 8, False)
-    if decoded_bytes is None:
-        raise ErrBadAddress(value)
-
-    return hrp, bytes(bytearray(decoded_bytes))
+    return hrp, value_bytes
 
 
 def get_shard_of_pubkey(pubkey: bytes, number_of_shards: int) -> int:
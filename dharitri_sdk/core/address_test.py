@@ -2,7 +2,8 @@
 import pytest
 
 from dharitri_sdk.core.address import (Address, AddressComputer,
-                                       AddressFactory, is_valid_bech32)
+                                       AddressFactory, AddressPool,
+                                       addresses_to_bech32, is_valid_bech32)
 from dharitri_sdk.core.config import LibraryConfig
 from dharitri_sdk.core.errors import ErrBadAddress, ErrBadPubkeyLength
 
@@ -82,3 +83,54 @@ def test_address_with_library_config_hrp():
     address = Address(bytes.fromhex("0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1"))
     assert address.to_bech32() == "test1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ss5hqhtr"
     LibraryConfig.default_address_hrp = "drt"
+
+
+def test_bulk_conversions():
+    values = [
+        "drt1l453hd0gt5gzdp7czpuall8ggt2dcv5zwmfdf3sd3lguxseux2fsxvluwu",
+        "test1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ss5hqhtr"
+    ]
+
+    addresses = Address.new_many_from_bech32(values)
+
+    assert [address.to_hex() for address in addresses] == [
+        "fd691bb5e85d102687d81079dffce842d4dc328276d2d4c60d8fd1c3433c3293",
+        "0139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e1"
+    ]
+    assert [address.hrp for address in addresses] == ["drt", "test"]
+    assert addresses_to_bech32(addresses) == values
+
+    with pytest.raises(ErrBadAddress):
+        Address.new_many_from_bech32([values[0], "bad"])
+
+
+def test_bech32_is_memoized():
+    address = Address.new_from_hex("fd691bb5e85d102687d81079dffce842d4dc328276d2d4c60d8fd1c3433c3293", "drt")
+
+    assert address.to_bech32() is address.to_bech32()
+    assert not hasattr(address, "__dict__")
+
+    address = Address.new_from_bech32("DRT1L453HD0GT5GZDP7CZPUALL8GGT2DCV5ZWMFDF3SD3LGUXSEUX2FSXVLUWU")
+    assert address.to_bech32() == "drt1l453hd0gt5gzdp7czpuall8ggt2dcv5zwmfdf3sd3lguxseux2fsxvluwu"
+
+
+def test_address_pool():
+    alice = "drt1l453hd0gt5gzdp7czpuall8ggt2dcv5zwmfdf3sd3lguxseux2fsxvluwu"
+    bob = "test1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ss5hqhtr"
+    pool = AddressPool(max_size=1)
+
+    assert pool.get_from_bech32(alice) is pool.get_from_bech32(alice)
+    assert pool.get_from_bech32(bob).hrp == "test"
+    assert pool.get_size() == 1
+
+    LibraryConfig.address_pool = pool
+    try:
+        assert Address.new_from_bech32(bob) is Address.new_from_bech32(bob)
+        assert Address.new_many_from_bech32([bob])[0] is pool.get_from_bech32(bob)
+
+        with pytest.raises(ErrBadAddress):
+            Address.new_from_bech32("bad")
+    finally:
+        LibraryConfig.address_pool = None
+
+    assert Address.new_from_bech32(bob) is not Address.new_from_bech32(bob)
@@ -0,0 +1,143 @@
+"""
+A fast Bech32 codec, equivalent to the reference implementation (see `bech32.py`), for payloads of bytes (e.g. public keys).
+
+Instead of converting between 8-bit and 5-bit groups one value at a time, the payload is handled as a (packed) integer,
+and both the checksum and the (de)serialization work on pairs of symbols (10 bits), with precomputed tables.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from dharitri_sdk.core.bech32 import CHARSET
+
+_GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+_MASK_20_BITS = 0xfffff
+_MASK_25_BITS = 0x1ffffff
+_MAX_LENGTH = 90
+_MAX_CACHED_HRPS = 64
+
+_SYMBOL_VALUES = {char: value for value, char in enumerate(CHARSET)}
+_PAIR_SYMBOLS = [CHARSET[value >> 5] + CHARSET[value & 31] for value in range(1024)]
+_PAIR_VALUES = {pair: value for value, pair in enumerate(_PAIR_SYMBOLS)}
+_CHARSET_TO_DIGITS = str.maketrans(CHARSET, "0123456789abcdefghijklmnopqrstuv")
+
+
+def _compute_single_step_table() -> List[int]:
+    table: List[int] = []
+
+    for top in range(32):
+        value = 0
+        for i in range(5):
+            if (top >> i) & 1:
+                value ^= _GENERATOR[i]
+        table.append(value)
+
+    return table
+
+
+_SINGLE_STEP_TABLE = _compute_single_step_table()
+
+
+def _compute_double_step_table() -> List[int]:
+    # Two steps of the polymod, for the 10 top bits of the checksum, folded into a single lookup.
+    table: List[int] = []
+
+    for top in range(1024):
+        first = _SINGLE_STEP_TABLE[top >> 5]
+        second = _SINGLE_STEP_TABLE[(top & 31) ^ (first >> 25)]
+        table.append(((first & _MASK_25_BITS) << 5) ^ second)
+
+    return table
+
+
+_DOUBLE_STEP_TABLE = _compute_double_step_table()
+_HRP_STATES: Dict[str, int] = {}
+
+
+def _polymod(chk: int, pairs: List[int]) -> int:
+    """Continues the checksum over pairs of 5-bit values."""
+    table = _DOUBLE_STEP_TABLE
+    for pair in pairs:
+        chk = ((chk & _MASK_20_BITS) << 10) ^ pair ^ table[chk >> 20]
+    return chk
+
+
+def _polymod_single(chk: int, value: int) -> int:
+    return ((chk & _MASK_25_BITS) << 5) ^ value ^ _SINGLE_STEP_TABLE[chk >> 25]
+
+
+def _get_hrp_state(hrp: str) -> int:
+    state = _HRP_STATES.get(hrp)
+    if state is None:
+        state = 1
+        for value in [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]:
+            state = _polymod_single(state, value)
+
+        if len(_HRP_STATES) < _MAX_CACHED_HRPS:
+            _HRP_STATES[hrp] = state
+
+    return state
+
+
+def encode(hrp: str, data: bytes) -> str:
+    """Encodes the bytes (padded to a multiple of 5 bits) as a Bech32 string, i.e. `bech32_encode(hrp, convertbits(data, 8, 5))`."""
+    num_values = (len(data) * 8 + 4) // 5
+    packed = int.from_bytes(data, "big") << (num_values * 5 - len(data) * 8)
+    state = _get_hrp_state(hrp)
+    prefix = ""
+
+    if num_values & 1:
+        num_values -= 1
+        first = packed >> (num_values * 5)
+        state = _polymod_single(state, first)
+        prefix = CHARSET[first]
+
+    pairs = [(packed >> shift) & 1023 for shift in range(num_values * 5 - 10, -1, -10)]
+    # The 6 symbols of the checksum are computed over 6 zeros (3 pairs).
+    checksum = _polymod(_polymod(state, pairs), [0, 0, 0]) ^ 1
+    pairs.extend([checksum >> 20, (checksum >> 10) & 1023, checksum & 1023])
+
+    return hrp + "1" + prefix + "".join([_PAIR_SYMBOLS[pair] for pair in pairs])
+
+
+def decode(bech: str) -> Tuple[Optional[str], Optional[bytes]]:
+    """
+    Decodes a Bech32 string into its human-readable part and its bytes, i.e. `bech32_decode(bech)` followed by `convertbits(data, 5, 8, False)`.
+    As the reference implementation, it returns `(None, None)` if the string is not valid.
+    """
+    if len(bech) > _MAX_LENGTH or not bech.isascii() or not bech.isprintable() or " " in bech:
+        return (None, None)
+
+    lowered = bech.lower()
+    if lowered != bech and bech.upper() != bech:
+        return (None, None)
+
+    pos = lowered.rfind("1")
+    if pos < 1 or pos + 7 > len(lowered):
+        return (None, None)
+
+    hrp = lowered[:pos]
+    symbols = lowered[pos + 1:]
+    state = _get_hrp_state(hrp)
+    start = len(symbols) & 1
+
+    try:
+        if start:
+            state = _polymod_single(state, _SYMBOL_VALUES[symbols[0]])
+        pairs = [_PAIR_VALUES[symbols[i:i + 2]] for i in range(start, len(symbols), 2)]
+    except KeyError:
+        return (None, None)
+
+    if _polymod(state, pairs) != 1:
+        return (None, None)
+
+    num_data_values = len(symbols) - 6
+    num_leftover_bits = (num_data_values * 5) % 8
+    if num_leftover_bits >= 5:
+        return (None, None)
+
+    packed = int(symbols[:num_data_values].translate(_CHARSET_TO_DIGITS) or "0", 32)
+    if packed & ((1 << num_leftover_bits) - 1):
+        return (None, None)
+
+    num_bytes = num_data_values * 5 // 8
+    return (hrp, (packed >> num_leftover_bits).to_bytes(num_bytes, "big"))
@@ -0,0 +1,69 @@
+import random
+from typing import List, Optional, Tuple
+
+from dharitri_sdk.core import bech32, bech32_codec
+
+
+def reference_encode(hrp: str, data: bytes) -> str:
+    converted = bech32.convertbits(data, 8, 5)
+    assert converted is not None
+    return bech32.bech32_encode(hrp, converted)
+
+
+def reference_decode(value: str) -> Tuple[Optional[str], Optional[bytes]]:
+    hrp, data = bech32.bech32_decode(value)
+    if hrp is None or data is None:
+        return (None, None)
+
+    decoded = bech32.convertbits(data, 5, 8, False)
+    if decoded is None:
+        return (None, None)
+
+    return (hrp, bytes(decoded))
+
+
+def test_encode_and_decode():
+    pubkey = bytes.fromhex("fd691bb5e85d102687d81079dffce842d4dc328276d2d4c60d8fd1c3433c3293")
+    address = "drt1l453hd0gt5gzdp7czpuall8ggt2dcv5zwmfdf3sd3lguxseux2fsxvluwu"
+
+    assert bech32_codec.encode("drt", pubkey) == address
+    assert bech32_codec.decode(address) == ("drt", pubkey)
+    assert bech32_codec.decode(address.upper()) == ("drt", pubkey)
+    assert bech32_codec.decode("bad") == (None, None)
+
+
+def test_parity_with_reference_implementation():
+    generator = random.Random(42)
+
+    for length in range(48):
+        for hrp in ["drt", "test", "a"]:
+            data = generator.randbytes(length)
+            encoded = bech32_codec.encode(hrp, data)
+
+            assert encoded == reference_encode(hrp, data)
+            assert bech32_codec.decode(encoded) == (hrp, data)
+
+            for variant in get_corrupted_variants(generator, encoded):
+                assert bech32_codec.decode(variant) == reference_decode(variant)
+
+
+def test_parity_with_reference_implementation_on_arbitrary_groups():
+    # Valid checksums over 5-bit groups which do not necessarily convert back to bytes (e.g. non-zero padding bits).
+    generator = random.Random(7)
+
+    for num_values in range(70):
+        values = [generator.randrange(32) for _ in range(num_values)]
+        encoded = bech32.bech32_encode("drt", values)
+
+        assert bech32_codec.decode(encoded) == reference_decode(encoded)
+
+
+def get_corrupted_variants(generator: random.Random, value: str) -> List[str]:
+    variants = [value.upper(), value[:-1], value + "q", value.replace("1", "", 1), value[:3] + value[3:].capitalize()]
+
+    for _ in range(8):
+        position = generator.randrange(len(value))
+        replacement = generator.choice("qpzry9x8gf2tvdw0s3jn54khce6mua7l1bio Z~\x7f")
+        variants.append(value[:position] + replacement + value[position + 1:])
+
+    return variants
@@ -1,4 +1,8 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from dharitri_sdk.core.address import AddressPool
 
 
 @dataclass
@@ -15,3 +19,6 @@ class LibraryConfig:
 
     # The human-readable part of the bech32 addresses
     default_address_hrp: str = "drt"
+
+    # If set, the addresses created from their bech32 representation (e.g. when parsing network responses) are interned in this pool
+    address_pool: Optional["AddressPool"] = None
@@ -1,8 +1,15 @@
+from functools import lru_cache
 from typing import Protocol
 
 import dharitri_sdk.core.proto.transaction_pb2 as ProtoTransaction
 from dharitri_sdk.core.address import Address
 from dharitri_sdk.core.codec import encode_unsigned_number
+from dharitri_sdk.core.constants import INTEGER_MAX_NUM_BYTES
+
+PUBKEY_CACHE_MAX_SIZE = 4096
+VARINT_CACHE_MAX_SIZE = 1024
+MAX_UINT32 = 2**32 - 1
+MAX_UINT64 = 2**64 - 1
 
 
 class ITransaction(Protocol):
@@ -25,6 +32,12 @@ class ITransaction(Protocol):
     relayer_signature: bytes
 
 
+@lru_cache(maxsize=PUBKEY_CACHE_MAX_SIZE)
+def _get_public_key(bech32: str) -> bytes:
+    # Shared by all the serializers: transactions usually come from (and go to) a handful of addresses.
+    return Address.new_from_bech32(bech32).get_public_key()
+
+
 class ProtoSerializer:
     def __init__(self) -> None:
         pass
@@ -45,8 +58,8 @@ class ProtoSerializer:
         return buffer
 
     def convert_to_proto_message(self, transaction: ITransaction) -> ProtoTransaction.Transaction:
-        receiver_pubkey = Address.new_from_bech32(transaction.receiver).get_public_key()
-        sender_pubkey = Address.new_from_bech32(transaction.sender).get_public_key()
+        receiver_pubkey = _get_public_key(transaction.receiver)
+        sender_pubkey = _get_public_key(transaction.sender)
 
         proto_transaction = ProtoTransaction.Transaction()
         proto_transaction.Nonce = transaction.nonce
@@ -65,11 +78,96 @@ class ProtoSerializer:
 
         if transaction.guardian:
             guardian_address = transaction.guardian
-            proto_transaction.GuardAddr = Address.new_from_bech32(guardian_address).get_public_key()
+            proto_transaction.GuardAddr = _get_public_key(guardian_address)
             proto_transaction.GuardSignature = transaction.guardian_signature
 
         if transaction.relayer:
-            proto_transaction.Relayer = Address.new_from_bech32(transaction.relayer).get_public_key()
+            proto_transaction.Relayer = _get_public_key(transaction.relayer)
             proto_transaction.RelayerSignature = transaction.relayer_signature
 
         return proto_transaction
+
+
+class TransactionWireEncoder:
+    """
+    Writes the `Transaction` message (see `transaction.proto`) in the protobuf wire format directly,
+    without building a protobuf message. The output is the same as the one of `ProtoSerializer.serialize_transaction()`.
+    """
+
+    def __init__(self) -> None:
+        self._proto_serializer = ProtoSerializer()
+
+    def encode_transaction(self, transaction: ITransaction) -> bytes:
+        # As in proto3, the fields holding the default value (zero, empty) are not written.
+        # Public keys are always 32 bytes long; the length of the other fields is (most often) encoded in a single byte.
+        value = self._serialize_transaction_value(transaction.value)
+        parts = [
+            _encode_varint_field(b"\x08", transaction.nonce, MAX_UINT64),
+            _encode_bytes_field(b"\x12", value),
+            b"\x1a\x20", _get_public_key(transaction.receiver),
+            _encode_bytes_field(b"\x22", transaction.receiver_username.encode()),
+            b"\x2a\x20", _get_public_key(transaction.sender),
+            _encode_bytes_field(b"\x32", transaction.sender_username.encode()),
+            _encode_varint_field(b"\x38", transaction.gas_price, MAX_UINT64),
+            _encode_varint_field(b"\x40", transaction.gas_limit, MAX_UINT64),
+            _encode_bytes_field(b"\x4a", transaction.data),
+            _encode_bytes_field(b"\x52", transaction.chain_id.encode()),
+            _encode_varint_field(b"\x58", transaction.version, MAX_UINT32),
+            _encode_bytes_field(b"\x62", transaction.signature),
+            _encode_varint_field(b"\x68", transaction.options, MAX_UINT32)
+        ]
+
+        if transaction.guardian:
+            parts += [b"\x72\x20", _get_public_key(transaction.guardian), _encode_bytes_field(b"\x7a", transaction.guardian_signature)]
+
+        if transaction.relayer:
+            parts += [b"\x82\x01\x20", _get_public_key(transaction.relayer), _encode_bytes_field(b"\x8a\x01", transaction.relayer_signature)]
+
+        return b"".join(parts)
+
+    def _serialize_transaction_value(self, value: int) -> bytes:
+        num_bytes = (value.bit_length() + 7) // 8
+        if not value or num_bytes > INTEGER_MAX_NUM_BYTES:
+            # Zero, and the values out of range (which raise an error), as in `ProtoSerializer`.
+            return self._proto_serializer.serialize_transaction_value(value)
+
+        return b"\x00" + value.to_bytes(num_bytes, byteorder="big")
+
+
+def _encode_bytes_field(tag: bytes, value: bytes) -> bytes:
+    if not value:
+        return b""
+
+    length = len(value)
+    if length < 0x80:
+        return tag + _ONE_BYTE_VARINTS[length] + value
+    return tag + _encode_large_varint(length) + value
+
+
+def _encode_varint_field(tag: bytes, value: int, max_value: int) -> bytes:
+    if not value:
+        return b""
+    return tag + _encode_varint(value, max_value)
+
+
+def _encode_varint(value: int, max_value: int) -> bytes:
+    if 0 <= value < 0x80:
+        return _ONE_BYTE_VARINTS[value]
+    if value < 0 or value > max_value:
+        raise ValueError(f"Value out of range: {value}")
+
+    return _encode_large_varint(value)
+
+
+@lru_cache(maxsize=VARINT_CACHE_MAX_SIZE)
+def _encode_large_varint(value: int) -> bytes:
+    # Gas limits and gas prices repeat a lot, across transactions.
+    buffer = bytearray()
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+    return bytes(buffer)
+
+
+_ONE_BYTE_VARINTS = [bytes([value]) for value in range(0x80)]
@@ -1,4 +1,12 @@
-from dharitri_sdk.core.proto.transaction_serializer import ProtoSerializer
+import random
+from hashlib import blake2b
+from typing import List
+
+import pytest
+
+from dharitri_sdk.core.errors import ErrBadAddress
+from dharitri_sdk.core.proto.transaction_serializer import (
+    ProtoSerializer, TransactionWireEncoder, _get_public_key)
 from dharitri_sdk.core.transaction import Transaction
 from dharitri_sdk.core.transaction_computer import TransactionComputer
 from dharitri_sdk.testutils.wallets import load_wallets
@@ -86,3 +94,95 @@ class TestProtoSerializer:
 
         serialized_transaction = self.proto_serializer.serialize_transaction(transaction)
         assert serialized_transaction.hex() == "08cc011209000de0b6b3a76400001a200139472eff6886771a982f3083da5d421f24c29181e63888228dc81ca60d69e12205616c6963652a20b2a11555ce521e4944e09ab17549d85b487dcd26c84b5017a39e31a3670889ba32056361726f6c388094ebdc0340d08603520154580262405ac790366634a107930f4e47ef0e67b5e8f61503441bd38bc7cd12556f149b8edb43c08eedb7505e32e473f549ca598462388a11cecc917dd638968cd6178c06"
+
+    def test_public_keys_are_decoded_once(self):
+        _get_public_key.cache_clear()
+        transactions = [
+            Transaction(
+                sender=self.alice.label,
+                receiver=self.bob.label,
+                gas_limit=50000,
+                chain_id="D",
+                nonce=nonce
+            ) for nonce in range(100)
+        ]
+
+        for transaction in transactions:
+            self.transaction_computer.compute_transaction_hash(transaction)
+
+        assert _get_public_key.cache_info().misses == 2
+        assert _get_public_key.cache_info().hits == 198
+
+        transaction = transactions[-1]
+        transaction.receiver = "bad"
+        with pytest.raises(ErrBadAddress):
+            self.proto_serializer.serialize_transaction(transaction)
+
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+BOB = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+CAROL = "drt1l453hd0gt5gzdp7czpuall8ggt2dcv5zwmfdf3sd3lguxseux2fsxvluwu"
+
+
+def create_random_transactions(count: int) -> List[Transaction]:
+    generator = random.Random(42)
+    transactions: List[Transaction] = []
+
+    def random_number(max_bits: int) -> int:
+        return generator.choice([0, 1, 127, 128, 16383, 16384, 2**max_bits - 1, generator.getrandbits(max_bits)])
+
+    def random_bytes(max_length: int) -> bytes:
+        return generator.randbytes(generator.choice([0, 1, 127, 128, generator.randrange(max_length)]))
+
+    for _ in range(count):
+        transaction = Transaction(
+            sender=generator.choice([ALICE, BOB]),
+            receiver=generator.choice([BOB, CAROL]),
+            gas_limit=random_number(64),
+            chain_id=generator.choice(["D", "local-testnet", ""]),
+            nonce=random_number(64),
+            value=generator.choice([0, 1, 10**18, generator.getrandbits(200)]),
+            sender_username=generator.choice(["", "alice"]),
+            receiver_username=generator.choice(["", "bob" * 50]),
+            gas_price=random_number(64),
+            data=random_bytes(20000),
+            version=random_number(32),
+            options=random_number(32),
+            guardian=generator.choice(["", CAROL]),
+            relayer=generator.choice(["", ALICE])
+        )
+        transaction.signature = random_bytes(64)
+        transaction.guardian_signature = random_bytes(64)
+        transaction.relayer_signature = random_bytes(64)
+        transactions.append(transaction)
+
+    return transactions
+
+
+def test_parity_with_protobuf():
+    proto_serializer = ProtoSerializer()
+    encoder = TransactionWireEncoder()
+
+    for transaction in create_random_transactions(500):
+        assert encoder.encode_transaction(transaction) == proto_serializer.serialize_transaction(transaction)
+
+
+def test_out_of_range_values():
+    encoder = TransactionWireEncoder()
+
+    with pytest.raises(ValueError):
+        encoder.encode_transaction(Transaction(sender=ALICE, receiver=BOB, gas_limit=-1, chain_id="D"))
+
+    with pytest.raises(ValueError):
+        encoder.encode_transaction(Transaction(sender=ALICE, receiver=BOB, gas_limit=50000, chain_id="D", version=2**32))
+
+
+def test_compute_transaction_hashes():
+    transactions = create_random_transactions(50)
+    proto_serializer = ProtoSerializer()
+    computer = TransactionComputer()
+
+    expected = [blake2b(proto_serializer.serialize_transaction(transaction), digest_size=32).digest() for transaction in transactions]
+
+    assert computer.compute_transaction_hashes(transactions) == expected
+    assert [computer.compute_transaction_hash(transaction) for transaction in transactions] == expected
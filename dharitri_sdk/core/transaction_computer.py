@@ -1,8 +1,10 @@
 import json
 from base64 import b64encode
 from collections import OrderedDict
+from functools import lru_cache
 from hashlib import blake2b
-from typing import Any, Dict
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, List, Sequence
 
 from Cryptodome.Hash import keccak
 
@@ -12,12 +14,15 @@ from dharitri_sdk.core.constants import (
     TRANSACTION_OPTIONS_TX_GUARDED, TRANSACTION_OPTIONS_TX_HASH_SIGN)
 from dharitri_sdk.core.errors import BadUsageError, NotEnoughGasError
 from dharitri_sdk.core.interfaces import INetworkConfig, ITransaction
-from dharitri_sdk.core.proto.transaction_serializer import ProtoSerializer
+from dharitri_sdk.core.proto.transaction_serializer import \
+    TransactionWireEncoder
+
+JSON_STRING_CACHE_MAX_SIZE = 4096
 
 
 class TransactionComputer:
     def __init__(self) -> None:
-        pass
+        self._wire_encoder = TransactionWireEncoder()
 
     def compute_transaction_fee(self, transaction: ITransaction, network_config: INetworkConfig) -> int:
         move_balance_gas = network_config.min_gas_limit + len(transaction.data) * network_config.gas_per_data_byte
@@ -36,10 +41,15 @@ class TransactionComputer:
 
     def compute_bytes_for_signing(self, transaction: ITransaction) -> bytes:
         self._ensure_fields(transaction)
+        return self._serialize_for_signing(transaction)
 
-        dictionary = self._to_dictionary(transaction)
-        serialized = self._dict_to_json(dictionary)
-        return serialized
+    def compute_bytes_for_signing_many(self, transactions: Sequence[ITransaction]) -> List[bytes]:
+        """Same as `compute_bytes_for_signing()`, for many transactions. The encodings of the fields shared among them (e.g. sender, chain ID) are reused."""
+        for transaction in transactions:
+            self._ensure_fields(transaction)
+
+        serialize = self._serialize_for_signing
+        return [serialize(transaction) for transaction in transactions]
 
     def compute_bytes_for_verifying(self, transaction: ITransaction) -> bytes:
         is_signed_by_hash = self.has_options_set_for_hash_signing(transaction)
@@ -49,14 +59,26 @@ class TransactionComputer:
 
         return self.compute_bytes_for_signing(transaction)
 
+    def compute_bytes_for_verifying_many(self, transactions: Sequence[ITransaction]) -> List[bytes]:
+        """Same as `compute_bytes_for_verifying()`, for many transactions. These are also the bytes to be signed."""
+        serialized = self.compute_bytes_for_signing_many(transactions)
+
+        for i, transaction in enumerate(transactions):
+            if self.has_options_set_for_hash_signing(transaction):
+                serialized[i] = keccak.new(digest_bits=256).update(serialized[i]).digest()
+
+        return serialized
+
     def compute_hash_for_signing(self, transaction: ITransaction) -> bytes:
         return keccak.new(digest_bits=256).update(self.compute_bytes_for_signing(transaction)).digest()
 
     def compute_transaction_hash(self, transaction: ITransaction) -> bytes:
-        proto = ProtoSerializer()
-        serialized_tx = proto.serialize_transaction(transaction)
-        tx_hash = blake2b(serialized_tx, digest_size=DIGEST_SIZE).hexdigest()
-        return bytes.fromhex(tx_hash)
+        serialized_tx = self._wire_encoder.encode_transaction(transaction)
+        return blake2b(serialized_tx, digest_size=DIGEST_SIZE).digest()
+
+    def compute_transaction_hashes(self, transactions: Sequence[ITransaction]) -> List[bytes]:
+        encode_transaction = self._wire_encoder.encode_transaction
+        return [blake2b(encode_transaction(transaction), digest_size=DIGEST_SIZE).digest() for transaction in transactions]
 
     def has_options_set_for_guarded_transaction(self, transaction: ITransaction) -> bool:
         return (transaction.options & TRANSACTION_OPTIONS_TX_GUARDED) == TRANSACTION_OPTIONS_TX_GUARDED
@@ -91,6 +113,43 @@ class TransactionComputer:
             if self.has_options_set_for_guarded_transaction(transaction) or self.has_options_set_for_hash_signing(transaction):
                 raise BadUsageError(f"Non-empty transaction options requires transaction version >= {MIN_TRANSACTION_VERSION_THAT_SUPPORTS_OPTIONS}")
 
+    def _serialize_for_signing(self, transaction: ITransaction) -> bytes:
+        # Writes the JSON directly, with the same output as `_dict_to_json(_to_dictionary(transaction))`.
+        parts = [
+            b'{"nonce":', _encode_json_number(transaction.nonce),
+            b',"value":', _encode_json_string(str(transaction.value)),
+            b',"receiver":', _encode_json_string(transaction.receiver),
+            b',"sender":', _encode_json_string(transaction.sender)
+        ]
+
+        if transaction.sender_username:
+            parts += [b',"senderUsername":"', b64encode(transaction.sender_username.encode()), b'"']
+
+        if transaction.receiver_username:
+            parts += [b',"receiverUsername":"', b64encode(transaction.receiver_username.encode()), b'"']
+
+        parts += [b',"gasPrice":', _encode_json_number(transaction.gas_price), b',"gasLimit":', _encode_json_number(transaction.gas_limit)]
+
+        if transaction.data:
+            parts += [b',"data":"', b64encode(transaction.data), b'"']
+
+        parts += [b',"chainID":', _encode_json_string(transaction.chain_id)]
+
+        if transaction.version:
+            parts += [b',"version":', _encode_json_number(transaction.version)]
+
+        if transaction.options:
+            parts += [b',"options":', _encode_json_number(transaction.options)]
+
+        if transaction.guardian:
+            parts += [b',"guardian":', _encode_json_string(transaction.guardian)]
+
+        if transaction.relayer:
+            parts += [b',"relayer":', _encode_json_string(transaction.relayer)]
+
+        parts.append(b"}")
+        return b"".join(parts)
+
     def _to_dictionary(self, transaction: ITransaction, with_signature: bool = False) -> Dict[str, Any]:
         dictionary: Dict[str, Any] = OrderedDict()
         dictionary["nonce"] = transaction.nonce
@@ -134,3 +193,15 @@ class TransactionComputer:
     def _dict_to_json(self, dictionary: Dict[str, Any]) -> bytes:
         serialized = json.dumps(dictionary, separators=(',', ':')).encode("utf-8")
         return serialized
+
+
+@lru_cache(maxsize=JSON_STRING_CACHE_MAX_SIZE)
+def _encode_json_string(value: str) -> bytes:
+    # Addresses, chain IDs (and small values) repeat a lot, across transactions.
+    return encode_basestring_ascii(value).encode()
+
+
+def _encode_json_number(value: Any) -> bytes:
+    if type(value) is int:
+        return b"%d" % value
+    return json.dumps(value).encode()
@@ -1,3 +1,4 @@
+import random
 from pathlib import Path
 
 import pytest
@@ -362,3 +363,46 @@ class TestTransaction:
         )
         serialized_tx = self.transaction_computer.compute_bytes_for_signing(transaction)
         assert serialized_tx.decode() == r"""{"nonce":89,"value":"0","receiver":"drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf","sender":"drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf","gasPrice":1000000000,"gasLimit":50000,"chainID":"D","version":2,"relayer":"drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"}"""
+
+    def test_serialize_for_signing_matches_json_dumps(self):
+        generator = random.Random(42)
+        computer = TransactionComputer()
+
+        for _ in range(500):
+            transaction = Transaction(
+                sender=generator.choice([self.alice.label, self.bob.label]),
+                receiver=generator.choice(["", self.carol.label, 'a"b\\cé\U0001f600']),
+                gas_limit=generator.choice([0, 50000, 2**64 - 1]),
+                chain_id=generator.choice(["D", "", "local-testnet", "é\"\n"]),
+                nonce=generator.choice([0, 7, 2**64 - 1]),
+                value=generator.choice([0, 10**18, generator.getrandbits(200)]),
+                sender_username=generator.choice(["", "alice", "élève"]),
+                receiver_username=generator.choice(["", "bob"]),
+                gas_price=generator.choice([0, 1000000000]),
+                data=generator.randbytes(generator.choice([0, 1, 100])),
+                version=generator.choice([0, 1, 2]),
+                options=generator.choice([0, 1, 2, 3]),
+                guardian=generator.choice(["", "guardian"]),
+                relayer=generator.choice(["", "relayer"])
+            )
+
+            expected = computer._dict_to_json(computer._to_dictionary(transaction))
+            assert computer._serialize_for_signing(transaction) == expected
+
+    def test_compute_bytes_for_signing_many(self):
+        transactions = [
+            Transaction(
+                nonce=nonce,
+                sender=self.alice.label,
+                receiver=self.bob.label,
+                value=nonce * 10**18,
+                gas_limit=50000,
+                chain_id="D",
+                data=b"test" if nonce % 2 else b""
+            )
+            for nonce in range(10)
+        ]
+
+        serialized = self.transaction_computer.compute_bytes_for_signing_many(transactions)
+        assert serialized == [self.transaction_computer.compute_bytes_for_signing(tx) for tx in transactions]
+        assert self.transaction_computer.compute_bytes_for_signing_many([]) == []
@@ -1,10 +1,29 @@
 from dharitri_sdk.network_providers.api_network_provider import \
     ApiNetworkProvider
+from dharitri_sdk.network_providers.async_api_network_provider import \
+    AsyncApiNetworkProvider
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.block_driven_transaction_awaiter import \
+    BlockDrivenTransactionAwaiter
+from dharitri_sdk.network_providers.completion_detector import \
+    TransactionCompletionDetector
 from dharitri_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.hyperblock_stream import (
+    FileCheckpointStore, HyperblockStream)
+from dharitri_sdk.network_providers.immutable_data_cache import (
+    FileImmutableDataStore, ImmutableDataCache, SQLiteImmutableDataStore)
+from dharitri_sdk.network_providers.multi_endpoint_network_provider import \
+    MultiEndpointNetworkProvider
+from dharitri_sdk.network_providers.network_metadata_cache import \
+    NetworkMetadataCache
+from dharitri_sdk.network_providers.polling_schedule import (
+    FixedPollingSchedule, RoundAlignedPollingSchedule)
 from dharitri_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
 from dharitri_sdk.network_providers.resources import GenericResponse
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
 from dharitri_sdk.network_providers.transaction_awaiter import \
     TransactionAwaiter
 from dharitri_sdk.network_providers.transaction_decoder import (
@@ -13,5 +32,10 @@ from dharitri_sdk.network_providers.transaction_decoder import (
 __all__ = [
     "GenericError", "GenericResponse", "ApiNetworkProvider",
     "ProxyNetworkProvider", "TransactionAwaiter",
-    "TransactionDecoder", "TransactionMetadata", "NetworkProviderConfig"
+    "TransactionDecoder", "TransactionMetadata", "NetworkProviderConfig",
+    "AsyncProxyNetworkProvider", "AsyncApiNetworkProvider", "RetryPolicy",
+    "MultiEndpointNetworkProvider", "NetworkMetadataCache",
+    "ImmutableDataCache", "SQLiteImmutableDataStore", "FileImmutableDataStore",
+    "HyperblockStream", "FileCheckpointStore", "FixedPollingSchedule", "RoundAlignedPollingSchedule",
+    "BlockDrivenTransactionAwaiter", "TransactionCompletionDetector"
 ]
@@ -1,10 +1,14 @@
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
-import requests
 from requests.auth import AuthBase
 
 from dharitri_sdk.network_providers.accounts import (AccountOnNetwork,
                                                      GuardianData)
+from dharitri_sdk.network_providers.cached_resources import (
+    cache_api_transaction, get_cached_api_transaction)
 from dharitri_sdk.network_providers.config import (DefaultPagination,
                                                    NetworkProviderConfig)
 from dharitri_sdk.network_providers.constants import BASE_USER_AGENT
@@ -12,7 +16,9 @@ from dharitri_sdk.network_providers.contract_query_requests import \
     ContractQueryRequest
 from dharitri_sdk.network_providers.contract_query_response import \
     ContractQueryResponse
-from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.http_requests import (
+    build_pagination_params, get_api_data, perform_request)
+from dharitri_sdk.network_providers.http_session import PooledHttpSession
 from dharitri_sdk.network_providers.interface import (IAddress, IContractQuery,
                                                       IPagination)
 from dharitri_sdk.network_providers.network_config import NetworkConfig
@@ -20,8 +26,11 @@ from dharitri_sdk.network_providers.network_general_statistics import \
     NetworkGeneralStatistics
 from dharitri_sdk.network_providers.network_stake import NetworkStake
 from dharitri_sdk.network_providers.network_status import NetworkStatus
+from dharitri_sdk.network_providers.paginator import (DEFAULT_PAGE_SIZE,
+                                                      Paginator)
 from dharitri_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
+from dharitri_sdk.network_providers.single_flight import SingleFlight
 from dharitri_sdk.network_providers.token_definitions import (
     DefinitionOfFungibleTokenOnNetwork, DefinitionOfTokenCollectionOnNetwork)
 from dharitri_sdk.network_providers.tokens import (
@@ -30,6 +39,8 @@ from dharitri_sdk.network_providers.transaction_status import TransactionStatus
 from dharitri_sdk.network_providers.transactions import (
     ITransaction, TransactionInMempool, TransactionOnNetwork,
     transaction_to_dictionary)
+from dharitri_sdk.network_providers.transactions_batch_sender import \
+    TransactionsBatchSender
 from dharitri_sdk.network_providers.user_agent import extend_user_agent
 from dharitri_sdk.network_providers.utils import decimal_to_padded_hex
 
@@ -43,18 +54,49 @@ class ApiNetworkProvider:
             config: Optional[NetworkProviderConfig] = None
     ) -> None:
         self.url = url
-        self.backing_proxy = ProxyNetworkProvider(url, auth, address_hrp)
         self.auth = auth
-
         self.config = config if config is not None else NetworkProviderConfig()
 
+        # The backing proxy shares the options (e.g. timeouts, retries, caches) of this provider, but has its own User-Agent.
+        self.backing_proxy = ProxyNetworkProvider(url, auth, address_hrp, self.config.copy())
+
         self.user_agent_prefix = f"{BASE_USER_AGENT}/api"
         extend_user_agent(self.user_agent_prefix, self.config)
 
+        self.session = PooledHttpSession(self.config)
+        self._single_flight: Optional[SingleFlight[Any]] = SingleFlight() if self.config.coalesce_requests else None
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._transactions_sender = TransactionsBatchSender(self.backing_proxy.do_post_generic, self.config, self._get_executor)
+
+    def close(self) -> None:
+        """Stops the worker pool (if any) and releases the pooled HTTP connections (including the ones of the backing proxy)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        self.session.close()
+        self.backing_proxy.close()
+
+    def __enter__(self) -> "ApiNetworkProvider":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def get_network_config(self) -> NetworkConfig:
+        # Served from the network metadata cache (if any) by the backing proxy.
         return self.backing_proxy.get_network_config()
 
     def get_network_gas_configs(self) -> Dict[str, Any]:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return cache.get_network_gas_configs(f"{self.url}/network/gas-configs", self._fetch_network_gas_configs)
+        return self._fetch_network_gas_configs()
+
+    def _fetch_network_gas_configs(self) -> Dict[str, Any]:
         response = self.do_get_generic("network/gas-configs")
         return response["data"]
 
@@ -80,17 +122,25 @@ class ApiNetworkProvider:
         return account
 
     def get_fungible_tokens_of_account(self, address: IAddress, pagination: IPagination = DefaultPagination()) -> List[FungibleTokenOfAccountOnNetwork]:
-        url = f'accounts/{address.to_bech32()}/tokens?{self._build_pagination_params(pagination)}'
+        url = f'accounts/{address.to_bech32()}/tokens?{build_pagination_params(pagination)}'
         response = self.do_get_generic_collection(url)
         result = map(FungibleTokenOfAccountOnNetwork.from_http_response, response)
         return list(result)
 
     def get_nonfungible_tokens_of_account(self, address: IAddress, pagination: IPagination = DefaultPagination()) -> List[NonFungibleTokenOfAccountOnNetwork]:
-        url = f'accounts/{address.to_bech32()}/nfts?{self._build_pagination_params(pagination)}'
+        url = f'accounts/{address.to_bech32()}/nfts?{build_pagination_params(pagination)}'
         response = self.do_get_generic_collection(url)
         result = map(NonFungibleTokenOfAccountOnNetwork.from_api_http_response, response)
         return list(result)
 
+    def iter_fungible_tokens_of_account(self, address: IAddress, page_size: int = DEFAULT_PAGE_SIZE, limit: Optional[int] = None) -> Paginator[FungibleTokenOfAccountOnNetwork]:
+        """Lazily walks all the fungible tokens of the account (see `Paginator`)."""
+        return Paginator(lambda pagination: self.get_fungible_tokens_of_account(address, pagination), self._get_executor(), page_size, limit)
+
+    def iter_nonfungible_tokens_of_account(self, address: IAddress, page_size: int = DEFAULT_PAGE_SIZE, limit: Optional[int] = None) -> Paginator[NonFungibleTokenOfAccountOnNetwork]:
+        """Lazily walks all the non-fungible tokens of the account (see `Paginator`)."""
+        return Paginator(lambda pagination: self.get_nonfungible_tokens_of_account(address, pagination), self._get_executor(), page_size, limit)
+
     def get_fungible_token_of_account(self, address: IAddress, token_identifier: str) -> FungibleTokenOfAccountOnNetwork:
         url = f'accounts/{address.to_bech32()}/tokens/{token_identifier}'
         response = self.do_get_generic(url)
@@ -122,20 +172,37 @@ class ApiNetworkProvider:
 
     def query_contract(self, query: IContractQuery) -> ContractQueryResponse:
         request = ContractQueryRequest(query).to_http_request()
-        response = self.do_post_generic('query', request)
+
+        if self._single_flight is not None:
+            key = f"POST {self.url}/query {json.dumps(request, sort_keys=True)}"
+            response = self._single_flight.do(key, lambda: self.do_post_generic('query', request))
+        else:
+            response = self.do_post_generic('query', request)
+
         return ContractQueryResponse.from_http_response(response)
 
     def get_transaction(self, tx_hash: str) -> TransactionOnNetwork:
+        cached = get_cached_api_transaction(self.config.immutable_data_cache, self.url, tx_hash)
+        if cached is not None:
+            return cached
+
         response = self.do_get_generic(f'transactions/{tx_hash}')
         transaction = TransactionOnNetwork.from_api_http_response(tx_hash, response)
+        cache_api_transaction(self.config.immutable_data_cache, self.url, tx_hash, response, transaction)
+
         return transaction
 
     def get_account_transactions(self, address: IAddress, pagination: IPagination = DefaultPagination()) -> List[TransactionOnNetwork]:
-        url = f"accounts/{address.to_bech32()}/transactions?{self._build_pagination_params(pagination)}"
+        url = f"accounts/{address.to_bech32()}/transactions?{build_pagination_params(pagination)}"
         response = self.do_get_generic_collection(url)
         transactions = [TransactionOnNetwork.from_api_http_response(tx.get("txHash", ""), tx) for tx in response]
         return transactions
 
+    def iter_account_transactions(self, address: IAddress, page_size: int = DEFAULT_PAGE_SIZE, limit: Optional[int] = None) -> Paginator[TransactionOnNetwork]:
+        """Lazily walks the transactions of the account, most recent first (see `Paginator`). Past the result window of the API, the walk continues by timestamp."""
+        return Paginator(lambda pagination: self.get_account_transactions(address, pagination), self._get_executor(), page_size, limit,
+                         get_cursor=lambda transaction: transaction.timestamp)
+
     def get_bunch_of_transactions(self, tx_hashes: List[str], with_block_info: bool = True, with_results: bool = True) -> List[TransactionOnNetwork]:
         hashes = ",".join(tx_hashes)
         url = f"transactions?hashes={hashes}"
@@ -173,12 +240,18 @@ class ApiNetworkProvider:
         tx_hash: str = response.get('txHash', '')
         return tx_hash
 
-    def send_transactions(self, transactions: List[ITransaction]) -> Tuple[int, Dict[str, str]]:
-        response = self.backing_proxy.send_transactions(transactions)
-        return response
+    def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        """
+        Sends the transactions in chunks (see `NetworkProviderConfig`); the hashes are keyed by the index of each transaction within the input.
+        Raises `TransactionsNotSentError` (holding the indices of the transactions not sent) if some of the chunks could not be sent.
+        """
+        return self._transactions_sender.send(transactions)
 
-    def _build_pagination_params(self, pagination: IPagination) -> str:
-        return f'from={pagination.get_start()}&size={pagination.get_size()}'
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="api")
+            return self._executor
 
     def do_get_generic(self, resource_url: str) -> Dict[str, Any]:
         url = f'{self.url}/{resource_url}'
@@ -196,46 +269,13 @@ class ApiNetworkProvider:
         return response
 
     def __do_get(self, url: str) -> Any:
-        try:
-            response = requests.get(url, auth=self.auth, **self.config.requests_options)
-            response.raise_for_status()
-            parsed = response.json()
-            return self._get_data(parsed, url)
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
-        except requests.ConnectionError as err:
-            raise GenericError(url, err)
-        except Exception as err:
-            raise GenericError(url, err)
+        if self._single_flight is not None:
+            return self._single_flight.do(f"GET {url}", lambda: self.__do_get_uncoalesced(url))
+        return self.__do_get_uncoalesced(url)
+
+    def __do_get_uncoalesced(self, url: str) -> Any:
+        return perform_request(self.session, "GET", url, get_api_data, self.auth, self.config.requests_options)
 
     def do_post(self, url: str, payload: Any) -> Dict[str, Any]:
-        try:
-            response = requests.post(url, json=payload, auth=self.auth, **self.config.requests_options)
-            response.raise_for_status()
-            parsed = response.json()
-            return cast(Dict[str, Any], self._get_data(parsed, url))
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
-        except requests.ConnectionError as err:
-            raise GenericError(url, err)
-        except Exception as err:
-            raise GenericError(url, err)
-
-    def _get_data(self, parsed: Any, url: str) -> Any:
-        if isinstance(parsed, List):
-            return cast(Any, parsed)
-        else:
-            err = parsed.get("error", None)
-            if err:
-                code = parsed.get("statusCode")
-                raise GenericError(url, f"code:{code}, error: {err}")
-            else:
-                return parsed
-
-    def _extract_error_from_response(self, response: Any):
-        try:
-            return response.json()
-        except Exception:
-            return response.text
+        response = perform_request(self.session, "POST", url, get_api_data, self.auth, self.config.requests_options, payload)
+        return cast(Dict[str, Any], response)
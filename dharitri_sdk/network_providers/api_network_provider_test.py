@@ -11,6 +11,9 @@ from dharitri_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_sdk.network_providers.errors import GenericError
 from dharitri_sdk.network_providers.interface import IPagination
 from dharitri_sdk.network_providers.proxy_network_provider import ContractQuery
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
 
 
 class Pagination(IPagination):
@@ -224,3 +227,24 @@ class TestApi:
         response = requests.get(api.url + "/network/config", **api.config.requests_options)
         headers = response.request.headers
         assert headers.get("User-Agent") == "dharitri-sdk-py/api/test-client"
+
+
+def test_backing_proxy_uses_the_given_config():
+    with MockHttpServer() as server:
+        status = {"data": {"status": {"drt_current_round": 42, "drt_nonce": 41}}, "code": "successful"}
+        responses = [MockHttpResponse(status=503), MockHttpResponse(status)]
+        server.mock_route("GET", "/network/status/4294967295", lambda request: responses.pop(0))
+
+        config = NetworkProviderConfig(
+            client_name="test",
+            requests_options={"timeout": 5, "headers": {"X-Custom": "foo"}},
+            retry_policy=RetryPolicy(backoff_base_in_seconds=0.01)
+        )
+
+        with ApiNetworkProvider(server.url, config=config) as api:
+            assert api.get_network_status().current_round == 42
+
+        assert len(server.requests) == 2
+        assert server.requests[-1].headers["X-Custom"] == "foo"
+        assert server.requests[-1].headers["User-Agent"] == "dharitri-sdk-py/proxy/test"
+        assert api.config.requests_options["headers"]["User-Agent"] == "dharitri-sdk-py/api/test"
@@ -0,0 +1,258 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, Awaitable, Callable, Dict, List, Optional, Sequence,
+                    Tuple, TypeVar, Union)
+
+from requests.auth import AuthBase
+
+from dharitri_sdk.network_providers.accounts import (AccountOnNetwork,
+                                                     GuardianData)
+from dharitri_sdk.network_providers.async_http_session import AsyncHttpSession
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.cached_resources import (
+    cache_api_transaction, get_cached_api_transaction)
+from dharitri_sdk.network_providers.config import (DefaultPagination,
+                                                   NetworkProviderConfig)
+from dharitri_sdk.network_providers.constants import BASE_USER_AGENT
+from dharitri_sdk.network_providers.contract_query_requests import \
+    ContractQueryRequest
+from dharitri_sdk.network_providers.contract_query_response import \
+    ContractQueryResponse
+from dharitri_sdk.network_providers.http_requests import (
+    build_pagination_params, get_api_data, perform_request)
+from dharitri_sdk.network_providers.http_session import PooledHttpSession
+from dharitri_sdk.network_providers.interface import (IAddress, IContractQuery,
+                                                      IPagination)
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.network_general_statistics import \
+    NetworkGeneralStatistics
+from dharitri_sdk.network_providers.network_stake import NetworkStake
+from dharitri_sdk.network_providers.network_status import NetworkStatus
+from dharitri_sdk.network_providers.single_flight import AsyncSingleFlight
+from dharitri_sdk.network_providers.token_definitions import (
+    DefinitionOfFungibleTokenOnNetwork, DefinitionOfTokenCollectionOnNetwork)
+from dharitri_sdk.network_providers.tokens import (
+    FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork)
+from dharitri_sdk.network_providers.transaction_status import TransactionStatus
+from dharitri_sdk.network_providers.transactions import (
+    ITransaction, TransactionInMempool, TransactionOnNetwork,
+    transaction_to_dictionary)
+from dharitri_sdk.network_providers.user_agent import extend_user_agent
+from dharitri_sdk.network_providers.utils import decimal_to_padded_hex
+
+T = TypeVar("T")
+
+
+class AsyncApiNetworkProvider:
+    """
+    The asyncio counterpart of `ApiNetworkProvider`.
+
+    As for `AsyncProxyNetworkProvider`, the HTTP calls are performed natively on the event loop if `aiohttp` is installed (see `AsyncHttpSession`),
+    otherwise they go through a (sync) pooled HTTP session, on a pool of (at most `NetworkProviderConfig.max_workers`) I/O threads.
+
+    Use the provider as an async context manager (or `await aclose()`), so that the connections are released on the event loop.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            auth: Union[AuthBase, None] = None,
+            address_hrp: Optional[str] = None,
+            config: Optional[NetworkProviderConfig] = None
+    ) -> None:
+        self.url = url
+        self.auth = auth
+        self.config = config if config is not None else NetworkProviderConfig()
+
+        # The backing proxy shares the options (e.g. timeouts, retries, caches) of this provider, but has its own User-Agent.
+        self.backing_proxy = AsyncProxyNetworkProvider(url, auth, address_hrp, self.config.copy())
+
+        self.user_agent_prefix = f"{BASE_USER_AGENT}/api"
+        extend_user_agent(self.user_agent_prefix, self.config)
+
+        self.http: Optional[AsyncHttpSession] = AsyncHttpSession(self.config, auth) if AsyncHttpSession.is_supported(self.config, auth) else None
+        # Only used if the requests cannot be performed natively (see above).
+        self.session: Optional[PooledHttpSession] = None
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._single_flight: Optional[AsyncSingleFlight[Any]] = AsyncSingleFlight() if self.config.coalesce_requests else None
+
+    async def get_network_config(self) -> NetworkConfig:
+        return await self.backing_proxy.get_network_config()
+
+    async def get_network_gas_configs(self) -> Dict[str, Any]:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return await cache.get_network_gas_configs_async(f"{self.url}/network/gas-configs", self._fetch_network_gas_configs)
+        return await self._fetch_network_gas_configs()
+
+    async def _fetch_network_gas_configs(self) -> Dict[str, Any]:
+        response = await self.do_get_generic("network/gas-configs")
+        return response["data"]
+
+    async def get_network_status(self) -> NetworkStatus:
+        return await self.backing_proxy.get_network_status()
+
+    async def get_guardian_data(self, address: IAddress) -> GuardianData:
+        return await self.backing_proxy.get_guardian_data(address)
+
+    async def get_network_stake_statistics(self) -> NetworkStake:
+        response = await self.do_get_generic('stake')
+        return NetworkStake.from_http_response(response)
+
+    async def get_network_general_statistics(self) -> NetworkGeneralStatistics:
+        response = await self.do_get_generic('stats')
+        return NetworkGeneralStatistics.from_http_response(response)
+
+    async def get_account(self, address: IAddress) -> AccountOnNetwork:
+        response = await self.do_get_generic(f'accounts/{address.to_bech32()}')
+        return AccountOnNetwork.from_http_response(response)
+
+    async def get_fungible_tokens_of_account(self, address: IAddress, pagination: IPagination = DefaultPagination()) -> List[FungibleTokenOfAccountOnNetwork]:
+        url = f'accounts/{address.to_bech32()}/tokens?{build_pagination_params(pagination)}'
+        response = await self.do_get_generic_collection(url)
+        return [FungibleTokenOfAccountOnNetwork.from_http_response(item) for item in response]
+
+    async def get_nonfungible_tokens_of_account(self, address: IAddress, pagination: IPagination = DefaultPagination()) -> List[NonFungibleTokenOfAccountOnNetwork]:
+        url = f'accounts/{address.to_bech32()}/nfts?{build_pagination_params(pagination)}'
+        response = await self.do_get_generic_collection(url)
+        return [NonFungibleTokenOfAccountOnNetwork.from_api_http_response(item) for item in response]
+
+    async def get_fungible_token_of_account(self, address: IAddress, token_identifier: str) -> FungibleTokenOfAccountOnNetwork:
+        response = await self.do_get_generic(f'accounts/{address.to_bech32()}/tokens/{token_identifier}')
+        return FungibleTokenOfAccountOnNetwork.from_http_response(response)
+
+    async def get_nonfungible_token_of_account(self, address: IAddress, collection: str, nonce: int) -> NonFungibleTokenOfAccountOnNetwork:
+        nonce_as_hex = decimal_to_padded_hex(nonce)
+        response = await self.do_get_generic(f'accounts/{address.to_bech32()}/nfts/{collection}-{nonce_as_hex}')
+        return NonFungibleTokenOfAccountOnNetwork.from_api_http_response(response)
+
+    async def get_definition_of_fungible_token(self, token_identifier: str) -> DefinitionOfFungibleTokenOnNetwork:
+        response = await self.do_get_generic(f'tokens/{token_identifier}')
+        return DefinitionOfFungibleTokenOnNetwork.from_api_http_response(response)
+
+    async def get_definition_of_token_collection(self, collection: str) -> DefinitionOfTokenCollectionOnNetwork:
+        response = await self.do_get_generic(f'collections/{collection}')
+        return DefinitionOfTokenCollectionOnNetwork.from_api_http_response(response)
+
+    async def get_non_fungible_token(self, collection: str, nonce: int) -> NonFungibleTokenOfAccountOnNetwork:
+        nonce_as_hex = decimal_to_padded_hex(nonce)
+        response = await self.do_get_generic(f'nfts/{collection}-{nonce_as_hex}')
+        return NonFungibleTokenOfAccountOnNetwork.from_api_http_response(response)
+
+    async def query_contract(self, query: IContractQuery) -> ContractQueryResponse:
+        request = ContractQueryRequest(query).to_http_request()
+        response = await self.do_post_generic('query', request)
+        return ContractQueryResponse.from_http_response(response)
+
+    async def get_transaction(self, tx_hash: str) -> TransactionOnNetwork:
+        cached = get_cached_api_transaction(self.config.immutable_data_cache, self.url, tx_hash)
+        if cached is not None:
+            return cached
+
+        response = await self.do_get_generic(f'transactions/{tx_hash}')
+        transaction = TransactionOnNetwork.from_api_http_response(tx_hash, response)
+        cache_api_transaction(self.config.immutable_data_cache, self.url, tx_hash, response, transaction)
+
+        return transaction
+
+    async def get_account_transactions(self, address: IAddress, pagination: IPagination = DefaultPagination()) -> List[TransactionOnNetwork]:
+        url = f"accounts/{address.to_bech32()}/transactions?{build_pagination_params(pagination)}"
+        response = await self.do_get_generic_collection(url)
+        return [TransactionOnNetwork.from_api_http_response(tx.get("txHash", ""), tx) for tx in response]
+
+    async def get_bunch_of_transactions(self, tx_hashes: List[str], with_block_info: bool = True, with_results: bool = True) -> List[TransactionOnNetwork]:
+        hashes = ",".join(tx_hashes)
+        url = f"transactions?hashes={hashes}"
+
+        if with_block_info:
+            url += "&withBlockInfo=true"
+
+        if with_results:
+            url += "&withResults=true"
+
+        result = await self.do_get_generic_collection(url)
+        return [TransactionOnNetwork.from_api_http_response(transaction["txHash"], transaction) for transaction in result]
+
+    async def get_transactions_in_mempool_for_account(self, address: IAddress) -> List[TransactionInMempool]:
+        url = f"transaction/pool?by-sender={address.to_bech32()}&fields=sender,receiver,gaslimit,gasprice,value,nonce,data"
+        response = await self.do_get_generic(url)
+        tx_pool = response["data"]["txPool"]
+        mempool_transactions = tx_pool.get("transactions", [])
+        return [TransactionInMempool.from_http_response(transaction) for transaction in mempool_transactions]
+
+    async def get_transaction_status(self, tx_hash: str) -> TransactionStatus:
+        response = await self.do_get_generic(f'transactions/{tx_hash}?fields=status')
+        return TransactionStatus(response.get('status', ''))
+
+    async def send_transaction(self, transaction: ITransaction) -> str:
+        response = await self.do_post_generic('transactions', transaction_to_dictionary(transaction))
+        tx_hash: str = response.get('txHash', '')
+        return tx_hash
+
+    async def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        return await self.backing_proxy.send_transactions(transactions)
+
+    async def do_get_generic(self, resource_url: str) -> Dict[str, Any]:
+        if self._single_flight is not None:
+            return await self._single_flight.do(resource_url, lambda: self._do_get(resource_url))
+        return await self._do_get(resource_url)
+
+    async def do_get_generic_collection(self, resource_url: str) -> List[Dict[str, Any]]:
+        return await self._do_get(resource_url)
+
+    async def _do_get(self, resource_url: str) -> Any:
+        url = f'{self.url}/{resource_url}'
+
+        if self.http is None:
+            return await self._run(perform_request, self._get_session(), "GET", url, get_api_data, self.auth, self.config.requests_options)
+
+        parsed = await self.http.get_json(url)
+        return get_api_data(parsed, url)
+
+    async def do_post_generic(self, resource_url: str, payload: Any) -> Dict[str, Any]:
+        url = f'{self.url}/{resource_url}'
+
+        if self.http is None:
+            return await self._run(perform_request, self._get_session(), "POST", url, get_api_data, self.auth, self.config.requests_options, payload)
+
+        parsed = await self.http.post_json(url, payload)
+        return get_api_data(parsed, url)
+
+    async def aclose(self) -> None:
+        """Releases the connections (on the event loop), then stops the I/O workers (if any)."""
+        if self.http is not None:
+            await self.http.aclose()
+        await self.backing_proxy.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Stops the I/O workers (if any) and releases the pooled HTTP connections."""
+        if self.http is not None:
+            self.http.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self.session is not None:
+            self.session.close()
+        self.backing_proxy.close()
+
+    async def __aenter__(self) -> "AsyncApiNetworkProvider":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _get_session(self) -> PooledHttpSession:
+        if self.session is None:
+            self.session = PooledHttpSession(self.config)
+        return self.session
+
+    def _run(self, function: Callable[..., T], *args: Any) -> Awaitable[T]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="async-api")
+
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, functools.partial(function, *args))
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from requests.auth import AuthBase
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.network_providers.async_api_network_provider import \
+    AsyncApiNetworkProvider
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+BOB = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+
+
+class TestAsyncApi:
+    def test_get_account_and_bunch_of_transactions(self):
+        with MockHttpServer() as server:
+            server.mock_route("GET", f"/accounts/{ALICE}", MockHttpResponse({"address": ALICE, "nonce": 7, "balance": "1000"}))
+            server.mock_route("GET", "/transactions", MockHttpResponse([
+                {"txHash": "aa", "nonce": 1, "sender": ALICE, "receiver": BOB, "status": "success"},
+                {"txHash": "bb", "nonce": 2, "sender": ALICE, "receiver": BOB, "status": "pending"}
+            ]))
+
+            async def run():
+                async with AsyncApiNetworkProvider(server.url) as api:
+                    return await asyncio.gather(
+                        api.get_account(Address.new_from_bech32(ALICE)),
+                        api.get_bunch_of_transactions(["aa", "bb"])
+                    )
+
+            account, transactions = asyncio.run(run())
+
+            assert account.nonce == 7
+            assert [tx.hash for tx in transactions] == ["aa", "bb"]
+            assert transactions[0].is_completed
+            assert not transactions[1].is_completed
+
+    def test_get_network_config_through_backing_proxy(self):
+        with MockHttpServer() as server:
+            server.mock_route("GET", "/network/config", MockHttpResponse({"data": {"config": {"drt_chain_id": "D", "drt_round_duration": 6000}}, "code": "successful"}))
+
+            async def run():
+                async with AsyncApiNetworkProvider(server.url) as api:
+                    return await api.get_network_config()
+
+            config = asyncio.run(run())
+
+            assert config.chain_id == "D"
+            assert config.round_duration == 6000
+
+    def test_backing_proxy_uses_the_given_config(self):
+        with MockHttpServer() as server:
+            server.mock_route("GET", "/network/status/4294967295", MockHttpResponse({"data": {"status": {"drt_current_round": 42}}, "code": "successful"}))
+            config = NetworkProviderConfig(client_name="test", requests_options={"headers": {"X-Custom": "yes"}}, retry_policy=RetryPolicy())
+
+            async def run():
+                async with AsyncApiNetworkProvider(server.url, config=config) as api:
+                    assert api.backing_proxy.config.retry_policy is config.retry_policy
+                    return await api.get_network_status()
+
+            assert asyncio.run(run()).current_round == 42
+            assert server.requests[0].headers["X-Custom"] == "yes"
+            assert server.requests[0].headers["User-Agent"] == "dharitri-sdk-py/proxy/test"
+
+    def test_falls_back_to_threads_for_custom_auth(self):
+        class CustomAuth(AuthBase):
+            def __call__(self, request):
+                request.headers["X-Token"] = "secret"
+                return request
+
+        with MockHttpServer() as server:
+            server.mock_route("GET", f"/accounts/{ALICE}", MockHttpResponse({"address": ALICE, "nonce": 7, "balance": "1000"}))
+            server.mock_route("GET", "/missing", MockHttpResponse({"statusCode": 404, "error": "not found"}))
+
+            async def run():
+                async with AsyncApiNetworkProvider(server.url, auth=CustomAuth(), config=NetworkProviderConfig(client_name="test")) as api:
+                    assert api.http is None
+                    account = await api.get_account(Address.new_from_bech32(ALICE))
+
+                    with pytest.raises(GenericError, match="not found"):
+                        await api.do_get_generic("missing")
+
+                    return account
+
+            assert asyncio.run(run()).nonce == 7
+            assert server.requests[0].headers["X-Token"] == "secret"
+            assert server.requests[0].headers["User-Agent"] == "dharitri-sdk-py/api/test"
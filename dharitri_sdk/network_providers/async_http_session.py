@@ -0,0 +1,232 @@
+import asyncio
+import json
+from types import ModuleType
+from typing import (TYPE_CHECKING, Any, AsyncGenerator, Dict, Optional, Tuple,
+                    Union)
+
+from requests.auth import AuthBase, HTTPBasicAuth
+
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_aiohttp: Optional[ModuleType]
+
+try:
+    import aiohttp as _aiohttp
+except ImportError:  # pragma: no cover
+    _aiohttp = None
+
+SUPPORTED_REQUESTS_OPTIONS = ("timeout", "headers", "verify")
+
+
+def _is_aiohttp_available() -> bool:
+    return _aiohttp is not None
+
+
+def _require_aiohttp() -> ModuleType:
+    """Returns the `aiohttp` module, or raises if it is not installed."""
+    if _aiohttp is None:
+        raise ImportError("AsyncHttpSession requires 'aiohttp' (pip install dharitri-sdk[async])")
+    return _aiohttp
+
+
+class AsyncHttpSession:
+    """
+    A keep-alive HTTP session for the asyncio providers, based on `aiohttp` (an optional dependency: `pip install dharitri-sdk[async]`).
+    Requests are multiplexed on the event loop (no thread per request), so that hundreds of them can be in flight at once
+    (up to `NetworkProviderConfig.async_max_connections`). If the config holds a `RetryPolicy`, failed requests are retried according to it.
+
+    The session is bound to the event loop that makes the first request; if used from another loop (e.g. a second `asyncio.run()`), it is re-created.
+    """
+
+    def __init__(self, config: NetworkProviderConfig, auth: Union[AuthBase, None] = None) -> None:
+        aiohttp_module = _require_aiohttp()
+
+        self.max_connections = config.async_max_connections
+        self.idle_timeout_in_seconds = config.pool_idle_timeout_in_seconds
+        self.retry_policy = config.retry_policy
+        self.headers: Dict[str, str] = dict(config.requests_options.get("headers", {}))
+        self.verify_ssl = bool(config.requests_options.get("verify", True))
+        self.timeout = _to_client_timeout(config.requests_options.get("timeout"))
+        self.auth: Optional["aiohttp.BasicAuth"] = None
+        if isinstance(auth, HTTPBasicAuth):
+            self.auth = aiohttp_module.BasicAuth(_to_str(auth.username), _to_str(auth.password))
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_owner: Optional[AsyncGenerator["aiohttp.ClientSession", None]] = None
+        self._closing: Optional["asyncio.Task[None]"] = None
+
+    @staticmethod
+    def is_supported(config: NetworkProviderConfig, auth: Union[AuthBase, None] = None) -> bool:
+        """Tells whether the requests of a provider (given its config and auth) can be performed by this session."""
+        if not _is_aiohttp_available():
+            return False
+        if auth is not None and not isinstance(auth, HTTPBasicAuth):
+            return False
+        return all(option in SUPPORTED_REQUESTS_OPTIONS for option in config.requests_options)
+
+    async def get_json(self, url: str) -> Any:
+        return await self.request_json("GET", url)
+
+    async def post_json(self, url: str, payload: Any) -> Any:
+        return await self.request_json("POST", url, payload)
+
+    async def request_json(self, method: str, url: str, payload: Any = None) -> Any:
+        """Performs the request and parses its (JSON) response. Errors (including HTTP errors) are raised as `GenericError`."""
+        try:
+            if self.retry_policy is None:
+                status, body = await self._request_once(method, url, payload)
+            else:
+                status, body = await self._request_with_retries(self.retry_policy, method, url, payload)
+        except Exception as err:
+            raise GenericError(url, err)
+
+        if status >= 400:
+            raise GenericError(url, _extract_error(body))
+
+        try:
+            return json.loads(body)
+        except Exception as err:
+            raise GenericError(url, err)
+
+    async def _request_with_retries(self, policy: RetryPolicy, method: str, url: str, payload: Any) -> Tuple[int, bytes]:
+        max_retries = policy.get_max_retries(method, url)
+        circuit_breaker = policy.get_circuit_breaker(url)
+        attempt = 0
+
+        while True:
+            circuit_breaker.before_request()
+
+            try:
+                status, body, retry_after_header = await self._request_once_with_headers(method, url, payload)
+            except Exception as err:
+                circuit_breaker.record_failure()
+                if attempt >= max_retries or not isinstance(err, (_require_aiohttp().ClientConnectionError, asyncio.TimeoutError)):
+                    raise
+                delay = policy.get_backoff_delay(attempt)
+            except BaseException:
+                # E.g. the cancellation of the task, which says nothing about the health of the endpoint.
+                circuit_breaker.release_trial()
+                raise
+            else:
+                if policy.is_failure_status(status):
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+
+                if attempt >= max_retries or not policy.is_retriable_status(status):
+                    return status, body
+
+                retry_after = policy.get_retry_after_delay(retry_after_header)
+                if retry_after is not None and retry_after > policy.max_retry_after_in_seconds:
+                    return status, body
+
+                delay = policy.get_backoff_delay(attempt) if retry_after is None else retry_after
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _request_once(self, method: str, url: str, payload: Any) -> Tuple[int, bytes]:
+        status, body, _ = await self._request_once_with_headers(method, url, payload)
+        return status, body
+
+    async def _request_once_with_headers(self, method: str, url: str, payload: Any) -> Tuple[int, bytes, Optional[str]]:
+        session = await self._acquire_session()
+        kwargs: Dict[str, Any] = {"auth": self.auth}
+        if method == "POST":
+            kwargs["json"] = payload
+
+        async with session.request(method, url, **kwargs) as response:
+            body = await response.read()
+            return response.status, body, response.headers.get("Retry-After")
+
+    async def _acquire_session(self) -> "aiohttp.ClientSession":
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._loop is not loop or self._session.closed:
+            self._release_session()
+            owner = self._own_session()
+            self._session_owner = owner
+            self._session = await owner.__anext__()
+            self._loop = loop
+
+        return self._session
+
+    async def _own_session(self) -> AsyncGenerator["aiohttp.ClientSession", None]:
+        # The session is held by an async generator, so that the event loop closes it on shutdown (see `loop.shutdown_asyncgens()`, called by `asyncio.run()`),
+        # even if the provider is not closed before the loop ends.
+        aiohttp_module = _require_aiohttp()
+        connector = aiohttp_module.TCPConnector(limit=self.max_connections, keepalive_timeout=self.idle_timeout_in_seconds, ssl=True if self.verify_ssl else False)
+        session = aiohttp_module.ClientSession(connector=connector, headers=self.headers, timeout=self.timeout)
+
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    async def aclose(self) -> None:
+        """Closes the pooled connections. The session remains usable; new connections are opened on demand."""
+        owner, loop = self._session_owner, self._loop
+        self._session, self._session_owner = None, None
+
+        if owner is not None and _is_current_loop(loop):
+            await owner.aclose()
+        elif owner is not None:
+            self._close_owner(owner, loop)
+
+    def close(self) -> None:
+        """Same as `aclose()`, callable outside of the event loop (if the loop is still running, the closing is scheduled on it)."""
+        self._release_session()
+
+    def _release_session(self) -> None:
+        owner, loop = self._session_owner, self._loop
+        self._session, self._session_owner = None, None
+
+        if owner is not None:
+            self._close_owner(owner, loop)
+
+    def _close_owner(self, owner: AsyncGenerator[Any, None], loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        # If the loop is closed, the session has already been closed by it.
+        if loop is None or loop.is_closed():
+            return
+
+        if not loop.is_running():
+            loop.run_until_complete(owner.aclose())
+        elif _is_current_loop(loop):
+            self._closing = loop.create_task(owner.aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(owner.aclose(), loop)
+
+
+def _is_current_loop(loop: Optional[asyncio.AbstractEventLoop]) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def _to_client_timeout(timeout: Any) -> "aiohttp.ClientTimeout":
+    # Same meaning as for `requests`: either a single value (for both connecting and reading), or a (connect, read) tuple.
+    client_timeout = _require_aiohttp().ClientTimeout
+    if timeout is None:
+        return client_timeout(total=None)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return client_timeout(total=None, sock_connect=connect, sock_read=read)
+    return client_timeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+
+def _to_str(value: Union[str, bytes]) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _extract_error(body: bytes) -> Any:
+    try:
+        return json.loads(body)
+    except Exception:
+        return body.decode(errors="replace")
@@ -0,0 +1,263 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, Awaitable, Callable, Dict, List, Optional, Sequence,
+                    Tuple, TypeVar, Union)
+
+from requests.auth import AuthBase
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.core.constants import DCDT_CONTRACT_ADDRESS_HEX
+from dharitri_sdk.network_providers.accounts import (AccountOnNetwork,
+                                                     GuardianData)
+from dharitri_sdk.network_providers.async_http_session import AsyncHttpSession
+from dharitri_sdk.network_providers.cached_resources import (
+    cache_hyperblock, cache_proxy_transaction, get_cached_hyperblock,
+    get_cached_proxy_transaction)
+from dharitri_sdk.network_providers.completion_detector import \
+    TransactionCompletionDetector
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.constants import METACHAIN_ID
+from dharitri_sdk.network_providers.contract_query_requests import \
+    ContractQueryRequest
+from dharitri_sdk.network_providers.contract_query_response import \
+    ContractQueryResponse
+from dharitri_sdk.network_providers.http_requests import get_proxy_data
+from dharitri_sdk.network_providers.interface import IAddress, IContractQuery
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.network_status import NetworkStatus
+from dharitri_sdk.network_providers.proxy_network_provider import (
+    ContractQuery, ProxyNetworkProvider)
+from dharitri_sdk.network_providers.resources import (GenericResponse,
+                                                      SimulateResponse)
+from dharitri_sdk.network_providers.single_flight import AsyncSingleFlight
+from dharitri_sdk.network_providers.token_definitions import (
+    DefinitionOfFungibleTokenOnNetwork, DefinitionOfTokenCollectionOnNetwork)
+from dharitri_sdk.network_providers.tokens import (
+    FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork)
+from dharitri_sdk.network_providers.transaction_status import TransactionStatus
+from dharitri_sdk.network_providers.transactions import (
+    ITransaction, TransactionOnNetwork, transaction_to_dictionary)
+
+T = TypeVar("T")
+
+
+class AsyncProxyNetworkProvider:
+    """
+    The asyncio counterpart of `ProxyNetworkProvider`.
+
+    If `aiohttp` is installed (`pip install dharitri-sdk[async]`), the HTTP calls are performed natively, on the event loop (see `AsyncHttpSession`):
+    a single loop can keep hundreds of requests in flight (up to `NetworkProviderConfig.async_max_connections`).
+
+    Otherwise (or if the `auth` or the `requests_options` cannot be handled by `aiohttp`), the HTTP calls go through a wrapped `ProxyNetworkProvider`,
+    on a pool of I/O threads: then, at most `NetworkProviderConfig.max_workers` requests are in flight at once.
+    `send_transactions()` always goes through the wrapped provider.
+
+    Use the provider as an async context manager (or `await aclose()`), so that the connections are released on the event loop.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            auth: Union[AuthBase, None] = None,
+            address_hrp: Optional[str] = None,
+            config: Optional[NetworkProviderConfig] = None
+    ) -> None:
+        self.proxy = ProxyNetworkProvider(url, auth, address_hrp, config)
+        self.url = url
+        self.address_hrp = self.proxy.address_hrp
+        self.config = self.proxy.config
+
+        self.http: Optional[AsyncHttpSession] = AsyncHttpSession(self.config, auth) if AsyncHttpSession.is_supported(self.config, auth) else None
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._single_flight: Optional[AsyncSingleFlight[Any]] = AsyncSingleFlight() if self.config.coalesce_requests else None
+
+    async def get_network_config(self) -> NetworkConfig:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return await cache.get_network_config_async(f"{self.url}/network/config", self._fetch_network_config)
+        return await self._fetch_network_config()
+
+    async def _fetch_network_config(self) -> NetworkConfig:
+        response = await self.do_get_generic('network/config')
+        network_config = NetworkConfig.from_http_response(response.get('config', ''))
+        return network_config
+
+    async def get_network_gas_configs(self) -> Dict[str, Any]:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return await cache.get_network_gas_configs_async(f"{self.url}/network/gas-configs", self._fetch_network_gas_configs)
+        return await self._fetch_network_gas_configs()
+
+    async def _fetch_network_gas_configs(self) -> Dict[str, Any]:
+        response = await self.do_get_generic("network/gas-configs")
+        return response.to_dictionary()
+
+    async def get_network_status(self, shard: Optional[int] = METACHAIN_ID) -> NetworkStatus:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return await cache.get_network_status_async(f"{self.url}/network/status/{shard}", lambda: self._fetch_network_status(shard))
+        return await self._fetch_network_status(shard)
+
+    async def _fetch_network_status(self, shard: Optional[int]) -> NetworkStatus:
+        response = await self.do_get_generic(f'network/status/{shard}')
+        network_status = NetworkStatus.from_http_response(response.get('status', ''))
+        return network_status
+
+    async def get_account(self, address: IAddress) -> AccountOnNetwork:
+        response = await self.do_get_generic(f'address/{address.to_bech32()}')
+        account = AccountOnNetwork.from_http_response(response.get('account', ''))
+        return account
+
+    async def get_guardian_data(self, address: IAddress) -> GuardianData:
+        response = await self.do_get_generic(f'address/{address.to_bech32()}/guardian-data')
+        account_guardian = GuardianData.from_http_response(response.get('guardianData', ''))
+        return account_guardian
+
+    async def get_fungible_tokens_of_account(self, address: IAddress) -> List[FungibleTokenOfAccountOnNetwork]:
+        response = await self.do_get_generic(f'address/{address.to_bech32()}/dcdt')
+        items = response.get('dcdts')
+        dcdts = [items[key] for key in items.keys() if items[key].get('nonce', '') == '']
+        tokens = [FungibleTokenOfAccountOnNetwork.from_http_response(dcdt) for dcdt in dcdts]
+        return tokens
+
+    async def get_nonfungible_tokens_of_account(self, address: IAddress) -> List[NonFungibleTokenOfAccountOnNetwork]:
+        response = await self.do_get_generic(f'address/{address.to_bech32()}/dcdt')
+        items = response.get('dcdts')
+        nfts = [items[key] for key in items.keys() if items[key].get('nonce', -1) > 0]
+        result = [NonFungibleTokenOfAccountOnNetwork.from_proxy_http_response(nft) for nft in nfts]
+        return result
+
+    async def get_fungible_token_of_account(self, address: IAddress, identifier: str) -> FungibleTokenOfAccountOnNetwork:
+        response = await self.do_get_generic(f'address/{address.to_bech32()}/dcdt/{identifier}')
+        token = FungibleTokenOfAccountOnNetwork.from_http_response(response.get('tokenData'))
+        return token
+
+    async def get_nonfungible_token_of_account(self, address: IAddress, collection: str, nonce: int) -> NonFungibleTokenOfAccountOnNetwork:
+        response = await self.do_get_generic(f'address/{address.to_bech32()}/nft/{collection}/nonce/{nonce}')
+        token = NonFungibleTokenOfAccountOnNetwork.from_proxy_http_response_by_nonce(response.get('tokenData', ''))
+        return token
+
+    async def get_transaction(self, tx_hash: str, with_process_status: Optional[bool] = False) -> TransactionOnNetwork:
+        cached = get_cached_proxy_transaction(self.config.immutable_data_cache, self.url, tx_hash)
+        if cached is not None:
+            return cached
+
+        tx_task = self.do_get_generic(f"transaction/{tx_hash}?withResults=true")
+
+        if with_process_status and not self.config.detect_completion_locally:
+            response, process_status = await asyncio.gather(tx_task, self.get_transaction_status(tx_hash))
+        else:
+            response, process_status = await tx_task, None
+
+        tx = response.get('transaction', '')
+        if with_process_status and self.config.detect_completion_locally:
+            detector = TransactionCompletionDetector()
+            process_status = detector.get_process_status(TransactionOnNetwork.from_proxy_http_response(tx_hash, tx))
+
+        transaction = TransactionOnNetwork.from_proxy_http_response(tx_hash, tx, process_status)
+        cache_proxy_transaction(self.config.immutable_data_cache, self.url, tx_hash, tx, process_status)
+        return transaction
+
+    async def get_transaction_status(self, tx_hash: str) -> TransactionStatus:
+        response = await self.do_get_generic(f'transaction/{tx_hash}/process-status')
+        status = TransactionStatus(response.get('status', ''))
+        return status
+
+    async def send_transaction(self, transaction: ITransaction) -> str:
+        response = await self.do_post_generic('transaction/send', transaction_to_dictionary(transaction))
+        return response.get('txHash', '')
+
+    async def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        """Sends the transactions in chunks, through the wrapped provider (see `ProxyNetworkProvider.send_transactions()`)."""
+        return await self._run(self.proxy.send_transactions, transactions)
+
+    async def query_contract(self, query: IContractQuery) -> ContractQueryResponse:
+        request = ContractQueryRequest(query).to_http_request()
+        response = await self.do_post_generic('vm-values/query', request)
+        return ContractQueryResponse.from_http_response(response.get('data', ''))
+
+    async def get_definition_of_fungible_token(self, token_identifier: str) -> DefinitionOfFungibleTokenOnNetwork:
+        properties = await self._get_token_properties(token_identifier)
+        definition = DefinitionOfFungibleTokenOnNetwork.from_response_of_get_token_properties(token_identifier, properties, self.address_hrp)
+        return definition
+
+    async def get_definition_of_token_collection(self, collection: str) -> DefinitionOfTokenCollectionOnNetwork:
+        properties = await self._get_token_properties(collection)
+        definition = DefinitionOfTokenCollectionOnNetwork.from_response_of_get_token_properties(collection, properties, self.address_hrp)
+        return definition
+
+    async def _get_token_properties(self, identifier: str) -> List[bytes]:
+        encoded_identifier = identifier.encode()
+        query = ContractQuery(Address.new_from_hex(DCDT_CONTRACT_ADDRESS_HEX, self.address_hrp), 'getTokenProperties', 0, [encoded_identifier])
+        query_response = await self.query_contract(query)
+        return query_response.get_return_data_parts()
+
+    async def simulate_transaction(self, transaction: ITransaction) -> SimulateResponse:
+        response = await self.do_post_generic("transaction/simulate", transaction_to_dictionary(transaction))
+        return SimulateResponse(response)
+
+    async def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        url = f"hyperblock/by-hash/{key}"
+        if str(key).isnumeric():
+            url = f"hyperblock/by-nonce/{key}"
+
+        cached = get_cached_hyperblock(self.config.immutable_data_cache, self.url, key)
+        if cached is not None:
+            return cached
+
+        response = await self.do_get_generic(url)
+        response = response.get("hyperblock", {})
+        cache_hyperblock(self.config.immutable_data_cache, self.url, key, response)
+
+        return response
+
+    async def do_get_generic(self, resource_url: str) -> GenericResponse:
+        if self._single_flight is not None:
+            return await self._single_flight.do(resource_url, lambda: self._do_get_generic(resource_url))
+        return await self._do_get_generic(resource_url)
+
+    async def _do_get_generic(self, resource_url: str) -> GenericResponse:
+        if self.http is None:
+            return await self._run(self.proxy.do_get_generic, resource_url)
+
+        url = f'{self.url}/{resource_url}'
+        parsed = await self.http.get_json(url)
+        return get_proxy_data(parsed, url)
+
+    async def do_post_generic(self, resource_url: str, payload: Any) -> GenericResponse:
+        if self.http is None:
+            return await self._run(self.proxy.do_post_generic, resource_url, payload)
+
+        url = f'{self.url}/{resource_url}'
+        parsed = await self.http.post_json(url, payload)
+        return get_proxy_data(parsed, url)
+
+    async def aclose(self) -> None:
+        """Releases the connections (on the event loop), then stops the I/O workers (if any)."""
+        if self.http is not None:
+            await self.http.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Stops the I/O workers (if any) and releases the pooled HTTP connections."""
+        if self.http is not None:
+            self.http.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.proxy.close()
+
+    async def __aenter__(self) -> "AsyncProxyNetworkProvider":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _run(self, function: Callable[..., T], *args: Any) -> Awaitable[T]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="async-proxy")
+
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, functools.partial(function, *args))
@@ -0,0 +1,126 @@
+import asyncio
+import base64
+import time
+
+import pytest
+from requests.auth import AuthBase
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.core.transaction import Transaction
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.proxy_network_provider import ContractQuery
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+BOB = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+TX_HASH = "9d47c4b4669cbcaa26f5dec79902dd20e55a0aa5f4b92454a74e7dbd0183ad6c"
+
+
+def ok(data):
+    return MockHttpResponse({"data": data, "code": "successful"})
+
+
+class TestAsyncProxy:
+    def test_get_account_concurrently(self):
+        with MockHttpServer() as server:
+            server.mock_route("GET", f"/address/{ALICE}", ok({"account": {"address": ALICE, "nonce": 7, "balance": "1000"}}))
+            server.mock_route("GET", f"/address/{BOB}", ok({"account": {"address": BOB, "nonce": 5, "balance": "500"}}))
+
+            async def run():
+                async with AsyncProxyNetworkProvider(server.url, config=NetworkProviderConfig(max_workers=8)) as proxy:
+                    addresses = [Address.new_from_bech32(ALICE), Address.new_from_bech32(BOB)] * 20
+                    return await asyncio.gather(*[proxy.get_account(address) for address in addresses])
+
+            accounts = asyncio.run(run())
+
+            assert len(accounts) == 40
+            assert [account.nonce for account in accounts[:2]] == [7, 5]
+            assert accounts[1].address.to_bech32() == BOB
+            assert accounts[1].balance == 500
+
+    def test_get_transaction_with_process_status(self):
+        with MockHttpServer() as server:
+            server.mock_route("GET", f"/transaction/{TX_HASH}", ok({"transaction": {"nonce": 42, "sender": ALICE, "receiver": BOB, "status": "pending"}}))
+            server.mock_route("GET", f"/transaction/{TX_HASH}/process-status", ok({"status": "success"}))
+
+            async def run():
+                async with AsyncProxyNetworkProvider(server.url) as proxy:
+                    return await proxy.get_transaction(TX_HASH, with_process_status=True)
+
+            transaction = asyncio.run(run())
+
+            assert transaction.nonce == 42
+            assert transaction.sender.to_bech32() == ALICE
+            assert transaction.status.is_successful()
+            assert transaction.is_completed
+
+    def test_send_transactions_and_query_contract(self):
+        with MockHttpServer() as server:
+            server.mock_route("POST", "/transaction/send-multiple", ok({"numOfSentTxs": 1, "txsHashes": {"0": TX_HASH}}))
+            server.mock_route("POST", "/vm-values/query", ok({"data": {"returnData": [base64.b64encode(b"\x07").decode()], "returnCode": "ok"}}))
+
+            transaction = Transaction(sender=ALICE, receiver=BOB, gas_limit=50000, chain_id="D")
+            query = ContractQuery(Address.new_from_bech32(BOB), "getSum", 0, [])
+
+            async def run():
+                async with AsyncProxyNetworkProvider(server.url) as proxy:
+                    return await asyncio.gather(proxy.send_transactions([transaction]), proxy.query_contract(query))
+
+            (num_sent, hashes), query_response = asyncio.run(run())
+
+            assert num_sent == 1
+            assert hashes == {"0": TX_HASH}
+            assert query_response.get_return_data_parts() == [b"\x07"]
+            sent = [request for request in server.requests if request.path == "/transaction/send-multiple"]
+            assert sent[0].json()[0]["sender"] == ALICE
+
+    def test_errors_are_raised_on_the_event_loop(self):
+        with MockHttpServer() as server:
+            async def run():
+                async with AsyncProxyNetworkProvider(server.url) as proxy:
+                    await proxy.get_account(Address.new_from_bech32(ALICE))
+
+            with pytest.raises(GenericError):
+                asyncio.run(run())
+
+    def test_many_requests_in_flight_without_threads(self):
+        pytest.importorskip("aiohttp")
+
+        with MockHttpServer() as server:
+            server.mock_route("GET", f"/address/{ALICE}", MockHttpResponse({"data": {"account": {"address": ALICE, "nonce": 7}}, "code": "successful"}, delay_in_seconds=0.5))
+
+            async def run():
+                async with AsyncProxyNetworkProvider(server.url, config=NetworkProviderConfig(max_workers=2, async_max_connections=100)) as proxy:
+                    assert proxy.http is not None
+                    accounts = await asyncio.gather(*[proxy.get_account(Address.new_from_bech32(ALICE)) for _ in range(100)])
+                    # no I/O thread was needed
+                    assert proxy._executor is None
+                    return accounts
+
+            start = time.monotonic()
+            accounts = asyncio.run(run())
+
+            assert [account.nonce for account in accounts] == [7] * 100
+            # with 2 threads, 100 requests would take 50 * 0.5 seconds
+            assert time.monotonic() - start < 5
+
+    def test_falls_back_to_threads_for_custom_auth(self):
+        class CustomAuth(AuthBase):
+            def __call__(self, request):
+                request.headers["X-Token"] = "secret"
+                return request
+
+        with MockHttpServer() as server:
+            server.mock_route("GET", f"/address/{ALICE}", ok({"account": {"address": ALICE, "nonce": 7}}))
+
+            async def run():
+                async with AsyncProxyNetworkProvider(server.url, auth=CustomAuth()) as proxy:
+                    assert proxy.http is None
+                    return await proxy.get_account(Address.new_from_bech32(ALICE))
+
+            assert asyncio.run(run()).nonce == 7
+            assert server.requests[0].headers["X-Token"] == "secret"
@@ -0,0 +1,288 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+from dharitri_sdk.network_providers.completion_detector import \
+    TransactionCompletionDetector
+from dharitri_sdk.network_providers.errors import (
+    ExpectedTransactionStatusNotReached, IsCompletedFieldMissingOnTransaction)
+from dharitri_sdk.network_providers.hyperblock_stream import (
+    HyperblockStream, IHyperblockProvider)
+from dharitri_sdk.network_providers.transaction_awaiter import (
+    ONE_SECOND_IN_MILLISECONDS, ITransactionFetcher, TransactionAwaiter)
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+
+logger = logging.getLogger("block_driven_transaction_awaiter")
+
+DEFAULT_LOOKBACK_IN_BLOCKS = 10
+DEFAULT_MAX_IN_FLIGHT = 4
+
+
+class WatchedTransaction:
+    def __init__(self, tx_hash: str, condition: Callable[[TransactionOnNetwork], bool], deadline: float) -> None:
+        self.hash = tx_hash
+        self.condition = condition
+        self.deadline = deadline
+        self.future: "Future[TransactionOnNetwork]" = Future()
+        self.payload: Optional[Dict[str, Any]] = None
+        self.contract_results: List[Dict[str, Any]] = []
+
+
+class BlockDrivenTransactionAwaiter:
+    """
+    Awaits transactions by following the (final) hyperblocks, instead of polling each transaction.
+
+    A single background thread consumes the hyperblocks (see `HyperblockStream`), and matches the watched hashes
+    against the transactions (and the contract results, by their original transaction hash) of each block.
+    Thus, the cost is one request per block, regardless of the number of watched transactions.
+
+    It offers the same `await_completed()` and `await_on_condition()` as `TransactionAwaiter`, thus callers can switch between the two.
+    Whether a transaction is completed is decided from its status and from the smart contract results (and their logs) seen so far in the blocks
+    (see `TransactionCompletionDetector`): e.g. a successful cross-shard contract call is completed only once its whole chain of results has been seen.
+    If a fetcher is given, the transaction is fetched (once per block in which it shows up) and the condition is evaluated on the fetched transaction instead:
+    this is useful when the full outcome (e.g. the logs of cross-shard contract calls) matters.
+
+    Since a transaction might have been included before the first followed block (see `lookback_in_blocks`), it is also looked up by hash, once,
+    when its watch starts: through the fetcher, if given, otherwise through the provider (if it can fetch transactions, e.g. a `ProxyNetworkProvider`).
+    """
+
+    def __init__(self,
+                 provider: IHyperblockProvider,
+                 fetcher: Optional[ITransactionFetcher] = None,
+                 timeout_interval_in_milliseconds: Optional[int] = None,
+                 lookback_in_blocks: int = DEFAULT_LOOKBACK_IN_BLOCKS,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT) -> None:
+        """
+        Args:
+            provider (IHyperblockProvider): Where the hyperblocks are fetched from (e.g. a `ProxyNetworkProvider`).
+            fetcher (Optional[ITransactionFetcher]): If set, used to fetch the full transaction, once it shows up in a block.
+            timeout_interval_in_milliseconds (Optional[int]): The timeout, in milliseconds.
+            lookback_in_blocks (int): How many blocks behind the tip to start from, so that recently sent transactions are not missed.
+            max_in_flight (int): The maximum number of hyperblocks being fetched concurrently (while catching up).
+        """
+        self.provider = provider
+        self.fetcher = fetcher
+        self.timeout_interval_in_milliseconds = timeout_interval_in_milliseconds or TransactionAwaiter.default_timeout
+        self.lookback_in_blocks = lookback_in_blocks
+        self.max_in_flight = max_in_flight
+
+        self._completion_detector = TransactionCompletionDetector()
+        self._watched: Dict[str, List[WatchedTransaction]] = {}
+        self._lock = threading.Lock()
+        self._stream: Optional[HyperblockStream] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def await_completed(self, tx_hash: str) -> TransactionOnNetwork:
+        """Waits until the transaction is completely processed."""
+        def is_completed(tx: TransactionOnNetwork):
+            if tx.is_completed is None:
+                raise IsCompletedFieldMissingOnTransaction()
+
+            return tx.is_completed
+
+        return self._wait(self.watch(tx_hash, is_completed))
+
+    def await_on_condition(self, tx_hash: str, condition: Callable[[TransactionOnNetwork], bool]) -> TransactionOnNetwork:
+        """Waits until the condition is satisfied."""
+        return self._wait(self.watch(tx_hash, condition))
+
+    def watch(self, tx_hash: str, condition: Callable[[TransactionOnNetwork], bool]) -> "Future[TransactionOnNetwork]":
+        """Starts watching the transaction. The returned future is resolved once the condition is satisfied (or fails on timeout)."""
+        deadline = time.monotonic() + self.timeout_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        watched = WatchedTransaction(tx_hash, condition, deadline)
+
+        with self._lock:
+            self._watched.setdefault(tx_hash, []).append(watched)
+
+        try:
+            self._ensure_started()
+        except Exception:
+            self._unwatch(watched)
+            raise
+
+        self._check_by_hash(tx_hash)
+        return watched.future
+
+    def _wait(self, future: "Future[TransactionOnNetwork]") -> TransactionOnNetwork:
+        # The deadlines are (also) checked as blocks arrive; this covers a stalled chain.
+        try:
+            return future.result(timeout=self.timeout_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS)
+        except FutureTimeoutError:
+            raise ExpectedTransactionStatusNotReached()
+
+    def close(self) -> None:
+        """Stops following the blocks. The transactions still watched fail with `ExpectedTransactionStatusNotReached`."""
+        with self._lock:
+            stream, thread = self._stream, self._thread
+            self._stream, self._thread = None, None
+
+        if stream is not None:
+            stream.stop()
+        if thread is not None:
+            thread.join()
+
+        self._expire(float("inf"))
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+
+        # The network is not called while holding the lock (concurrent callers might both call it; only the first one starts the thread).
+        tip = self.provider.get_network_status().highest_final_nonce
+
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self._stream = HyperblockStream(self.provider, start_nonce=max(tip - self.lookback_in_blocks, 0), max_in_flight=self.max_in_flight)
+            self._thread = threading.Thread(target=self._follow_blocks, args=(self._stream,), name="block-driven-awaiter", daemon=True)
+            self._thread.start()
+
+    def _unwatch(self, watched: WatchedTransaction) -> None:
+        with self._lock:
+            items = [item for item in self._watched.get(watched.hash, []) if item is not watched]
+
+            if items:
+                self._watched[watched.hash] = items
+            else:
+                self._watched.pop(watched.hash, None)
+
+    def _check_by_hash(self, tx_hash: str) -> None:
+        fetcher = self.fetcher if self.fetcher is not None else self.provider if isinstance(self.provider, ITransactionFetcher) else None
+        if fetcher is None:
+            return
+
+        try:
+            fetched = fetcher.get_transaction(tx_hash)
+        except Exception as error:
+            logger.debug(f"Transaction {tx_hash} not found by hash (yet): {error}")
+            return
+
+        if self.fetcher is not None:
+            self._resolve(tx_hash, fetched)
+            return
+
+        # As for the transactions seen in the blocks, the completion is decided from the results known so far (further results may show up in the blocks).
+        payload = dict(fetched.raw_response)
+        results: List[Dict[str, Any]] = payload.pop("smartContractResults", None) or []
+
+        with self._lock:
+            items = self._watched.get(tx_hash, [])
+
+            for item in items:
+                known_hashes = {result.get("hash") for result in item.contract_results}
+                item.payload = item.payload or payload
+                item.contract_results = [result for result in results if result.get("hash") not in known_hashes] + item.contract_results
+
+        if items:
+            transaction = self._get_transaction(tx_hash, items[0])
+            if transaction is not None:
+                self._resolve(tx_hash, transaction)
+
+    def _follow_blocks(self, stream: HyperblockStream) -> None:
+        try:
+            for block in stream:
+                self._handle_block(block)
+                self._expire(time.monotonic())
+        except Exception as error:
+            logger.error(f"Stopped following the blocks: {error}")
+
+            with self._lock:
+                watched = [item for items in self._watched.values() for item in items]
+                self._watched.clear()
+                self._stream, self._thread = None, None
+
+            for item in watched:
+                item.future.set_exception(error)
+
+    def _handle_block(self, block: Dict[str, Any]) -> None:
+        touched: Dict[str, List[WatchedTransaction]] = {}
+
+        with self._lock:
+            for transaction in block.get("transactions", []):
+                tx_hash = transaction.get("hash", "")
+                original_hash = transaction.get("originalTransactionHash", "")
+
+                for item in self._watched.get(tx_hash, []):
+                    item.payload = transaction
+                    touched[tx_hash] = self._watched[tx_hash]
+
+                if original_hash and original_hash != tx_hash:
+                    for item in self._watched.get(original_hash, []):
+                        item.contract_results.append(transaction)
+                        touched[original_hash] = self._watched[original_hash]
+
+        for tx_hash, items in touched.items():
+            try:
+                transaction = self._get_transaction(tx_hash, items[0])
+            except Exception as error:
+                logger.warning(f"Could not get transaction {tx_hash}: {error}")
+                continue
+
+            if transaction is not None:
+                self._resolve(tx_hash, transaction)
+
+    def _get_transaction(self, tx_hash: str, item: WatchedTransaction) -> Optional[TransactionOnNetwork]:
+        if self.fetcher is not None:
+            return self.fetcher.get_transaction(tx_hash)
+
+        if item.payload is None:
+            return None
+
+        payload = dict(item.payload)
+        payload["smartContractResults"] = [_to_contract_result(result) for result in item.contract_results]
+        transaction = TransactionOnNetwork.from_proxy_http_response(tx_hash, payload)
+        transaction.is_completed = self._completion_detector.is_completed(transaction)
+        return transaction
+
+    def _resolve(self, tx_hash: str, transaction: TransactionOnNetwork) -> None:
+        with self._lock:
+            items = self._watched.get(tx_hash, [])
+            resolved: List[WatchedTransaction] = []
+            failed: List[WatchedTransaction] = []
+
+            for item in items:
+                try:
+                    if item.condition(transaction):
+                        resolved.append(item)
+                except Exception as error:
+                    item.future.set_exception(error)
+                    failed.append(item)
+
+            remaining = [item for item in items if item not in resolved and item not in failed]
+            if remaining:
+                self._watched[tx_hash] = remaining
+            else:
+                self._watched.pop(tx_hash, None)
+
+        for item in resolved:
+            item.future.set_result(transaction)
+
+    def _expire(self, now: float) -> None:
+        expired: List[WatchedTransaction] = []
+
+        with self._lock:
+            for tx_hash in list(self._watched):
+                items = self._watched[tx_hash]
+                expired.extend(item for item in items if now >= item.deadline)
+                remaining = [item for item in items if now < item.deadline]
+
+                if remaining:
+                    self._watched[tx_hash] = remaining
+                else:
+                    del self._watched[tx_hash]
+
+        for item in expired:
+            item.future.set_exception(ExpectedTransactionStatusNotReached())
+
+
+def _to_contract_result(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    # Within hyperblocks, the contract results are listed as transactions, whose links are named differently than within "smartContractResults".
+    result = dict(transaction)
+    result.setdefault("prevTxHash", transaction.get("previousTransactionHash", ""))
+    result.setdefault("originalTxHash", transaction.get("originalTransactionHash", ""))
+    return result
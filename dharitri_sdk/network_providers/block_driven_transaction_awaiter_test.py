@@ -0,0 +1,220 @@
+import threading
+import time
+from typing import Any, Dict, List, Union
+
+import pytest
+
+from dharitri_sdk.network_providers.block_driven_transaction_awaiter import \
+    BlockDrivenTransactionAwaiter
+from dharitri_sdk.network_providers.errors import \
+    ExpectedTransactionStatusNotReached
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.network_status import NetworkStatus
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+
+TX_HASH = "9d47c4b4669cbcaa26f5dec79902dd20e55a0aa5f4b92454a74e7dbd0183ad6c"
+OTHER_TX_HASH = "abbaabbaabbaabbaabbaabbaabbaabbaabbaabbaabbaabbaabbaabbaabbaabba"
+
+
+class FakeChain:
+    def __init__(self) -> None:
+        self.blocks: Dict[int, List[Dict[str, Any]]] = {0: []}
+        self.num_hyperblock_requests = 0
+        self.lock = threading.Lock()
+
+    def produce_block(self, *transactions: Dict[str, Any]) -> None:
+        with self.lock:
+            self.blocks[len(self.blocks)] = list(transactions)
+
+    def get_network_config(self) -> NetworkConfig:
+        network_config = NetworkConfig()
+        network_config.round_duration = 10
+        return network_config
+
+    def get_network_status(self) -> NetworkStatus:
+        network_status = NetworkStatus()
+        with self.lock:
+            network_status.highest_final_nonce = len(self.blocks) - 1
+        return network_status
+
+    def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        with self.lock:
+            self.num_hyperblock_requests += 1
+            return {"nonce": int(key), "transactions": self.blocks[int(key)]}
+
+
+def wait_until(condition: Any, timeout_in_seconds: float = 2) -> None:
+    deadline = time.monotonic() + timeout_in_seconds
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_await_completed():
+    chain = FakeChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=2000)
+
+    threading.Timer(0.05, lambda: chain.produce_block({"hash": OTHER_TX_HASH, "status": "success"})).start()
+    threading.Timer(0.1, lambda: chain.produce_block({"hash": TX_HASH, "nonce": 42, "status": "success"})).start()
+
+    transaction = awaiter.await_completed(TX_HASH)
+
+    assert transaction.nonce == 42
+    assert transaction.is_completed
+    awaiter.close()
+
+
+def test_many_transactions_cost_one_request_per_block():
+    chain = FakeChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=2000)
+    hashes = [f"{i:064x}" for i in range(100)]
+
+    futures = [awaiter.watch(tx_hash, lambda tx: bool(tx.is_completed)) for tx_hash in hashes]
+    chain.produce_block(*[{"hash": tx_hash, "status": "success"} for tx_hash in hashes[:50]])
+    chain.produce_block(*[{"hash": tx_hash, "status": "success"} for tx_hash in hashes[50:]])
+
+    assert [future.result(timeout=2).hash for future in futures] == hashes
+    assert chain.num_hyperblock_requests <= 3
+    awaiter.close()
+
+
+def test_await_on_condition_with_contract_results():
+    chain = FakeChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=2000)
+
+    def has_two_results(tx: TransactionOnNetwork) -> bool:
+        return len(tx.contract_results.items) == 2
+
+    future = awaiter.watch(TX_HASH, has_two_results)
+    chain.produce_block({"hash": TX_HASH, "status": "success"}, {"hash": "aa", "originalTransactionHash": TX_HASH, "nonce": 1})
+    chain.produce_block({"hash": "bb", "originalTransactionHash": TX_HASH, "nonce": 2})
+
+    transaction = future.result(timeout=2)
+    assert [item.nonce for item in transaction.contract_results.items] == [1, 2]
+    awaiter.close()
+
+
+def test_full_transaction_is_fetched_when_fetcher_is_given():
+    class Fetcher:
+        def __init__(self) -> None:
+            self.fetched: List[str] = []
+
+        def get_transaction(self, tx_hash: str) -> TransactionOnNetwork:
+            self.fetched.append(tx_hash)
+            transaction = TransactionOnNetwork()
+            transaction.hash = tx_hash
+            # not completed yet, when looked up by hash (as the watch starts)
+            transaction.is_completed = len(self.fetched) > 1
+            return transaction
+
+    chain = FakeChain()
+    fetcher = Fetcher()
+    awaiter = BlockDrivenTransactionAwaiter(chain, fetcher=fetcher, timeout_interval_in_milliseconds=2000)
+
+    future = awaiter.watch(TX_HASH, lambda tx: bool(tx.is_completed))
+    chain.produce_block({"hash": OTHER_TX_HASH, "status": "success"}, {"hash": TX_HASH, "status": "pending"})
+
+    assert future.result(timeout=2).is_completed
+    assert fetcher.fetched == [TX_HASH, TX_HASH]
+    awaiter.close()
+
+
+def test_timeout():
+    chain = FakeChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=100)
+
+    with pytest.raises(ExpectedTransactionStatusNotReached):
+        awaiter.await_completed(TX_HASH)
+
+    awaiter.close()
+
+
+def test_close_fails_the_watched_transactions():
+    chain = FakeChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=10_000)
+
+    future = awaiter.watch(TX_HASH, lambda tx: True)
+    awaiter.close()
+
+    with pytest.raises(ExpectedTransactionStatusNotReached):
+        future.result(timeout=1)
+
+
+def test_cross_shard_transaction_is_completed_once_its_results_are_complete():
+    chain = FakeChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=2000)
+    snapshots: List[bool] = []
+
+    def is_completed(tx: TransactionOnNetwork) -> bool:
+        snapshots.append(bool(tx.is_completed))
+        return bool(tx.is_completed)
+
+    future = awaiter.watch(TX_HASH, is_completed)
+    completed_event = {"events": [{"identifier": "completedTxEvent", "topics": [], "data": None}]}
+
+    # Executed in the source shard; the second result (in the destination shard) links to a first result, not seen yet.
+    chain.produce_block(
+        {"hash": TX_HASH, "status": "success"},
+        {"hash": "bb", "originalTransactionHash": TX_HASH, "previousTransactionHash": "aa", "logs": completed_event}
+    )
+    wait_until(lambda: len(snapshots) == 1)
+    assert not future.done()
+
+    chain.produce_block({"hash": "aa", "originalTransactionHash": TX_HASH, "previousTransactionHash": TX_HASH})
+
+    transaction = future.result(timeout=2)
+    assert transaction.is_completed
+    assert snapshots == [False, True]
+    awaiter.close()
+
+
+def test_transaction_included_before_the_lookback_is_found_by_hash():
+    class ChainWithTransactions(FakeChain):
+        def get_transaction(self, tx_hash: str) -> TransactionOnNetwork:
+            with self.lock:
+                payload = next(tx for block in self.blocks.values() for tx in block if tx["hash"] == tx_hash)
+            return TransactionOnNetwork.from_proxy_http_response(tx_hash, payload)
+
+    chain = ChainWithTransactions()
+    chain.produce_block({"hash": TX_HASH, "nonce": 42, "status": "success"})
+    for _ in range(20):
+        chain.produce_block()
+
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=2000, lookback_in_blocks=10)
+    transaction = awaiter.await_completed(TX_HASH)
+
+    assert transaction.nonce == 42
+    assert transaction.is_completed
+    awaiter.close()
+
+
+def test_watch_is_rolled_back_if_the_start_fails():
+    class FlakyChain(FakeChain):
+        def __init__(self, awaiter_lock: Any = None) -> None:
+            super().__init__()
+            self.num_failures = 1
+            self.awaiter_lock = awaiter_lock
+
+        def get_network_status(self) -> NetworkStatus:
+            # when starting a watch, the network is not called while holding the lock of the awaiter
+            if threading.current_thread() is threading.main_thread():
+                assert self.awaiter_lock is not None and not self.awaiter_lock.locked()
+
+            if self.num_failures > 0:
+                self.num_failures -= 1
+                raise ConnectionError("network is down")
+            return super().get_network_status()
+
+    chain = FlakyChain()
+    awaiter = BlockDrivenTransactionAwaiter(chain, timeout_interval_in_milliseconds=2000)
+    chain.awaiter_lock = awaiter._lock
+
+    with pytest.raises(ConnectionError):
+        awaiter.watch(TX_HASH, lambda tx: True)
+
+    assert awaiter._watched == {}
+
+    future = awaiter.watch(TX_HASH, lambda tx: bool(tx.is_completed))
+    chain.produce_block({"hash": TX_HASH, "status": "success"})
+
+    assert future.result(timeout=2).is_completed
+    awaiter.close()
@@ -0,0 +1,70 @@
+from typing import Any, Dict, Optional, Union
+
+from dharitri_sdk.network_providers.immutable_data_cache import \
+    ImmutableDataCache
+from dharitri_sdk.network_providers.transaction_status import TransactionStatus
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+
+# How the (sync and async) network providers keep the finalized resources in the `ImmutableDataCache`.
+# A cache can be shared by providers of different networks: the keys are prefixed by a namespace (the URL of the provider),
+# since the same hash (or a hyperblock hash) does not identify the same resource on another network.
+
+
+def get_cached_proxy_transaction(cache: Optional[ImmutableDataCache], namespace: str, tx_hash: str) -> Optional[TransactionOnNetwork]:
+    if cache is None:
+        return None
+
+    payload = cache.get(f"{namespace}/proxy/transaction/{tx_hash}")
+    if payload is None:
+        return None
+
+    process_status = TransactionStatus(payload["processStatus"])
+    return TransactionOnNetwork.from_proxy_http_response(tx_hash, payload["transaction"], process_status)
+
+
+def cache_proxy_transaction(cache: Optional[ImmutableDataCache], namespace: str, tx_hash: str, tx: Dict[str, Any], process_status: Optional[TransactionStatus]) -> None:
+    # Only the transactions known to be completed (according to their process status) are final.
+    if cache is None or process_status is None:
+        return
+    if not (process_status.is_successful() or process_status.is_failed()):
+        return
+
+    cache.put(f"{namespace}/proxy/transaction/{tx_hash}", {"transaction": tx, "processStatus": process_status.status})
+
+
+def get_cached_api_transaction(cache: Optional[ImmutableDataCache], namespace: str, tx_hash: str) -> Optional[TransactionOnNetwork]:
+    if cache is None:
+        return None
+
+    payload = cache.get(f"{namespace}/api/transaction/{tx_hash}")
+    if payload is None:
+        return None
+
+    return TransactionOnNetwork.from_api_http_response(tx_hash, payload)
+
+
+def cache_api_transaction(cache: Optional[ImmutableDataCache], namespace: str, tx_hash: str, response: Dict[str, Any], transaction: TransactionOnNetwork) -> None:
+    # Only the transactions without pending (smart contract) results are final.
+    if cache is None or not transaction.is_completed or response.get("pendingResults"):
+        return
+
+    cache.put(f"{namespace}/api/transaction/{tx_hash}", response)
+
+
+def get_cached_hyperblock(cache: Optional[ImmutableDataCache], namespace: str, key: Union[int, str]) -> Optional[Dict[str, Any]]:
+    if cache is None or not is_hyperblock_key_immutable(key):
+        return None
+
+    return cache.get(f"{namespace}/hyperblock/{key}")
+
+
+def cache_hyperblock(cache: Optional[ImmutableDataCache], namespace: str, key: Union[int, str], hyperblock: Dict[str, Any]) -> None:
+    if cache is None or not is_hyperblock_key_immutable(key) or not hyperblock:
+        return
+
+    cache.put(f"{namespace}/hyperblock/{key}", hyperblock)
+
+
+def is_hyperblock_key_immutable(key: Union[int, str]) -> bool:
+    # Hyperblocks fetched by hash never change, while the one at a given nonce could (until it is final).
+    return not str(key).isnumeric()
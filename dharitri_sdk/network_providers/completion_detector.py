@@ -0,0 +1,106 @@
+from collections import deque
+from typing import Dict, Iterator, List, Sequence
+
+from dharitri_sdk.network_providers.contract_results import ContractResultItem
+from dharitri_sdk.network_providers.transaction_logs import TransactionLogs
+from dharitri_sdk.network_providers.transaction_status import TransactionStatus
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+
+COMPLETED_EVENT_IDENTIFIER = "completedTxEvent"
+SIGNAL_ERROR_EVENT_IDENTIFIER = "signalError"
+WRITE_LOG_EVENT_IDENTIFIER = "writeLog"
+
+
+class ContractResultGraph:
+    """The smart contract results of a transaction, linked (as a tree) by their previous hash."""
+
+    def __init__(self, tx_hash: str, items: Sequence[ContractResultItem]) -> None:
+        self.tx_hash = tx_hash
+        self.items = list(items)
+        self.children: Dict[str, List[ContractResultItem]] = {}
+
+        for item in self.items:
+            self.children.setdefault(item.previous_hash or tx_hash, []).append(item)
+
+    def get_children(self, parent_hash: str) -> List[ContractResultItem]:
+        return self.children.get(parent_hash, [])
+
+    def walk(self) -> Iterator[ContractResultItem]:
+        """Yields the results reachable from the transaction, breadth-first."""
+        visited = {self.tx_hash}
+        queue = deque([self.tx_hash])
+
+        while queue:
+            for item in self.get_children(queue.popleft()):
+                if item.hash in visited:
+                    continue
+
+                visited.add(item.hash)
+                queue.append(item.hash)
+                yield item
+
+    def get_orphans(self) -> List[ContractResultItem]:
+        """
+        The results not reachable from the transaction (or belonging to another transaction).
+        An orphan means that (at least) one intermediate result is not known yet, e.g. it is still being processed in another shard.
+        """
+        reachable = {item.hash for item in self.walk()}
+        return [item for item in self.items if item.hash not in reachable or self._belongs_elsewhere(item)]
+
+    def is_connected(self) -> bool:
+        return not self.get_orphans()
+
+    def _belongs_elsewhere(self, item: ContractResultItem) -> bool:
+        return bool(item.original_hash) and item.original_hash != self.tx_hash
+
+
+class TransactionCompletionDetector:
+    """
+    Decides whether a transaction is completed (and whether it succeeded) from the transaction itself (as fetched with its results),
+    instead of asking the network for its process status (see `ProxyNetworkProvider.get_transaction_status()`).
+
+    A transaction is completed when:
+        - its status is "fail" or "invalid", or
+        - its status is "success", it has no pending results, and its smart contract results (if any) form a complete graph
+          which holds a `signalError` (failure), a `completedTxEvent` or a `writeLog` (success) event, or consists of refunds only.
+          For instance, an intra-shard contract call completes with an `@6f6b` result and a `writeLog` event, without any `completedTxEvent`.
+    """
+
+    def get_process_status(self, transaction: TransactionOnNetwork) -> TransactionStatus:
+        status = transaction.status
+
+        if status.is_failed():
+            return TransactionStatus("fail")
+        if not status.is_successful():
+            return TransactionStatus("pending")
+
+        return self._get_outcome_status(transaction)
+
+    def is_completed(self, transaction: TransactionOnNetwork) -> bool:
+        return not self.get_process_status(transaction).is_pending()
+
+    def is_outcome_final(self, transaction: TransactionOnNetwork) -> bool:
+        """Tells whether the outcome (contract results, events and logs) of a transaction is final, regardless of the status of the transaction itself."""
+        return not self._get_outcome_status(transaction).is_pending()
+
+    def _get_outcome_status(self, transaction: TransactionOnNetwork) -> TransactionStatus:
+        if transaction.raw_response.get("pendingResults"):
+            return TransactionStatus("pending")
+
+        graph = ContractResultGraph(transaction.hash, transaction.contract_results.items)
+        if not graph.is_connected():
+            return TransactionStatus("pending")
+
+        all_logs = [transaction.logs] + [item.logs for item in graph.walk()]
+
+        if self._has_event(all_logs, SIGNAL_ERROR_EVENT_IDENTIFIER):
+            return TransactionStatus("fail")
+        if self._has_event(all_logs, COMPLETED_EVENT_IDENTIFIER) or self._has_event(all_logs, WRITE_LOG_EVENT_IDENTIFIER):
+            return TransactionStatus("success")
+        if all(item.is_refund for item in graph.items):
+            return TransactionStatus("success")
+
+        return TransactionStatus("pending")
+
+    def _has_event(self, all_logs: List[TransactionLogs], identifier: str) -> bool:
+        return any(event.identifier == identifier for logs in all_logs for event in logs.events)
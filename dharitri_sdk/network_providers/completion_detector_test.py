@@ -0,0 +1,89 @@
+from typing import Any, Dict, List, Sequence
+
+from dharitri_sdk.network_providers.completion_detector import (
+    ContractResultGraph, TransactionCompletionDetector)
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.contract_results import ContractResults
+from dharitri_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+TX_HASH = "9d47c4b4669cbcaa26f5dec79902dd20e55a0aa5f4b92454a74e7dbd0183ad6c"
+
+
+def create_result(result_hash: str, previous_hash: str, events: Sequence[str] = (), is_refund: bool = False) -> Dict[str, Any]:
+    return {
+        "hash": result_hash,
+        "prevTxHash": previous_hash,
+        "originalTxHash": TX_HASH,
+        "isRefund": is_refund,
+        "logs": {"events": [{"identifier": identifier} for identifier in events]}
+    }
+
+
+def create_transaction(status: str, results: List[Dict[str, Any]], **extra: Any) -> Dict[str, Any]:
+    return {"status": status, "smartContractResults": results, **extra}
+
+
+def detect(payload: Dict[str, Any]) -> str:
+    transaction = TransactionOnNetwork.from_proxy_http_response(TX_HASH, payload)
+    return TransactionCompletionDetector().get_process_status(transaction).status
+
+
+def test_graph():
+    items = ContractResults.from_proxy_http_response([
+        create_result("aa", TX_HASH),
+        create_result("bb", "aa"),
+        create_result("cc", "aa"),
+        create_result("dd", "ee")
+    ]).items
+    graph = ContractResultGraph(TX_HASH, items)
+
+    assert [item.hash for item in graph.get_children("aa")] == ["bb", "cc"]
+    assert [item.hash for item in graph.walk()] == ["aa", "bb", "cc"]
+    assert [item.hash for item in graph.get_orphans()] == ["dd"]
+    assert not graph.is_connected()
+
+
+def test_detect_without_results():
+    assert detect(create_transaction("success", [])) == "success"
+    assert detect(create_transaction("fail", [])) == "fail"
+    assert detect(create_transaction("invalid", [])) == "fail"
+    assert detect(create_transaction("pending", [])) == "pending"
+    assert detect(create_transaction("success", [], pendingResults=True)) == "pending"
+
+
+def test_detect_with_results():
+    assert detect(create_transaction("success", [create_result("aa", TX_HASH)])) == "pending"
+    assert detect(create_transaction("success", [create_result("aa", TX_HASH, is_refund=True)])) == "success"
+    assert detect(create_transaction("success", [create_result("aa", TX_HASH), create_result("bb", "aa", ["completedTxEvent"])])) == "success"
+    assert detect(create_transaction("success", [create_result("aa", TX_HASH), create_result("bb", "aa", ["signalError"])])) == "fail"
+    # the intermediate result "aa" is not known yet
+    assert detect(create_transaction("success", [create_result("bb", "aa", ["completedTxEvent"])])) == "pending"
+
+
+def test_detect_intra_shard_contract_call():
+    # the contract call is completed with an "@6f6b" result (not a refund) and a "writeLog" event, without any "completedTxEvent"
+    result = {**create_result("aa", TX_HASH), "data": "@6f6b"}
+
+    assert detect(create_transaction("success", [result])) == "pending"
+    assert detect(create_transaction("success", [result], logs={"events": [{"identifier": "writeLog"}]})) == "success"
+    assert detect(create_transaction("success", [{**result, "logs": {"events": [{"identifier": "writeLog"}]}}])) == "success"
+    assert detect(create_transaction("success", [result], logs={"events": [{"identifier": "writeLog"}, {"identifier": "signalError"}]})) == "fail"
+
+
+def test_proxy_detects_completion_without_the_process_status_request():
+    with MockHttpServer() as server:
+        payload = create_transaction("success", [create_result("aa", TX_HASH, ["completedTxEvent"])], nonce=7)
+        server.mock_route("GET", f"/transaction/{TX_HASH}", MockHttpResponse({"data": {"transaction": payload}, "code": "successful"}))
+
+        proxy = ProxyNetworkProvider(server.url, config=NetworkProviderConfig(detect_completion_locally=True))
+        transaction = proxy.get_transaction(TX_HASH, with_process_status=True)
+        [result] = proxy.get_transactions([TX_HASH], with_process_status=True)
+
+        assert transaction.is_completed and transaction.status.is_successful()
+        assert result.transaction is not None and result.transaction.is_completed
+        assert [request.path for request in server.requests] == [f"/transaction/{TX_HASH}"] * 2
+        proxy.close()
@@ -1,6 +1,22 @@
+import copy
 from typing import Any, Optional
 
+from dharitri_sdk.network_providers.immutable_data_cache import \
+    ImmutableDataCache
 from dharitri_sdk.network_providers.interface import IPagination
+from dharitri_sdk.network_providers.network_metadata_cache import \
+    NetworkMetadataCache
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT_IN_SECONDS = 60
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_ASYNC_MAX_CONNECTIONS = 100
+DEFAULT_SEND_TRANSACTIONS_CHUNK_SIZE = 100
+DEFAULT_SEND_TRANSACTIONS_CHUNK_MAX_BYTES = 1024 * 1024
+DEFAULT_SEND_TRANSACTIONS_MAX_CONCURRENCY = 4
+DEFAULT_SEND_TRANSACTIONS_CHUNK_RETRIES = 2
 
 
 class DefaultPagination(IPagination):
@@ -18,7 +34,67 @@ class DefaultPagination(IPagination):
 class NetworkProviderConfig:
     def __init__(self,
                  client_name: Optional[str] = None,
-                 requests_options: Optional[dict[str, Any]] = None) -> None:
+                 requests_options: Optional[dict[str, Any]] = None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 pool_idle_timeout_in_seconds: Optional[float] = DEFAULT_POOL_IDLE_TIMEOUT_IN_SECONDS,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 send_transactions_chunk_size: int = DEFAULT_SEND_TRANSACTIONS_CHUNK_SIZE,
+                 send_transactions_chunk_max_bytes: int = DEFAULT_SEND_TRANSACTIONS_CHUNK_MAX_BYTES,
+                 send_transactions_max_concurrency: int = DEFAULT_SEND_TRANSACTIONS_MAX_CONCURRENCY,
+                 send_transactions_chunk_retries: int = DEFAULT_SEND_TRANSACTIONS_CHUNK_RETRIES,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 network_metadata_cache: Optional[NetworkMetadataCache] = None,
+                 immutable_data_cache: Optional[ImmutableDataCache] = None,
+                 coalesce_requests: bool = False,
+                 detect_completion_locally: bool = False,
+                 async_max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS) -> None:
+        """
+        Args:
+            client_name (Optional[str]): The name of the client, sent along with the `User-Agent` header.
+            requests_options (Optional[dict[str, Any]]): Extra options passed to each HTTP request (e.g. `timeout`, `headers`).
+            pool_connections (int): The number of connection pools (one per host) to keep around.
+            pool_maxsize (int): The maximum number of keep-alive connections kept for a single host. It is raised to `max_workers`, if lower, so that concurrent requests do not discard connections.
+            pool_idle_timeout_in_seconds (Optional[float]): If the pooled connections stay unused for longer than this, they are dropped and new ones are opened on the next request. `None` disables the idle check.
+            max_workers (int): The maximum number of worker threads a provider uses to perform requests concurrently.
+            send_transactions_chunk_size (int): `send_transactions()` splits its input in chunks of at most this many transactions.
+            send_transactions_chunk_max_bytes (int): The maximum (serialized) size of a chunk of transactions, in bytes. A larger transaction is sent in a chunk of its own.
+            send_transactions_max_concurrency (int): The maximum number of chunks of transactions sent at the same time.
+            send_transactions_chunk_retries (int): How many times a failed chunk of transactions is sent again.
+            retry_policy (Optional[RetryPolicy]): How failed requests are retried (backoff, `Retry-After`, circuit breaking). By default, requests are not retried.
+            network_metadata_cache (Optional[NetworkMetadataCache]): If set, the network config, the gas configs and the network status are served from this cache (see `NetworkMetadataCache`).
+            immutable_data_cache (Optional[ImmutableDataCache]): If set, completed transactions and hyperblocks fetched by hash are looked up in this cache before going to the network (see `ImmutableDataCache`).
+            coalesce_requests (bool): Whether concurrent identical GET requests (and contract queries) are collapsed into a single in-flight request, whose result is given to all callers (see `SingleFlight`).
+            detect_completion_locally (bool): Whether the proxy provider decides the completion of a transaction from its smart contract results (see `TransactionCompletionDetector`), instead of fetching its process status (an extra request).
+            async_max_connections (int): The maximum number of connections (thus, of requests in flight) of an asyncio provider, when `aiohttp` is installed (see `AsyncHttpSession`).
+        """
         self.client_name = client_name
         self.requests_options = requests_options or {}
         self.requests_options.setdefault("timeout", 5)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_idle_timeout_in_seconds = pool_idle_timeout_in_seconds
+        self.max_workers = max_workers
+        self.send_transactions_chunk_size = send_transactions_chunk_size
+        self.send_transactions_chunk_max_bytes = send_transactions_chunk_max_bytes
+        self.send_transactions_max_concurrency = send_transactions_max_concurrency
+        self.send_transactions_chunk_retries = send_transactions_chunk_retries
+        self.retry_policy = retry_policy
+        self.network_metadata_cache = network_metadata_cache
+        self.immutable_data_cache = immutable_data_cache
+        self.coalesce_requests = coalesce_requests
+        self.detect_completion_locally = detect_completion_locally
+        self.async_max_connections = async_max_connections
+
+    def copy(self) -> "NetworkProviderConfig":
+        """
+        Creates a copy of the config, with its own `requests_options` (and headers), e.g. for a provider backing another one.
+        The retry policy and the caches are shared.
+        """
+        other = copy.copy(self)
+        other.requests_options = dict(self.requests_options)
+
+        if "headers" in other.requests_options:
+            other.requests_options["headers"] = dict(other.requests_options["headers"])
+
+        return other
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, List
 
 
 class GenericError(Exception):
@@ -16,3 +16,31 @@ class ExpectedTransactionStatusNotReached(Exception):
 class IsCompletedFieldMissingOnTransaction(Exception):
     def __init__(self) -> None:
         super().__init__("The transaction awaiter requires the `is_completed` property to be defined on the transaction object. Perhaps you've used `ProxyNetworkProvider.get_transaction()` and in that case you should also pass `with_process_status=True`")
+
+
+class TransactionNotFoundError(Exception):
+    def __init__(self, tx_hash: str) -> None:
+        super().__init__(f"The transaction {tx_hash} was not found")
+        self.tx_hash = tx_hash
+
+
+class CircuitBreakerOpenError(Exception):
+    def __init__(self, endpoint: str, retry_in_seconds: float) -> None:
+        super().__init__(f"The endpoint [{endpoint}] is considered unhealthy; requests are rejected for another {retry_in_seconds:.1f} seconds")
+        self.endpoint = endpoint
+        self.retry_in_seconds = retry_in_seconds
+
+
+class HyperblockNotAvailableError(Exception):
+    def __init__(self, nonce: int) -> None:
+        super().__init__(f"The hyperblock with nonce {nonce} is not available")
+        self.nonce = nonce
+
+
+class TransactionsNotSentError(Exception):
+    def __init__(self, failed_indices: List[int], num_sent: int, hashes: Dict[str, str], cause: Exception) -> None:
+        super().__init__(f"Could not send {len(failed_indices)} transaction(s), e.g. the one at index {failed_indices[0]}: {cause}")
+        self.failed_indices = failed_indices
+        self.num_sent = num_sent
+        self.hashes = hashes
+        self.cause = cause
@@ -0,0 +1,79 @@
+from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
+
+import requests
+from requests.auth import AuthBase
+
+from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.http_session import PooledHttpSession
+from dharitri_sdk.network_providers.interface import IPagination
+from dharitri_sdk.network_providers.paginator import Pagination
+from dharitri_sdk.network_providers.resources import GenericResponse
+
+T = TypeVar("T")
+
+
+def perform_request(session: PooledHttpSession,
+                    method: str,
+                    url: str,
+                    parse: Callable[[Any, str], T],
+                    auth: Optional[AuthBase] = None,
+                    requests_options: Optional[Dict[str, Any]] = None,
+                    payload: Any = None) -> T:
+    """Performs the request (on the pooled session), then parses its (JSON) response. Errors (including HTTP errors) are raised as `GenericError`."""
+    options = requests_options or {}
+
+    try:
+        if method == "POST":
+            response = session.post(url, json=payload, auth=auth, **options)
+        else:
+            response = session.get(url, auth=auth, **options)
+
+        response.raise_for_status()
+        parsed = response.json()
+        return parse(parsed, url)
+    except requests.HTTPError as err:
+        error_data = extract_error_from_response(err.response)
+        raise GenericError(url, error_data)
+    except Exception as err:
+        raise GenericError(url, err)
+
+
+def get_proxy_data(parsed: Dict[str, Any], url: str) -> GenericResponse:
+    """Extracts the data out of a response of the proxy (`{"data": ..., "error": ..., "code": ...}`)."""
+    err = parsed.get("error")
+    code = parsed.get("code")
+
+    if err:
+        raise GenericError(url, f"code:{code}, error: {err}")
+
+    data: Dict[str, Any] = parsed.get("data", dict())
+    return GenericResponse(data)
+
+
+def get_api_data(parsed: Any, url: str) -> Any:
+    """Checks a response of the API, which is either a collection (a list) or an object (possibly holding an error)."""
+    if isinstance(parsed, List):
+        return cast(Any, parsed)
+
+    err = parsed.get("error", None)
+    if err:
+        code = parsed.get("statusCode")
+        raise GenericError(url, f"code:{code}, error: {err}")
+
+    return parsed
+
+
+def extract_error_from_response(response: Any) -> Any:
+    try:
+        return response.json()
+    except Exception:
+        return response.text
+
+
+def build_pagination_params(pagination: IPagination) -> str:
+    params = f'from={pagination.get_start()}&size={pagination.get_size()}'
+
+    if isinstance(pagination, Pagination) and pagination.get_before() is not None:
+        params += f'&before={pagination.get_before()}'
+
+    return params
@@ -0,0 +1,107 @@
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
+
+
+class PooledHttpSession:
+    """
+    A keep-alive HTTP session, owned by a network provider.
+    Connections (and their TLS handshakes) are reused across requests, instead of being opened anew for each call.
+    If the config holds a `RetryPolicy`, failed requests are retried (and unhealthy endpoints are short-circuited) according to it.
+    """
+
+    def __init__(self, config: NetworkProviderConfig) -> None:
+        self.pool_connections = config.pool_connections
+        # The workers of a provider (see `max_workers`) share the session: each of them should be able to keep its connection alive.
+        self.pool_maxsize = max(config.pool_maxsize, config.max_workers)
+        self.pool_idle_timeout_in_seconds = config.pool_idle_timeout_in_seconds
+        self.retry_policy = config.retry_policy
+
+        self._lock = threading.Lock()
+        self._session = self._create_session()
+        self._last_used = time.monotonic()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        if self.retry_policy is None:
+            return self._acquire_session().request(method, url, **kwargs)
+
+        return self._request_with_retries(self.retry_policy, method, url, **kwargs)
+
+    def _request_with_retries(self, policy: RetryPolicy, method: str, url: str, **kwargs: Any) -> requests.Response:
+        max_retries = policy.get_max_retries(method, url)
+        circuit_breaker = policy.get_circuit_breaker(url)
+        attempt = 0
+
+        while True:
+            circuit_breaker.before_request()
+
+            try:
+                response = self._acquire_session().request(method, url, **kwargs)
+            except Exception as error:
+                # Whatever the error, the outcome is recorded (otherwise, a trial request of the circuit breaker would never end).
+                circuit_breaker.record_failure()
+                if attempt >= max_retries or not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+                    raise
+                delay = policy.get_backoff_delay(attempt)
+            except BaseException:
+                # E.g. KeyboardInterrupt, which says nothing about the health of the endpoint.
+                circuit_breaker.release_trial()
+                raise
+            else:
+                if policy.is_failure_status(response.status_code):
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+
+                if attempt >= max_retries or not policy.is_retriable_status(response.status_code):
+                    return response
+
+                retry_after = policy.get_retry_after_delay(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > policy.max_retry_after_in_seconds:
+                    return response
+
+                delay = policy.get_backoff_delay(attempt) if retry_after is None else retry_after
+                response.close()
+
+            attempt += 1
+            time.sleep(delay)
+
+    def close(self) -> None:
+        """Closes all the pooled connections. The session remains usable; new connections are opened on demand."""
+        with self._lock:
+            self._session.close()
+
+    def _acquire_session(self) -> requests.Session:
+        with self._lock:
+            now = time.monotonic()
+
+            if self._is_idle(now):
+                # The server (or a load balancer in between) has most likely dropped the connections by now.
+                self._session.close()
+
+            self._last_used = now
+            return self._session
+
+    def _is_idle(self, now: float) -> bool:
+        if self.pool_idle_timeout_in_seconds is None:
+            return False
+        return now - self._last_used > self.pool_idle_timeout_in_seconds
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
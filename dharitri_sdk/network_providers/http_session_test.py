@@ -0,0 +1,100 @@
+import logging
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.http_session import PooledHttpSession
+from dharitri_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+
+
+def mock_account_route(server: MockHttpServer):
+    payload = {"data": {"account": {"address": ALICE, "nonce": 7, "balance": "1000"}}, "code": "successful"}
+    server.mock_route("GET", f"/address/{ALICE}", MockHttpResponse(payload))
+
+
+def get_adapter(session: PooledHttpSession) -> HTTPAdapter:
+    adapter = session._session.get_adapter("https://example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    return adapter
+
+
+def test_pool_is_configured_from_config():
+    config = NetworkProviderConfig(pool_connections=3, pool_maxsize=42)
+    session = PooledHttpSession(config)
+
+    adapter = get_adapter(session)
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 42
+
+
+def test_pool_is_at_least_as_large_as_the_worker_pool():
+    session = PooledHttpSession(NetworkProviderConfig(pool_maxsize=10, max_workers=16))
+    assert get_adapter(session)._pool_maxsize == 16
+
+
+def test_concurrent_requests_do_not_discard_connections(caplog: pytest.LogCaptureFixture):
+    tx_hashes = [f"{i:064x}" for i in range(32)]
+
+    with MockHttpServer() as server:
+        for tx_hash in tx_hashes:
+            transaction = {"data": {"transaction": {"nonce": 7, "status": "success"}}, "code": "successful"}
+            server.mock_route("GET", f"/transaction/{tx_hash}", MockHttpResponse(transaction, delay_in_seconds=0.05))
+            server.mock_route("GET", f"/transaction/{tx_hash}/process-status", MockHttpResponse({"data": {"status": "success"}, "code": "successful"}))
+
+        config = NetworkProviderConfig()
+
+        with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+            with ProxyNetworkProvider(server.url, config=config) as proxy:
+                results = proxy.get_transactions(tx_hashes, with_process_status=True)
+
+        assert all(result.is_ok() for result in results)
+        assert "Connection pool is full" not in caplog.text
+        # the calling thread, plus the workers
+        assert server.num_connections <= config.max_workers + 1
+
+
+def test_connections_are_reused():
+    with MockHttpServer() as server:
+        mock_account_route(server)
+        address = Address.new_from_bech32(ALICE)
+
+        with ProxyNetworkProvider(server.url) as proxy:
+            for _ in range(10):
+                assert proxy.get_account(address).nonce == 7
+
+        assert len(server.requests) == 10
+        assert server.num_connections == 1
+
+
+def test_connections_are_dropped_after_idle_timeout():
+    with MockHttpServer() as server:
+        mock_account_route(server)
+        address = Address.new_from_bech32(ALICE)
+
+        config = NetworkProviderConfig(pool_idle_timeout_in_seconds=0)
+        proxy = ProxyNetworkProvider(server.url, config=config)
+        proxy.get_account(address)
+        proxy.get_account(address)
+        proxy.close()
+
+        assert server.num_connections == 2
+
+
+def test_session_remains_usable_after_close():
+    with MockHttpServer() as server:
+        mock_account_route(server)
+        address = Address.new_from_bech32(ALICE)
+
+        proxy = ProxyNetworkProvider(server.url)
+        proxy.get_account(address)
+        proxy.close()
+
+        assert proxy.get_account(address).nonce == 7
+        assert server.num_connections == 2
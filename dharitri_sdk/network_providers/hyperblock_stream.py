@@ -0,0 +1,187 @@
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (Any, Deque, Dict, Generator, Iterator, Optional, Protocol,
+                    Tuple, Union)
+
+from dharitri_sdk.network_providers.errors import HyperblockNotAvailableError
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.network_status import NetworkStatus
+
+logger = logging.getLogger("hyperblock_stream")
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_RETRIES = 3
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+
+class IHyperblockProvider(Protocol):
+    def get_network_config(self) -> NetworkConfig:
+        ...
+
+    def get_network_status(self) -> NetworkStatus:
+        ...
+
+    def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        ...
+
+
+class ICheckpointStore(Protocol):
+    def load(self) -> Optional[int]:
+        ...
+
+    def save(self, nonce: int) -> None:
+        ...
+
+
+class FileCheckpointStore:
+    """Persists the nonce of the last handled hyperblock in a file. The file is replaced atomically, thus it survives crashes."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+
+    def load(self) -> Optional[int]:
+        try:
+            return int(self.path.read_text().strip())
+        except FileNotFoundError:
+            return None
+
+    def save(self, nonce: int) -> None:
+        temporary_path = self.path.with_name(f"{self.path.name}.tmp")
+        temporary_path.write_text(str(nonce))
+        os.replace(temporary_path, self.path)
+
+
+class HyperblockStream(Iterator[Dict[str, Any]]):
+    """
+    Follows the chain hyperblock by hyperblock (by nonce), yielding the hyperblocks in order.
+
+    In "backfill" mode (far behind the tip), several hyperblocks are fetched concurrently, ahead of the consumer.
+    Once the stream reaches the highest final nonce, it switches to "tip-following" mode: the network status is polled once per round
+    (see `NetworkConfig.round_duration`), and the new hyperblocks are fetched as they become final.
+
+    If a checkpoint store is given, the nonce of each hyperblock is saved once the consumer asks for the next one (i.e. it handled the previous one),
+    and the stream resumes right after the saved nonce. Thus, after a crash, a hyperblock might be handled twice, but never skipped.
+    """
+
+    def __init__(self,
+                 provider: IHyperblockProvider,
+                 start_nonce: int = 0,
+                 checkpoint: Optional[ICheckpointStore] = None,
+                 stop_at_nonce: Optional[int] = None,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 max_retries: int = DEFAULT_MAX_RETRIES) -> None:
+        """
+        Args:
+            provider (IHyperblockProvider): Where the hyperblocks are fetched from (e.g. a `ProxyNetworkProvider`).
+            start_nonce (int): The nonce of the first hyperblock, unless there is a saved checkpoint.
+            checkpoint (Optional[ICheckpointStore]): Where the progress is saved (e.g. a `FileCheckpointStore`).
+            stop_at_nonce (Optional[int]): The nonce of the last hyperblock to yield. If not set, the stream follows the tip indefinitely (until stopped).
+            max_in_flight (int): The maximum number of hyperblocks being fetched concurrently, ahead of the consumer.
+            max_retries (int): How many times the fetch of a hyperblock is retried (one round apart) before giving up.
+        """
+        self.provider = provider
+        self.checkpoint = checkpoint
+        self.stop_at_nonce = stop_at_nonce
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+
+        saved_nonce = checkpoint.load() if checkpoint else None
+        self.next_nonce = saved_nonce + 1 if saved_nonce is not None else start_nonce
+        self.is_following_tip = False
+
+        self._round_duration_in_seconds: Optional[float] = None
+        self._stopped = threading.Event()
+        self._blocks: Generator[Dict[str, Any], None, None] = self._iterate()
+
+    def __next__(self) -> Dict[str, Any]:
+        return next(self._blocks)
+
+    def stop(self) -> None:
+        """Makes the stream end (possibly from another thread). Hyperblocks already yielded stay checkpointed."""
+        self._stopped.set()
+
+    def close(self) -> None:
+        self.stop()
+        self._blocks.close()
+
+    def _iterate(self) -> Generator[Dict[str, Any], None, None]:
+        in_flight: Deque[Tuple[int, Future[Dict[str, Any]]]] = deque()
+        next_to_fetch = self.next_nonce
+        tip = -1
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="hyperblock-stream")
+
+        try:
+            while not self._stopped.is_set():
+                while len(in_flight) < self.max_in_flight and next_to_fetch <= tip and not self._is_past_end(next_to_fetch):
+                    in_flight.append((next_to_fetch, executor.submit(self.provider.get_hyperblock, next_to_fetch)))
+                    next_to_fetch += 1
+
+                if not in_flight:
+                    if self._is_past_end(next_to_fetch):
+                        return
+
+                    tip = self._get_tip(next_to_fetch)
+                    continue
+
+                nonce, future = in_flight.popleft()
+                block = self._get_hyperblock(nonce, future)
+                if block is None:
+                    return
+
+                yield block
+
+                self.next_nonce = nonce + 1
+                if self.checkpoint:
+                    self.checkpoint.save(nonce)
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _get_tip(self, next_nonce: int) -> int:
+        tip = self.provider.get_network_status().highest_final_nonce
+
+        if tip >= next_nonce:
+            if self.is_following_tip and tip - next_nonce >= self.max_in_flight:
+                logger.info(f"Fell behind the tip (at {tip}), back to backfill mode, from {next_nonce}")
+                self.is_following_tip = False
+            return tip
+
+        if not self.is_following_tip:
+            logger.info(f"Reached the tip (at {tip}), switching to tip-following mode")
+            self.is_following_tip = True
+
+        self._stopped.wait(self._get_round_duration_in_seconds())
+        return tip
+
+    def _get_hyperblock(self, nonce: int, future: "Future[Dict[str, Any]]") -> Optional[Dict[str, Any]]:
+        attempt = 0
+
+        while True:
+            try:
+                block = future.result() if attempt == 0 else self.provider.get_hyperblock(nonce)
+                if not block:
+                    raise HyperblockNotAvailableError(nonce)
+                return block
+            except Exception as error:
+                if attempt >= self.max_retries:
+                    raise
+
+                attempt += 1
+                logger.warning(f"Could not fetch hyperblock {nonce} (attempt {attempt}): {error}")
+
+                if self._stopped.wait(self._get_round_duration_in_seconds()):
+                    return None
+
+    def _get_round_duration_in_seconds(self) -> float:
+        if self._round_duration_in_seconds is None:
+            round_duration = self.provider.get_network_config().round_duration
+            self._round_duration_in_seconds = round_duration / ONE_SECOND_IN_MILLISECONDS
+        return self._round_duration_in_seconds
+
+    def _is_past_end(self, nonce: int) -> bool:
+        return self.stop_at_nonce is not None and nonce > self.stop_at_nonce
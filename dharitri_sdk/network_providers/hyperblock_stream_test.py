@@ -0,0 +1,128 @@
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Union
+
+import pytest
+
+from dharitri_sdk.network_providers.errors import HyperblockNotAvailableError
+from dharitri_sdk.network_providers.hyperblock_stream import (
+    FileCheckpointStore, HyperblockStream)
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.network_status import NetworkStatus
+
+
+class FakeChain:
+    def __init__(self, tip: int, round_duration: int = 20, fetch_delay_in_seconds: float = 0) -> None:
+        self.tip = tip
+        self.round_duration = round_duration
+        self.fetch_delay_in_seconds = fetch_delay_in_seconds
+        self.failing_nonces: Set[int] = set()
+        self.fetched_nonces: List[int] = []
+        self.num_in_flight = 0
+        self.max_num_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get_network_config(self) -> NetworkConfig:
+        network_config = NetworkConfig()
+        network_config.round_duration = self.round_duration
+        return network_config
+
+    def get_network_status(self) -> NetworkStatus:
+        network_status = NetworkStatus()
+        network_status.highest_final_nonce = self.tip
+        return network_status
+
+    def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+        nonce = int(key)
+
+        with self.lock:
+            self.fetched_nonces.append(nonce)
+            self.num_in_flight += 1
+            self.max_num_in_flight = max(self.max_num_in_flight, self.num_in_flight)
+
+        time.sleep(self.fetch_delay_in_seconds)
+
+        with self.lock:
+            self.num_in_flight -= 1
+
+            if nonce in self.failing_nonces:
+                self.failing_nonces.remove(nonce)
+                raise Exception("unavailable")
+
+        return {"nonce": nonce, "hash": f"{nonce:064x}"}
+
+
+def test_backfill_yields_blocks_in_order_with_pipelining():
+    chain = FakeChain(tip=50, fetch_delay_in_seconds=0.01)
+    stream = HyperblockStream(chain, start_nonce=1, stop_at_nonce=50, max_in_flight=4)
+
+    nonces = [block["nonce"] for block in stream]
+
+    assert nonces == list(range(1, 51))
+    assert 1 < chain.max_num_in_flight <= 4
+
+
+def test_follows_the_tip():
+    chain = FakeChain(tip=5)
+    stream = HyperblockStream(chain, start_nonce=1, stop_at_nonce=12)
+    nonces: List[int] = []
+
+    for block in stream:
+        nonces.append(block["nonce"])
+
+        if block["nonce"] == 5:
+            assert not stream.is_following_tip
+            threading.Timer(0.05, lambda: setattr(chain, "tip", 12)).start()
+
+    assert nonces == list(range(1, 13))
+    assert stream.is_following_tip
+
+
+def test_resumes_from_checkpoint(tmp_path: Path):
+    chain = FakeChain(tip=100)
+    checkpoint = FileCheckpointStore(tmp_path / "checkpoint")
+
+    stream = HyperblockStream(chain, start_nonce=10, checkpoint=checkpoint)
+    for block in stream:
+        if block["nonce"] == 20:
+            break
+    stream.close()
+
+    # the last block was not acknowledged (the consumer did not ask for the next one)
+    assert checkpoint.load() == 19
+
+    stream = HyperblockStream(chain, start_nonce=10, checkpoint=FileCheckpointStore(tmp_path / "checkpoint"), stop_at_nonce=25)
+    assert [block["nonce"] for block in stream] == [20, 21, 22, 23, 24, 25]
+    assert checkpoint.load() == 25
+
+
+def test_failed_fetches_are_retried():
+    chain = FakeChain(tip=5, round_duration=1)
+    chain.failing_nonces = {3}
+    stream = HyperblockStream(chain, start_nonce=1, stop_at_nonce=5)
+
+    assert [block["nonce"] for block in stream] == [1, 2, 3, 4, 5]
+    assert chain.fetched_nonces.count(3) == 2
+
+
+def test_missing_blocks_eventually_fail_the_stream():
+    class EmptyChain(FakeChain):
+        def get_hyperblock(self, key: Union[int, str]) -> Dict[str, Any]:
+            return {}
+
+    stream = HyperblockStream(EmptyChain(tip=5, round_duration=1), start_nonce=1, max_retries=2)
+
+    with pytest.raises(HyperblockNotAvailableError):
+        next(stream)
+
+
+def test_can_be_stopped_while_following_the_tip():
+    chain = FakeChain(tip=3, round_duration=10_000)
+    stream = HyperblockStream(chain, start_nonce=1)
+
+    threading.Timer(0.1, stream.stop).start()
+    start = time.monotonic()
+
+    assert [block["nonce"] for block in stream] == [1, 2, 3]
+    assert time.monotonic() - start < 1
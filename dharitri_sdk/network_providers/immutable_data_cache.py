@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Protocol, Tuple, Union
+
+DEFAULT_MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+
+class IImmutableDataStore(Protocol):
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    def put(self, key: str, value: bytes) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class ImmutableDataCache:
+    """
+    A two-tier cache for on-chain data that never changes once finalized (e.g. completed transactions, hyperblocks fetched by hash).
+
+    The first tier is an in-memory LRU, bounded by the total size (in bytes) of the serialized payloads.
+    The second (optional) tier is a persistent store (see `SQLiteImmutableDataStore` and `FileImmutableDataStore`), which survives across runs.
+    Entries read from the persistent store are promoted to the in-memory tier.
+
+    The cached payloads are the (decoded) JSON payloads returned by the network, and they are shared among readers: they must not be mutated.
+    The cache does not decide what is final; the network providers only put finalized items in it.
+    """
+
+    def __init__(self,
+                 memory_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+                 store: Optional[IImmutableDataStore] = None) -> None:
+        """
+        Args:
+            memory_max_bytes (int): The maximum total size of the payloads held in memory. Least recently used entries are evicted first.
+            store (Optional[IImmutableDataStore]): The persistent store, consulted on memory misses. If not set, the cache is memory-only.
+        """
+        self.memory_max_bytes = memory_max_bytes
+        self.store = store
+
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        if self.store is None:
+            return None
+
+        data = self.store.get(key)
+        if data is None:
+            return None
+
+        payload: Dict[str, Any] = json.loads(data)
+        self._put_in_memory(key, payload, len(data))
+        return payload
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        self._put_in_memory(key, payload, len(data))
+
+        if self.store is not None:
+            self.store.put(key, data)
+
+    def get_memory_size(self) -> int:
+        return self._memory_size
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memory_size = 0
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
+
+    def _put_in_memory(self, key: str, payload: Dict[str, Any], size: int) -> None:
+        if size > self.memory_max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._memory_size -= previous[1]
+
+            self._entries[key] = (payload, size)
+            self._memory_size += size
+
+            while self._memory_size > self.memory_max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory_size -= evicted_size
+
+
+class SQLiteImmutableDataStore:
+    """A persistent store backed by a single SQLite database file."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class FileImmutableDataStore:
+    """A persistent store holding one file per entry, within a directory."""
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._get_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, value: bytes) -> None:
+        path = self._get_path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        # Write, then rename, so that concurrent readers never see a partially written entry.
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temporary_path.write_bytes(value)
+        os.replace(temporary_path, path)
+
+    def close(self) -> None:
+        pass
+
+    def _get_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / digest
@@ -0,0 +1,181 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from dharitri_sdk.network_providers.api_network_provider import \
+    ApiNetworkProvider
+from dharitri_sdk.network_providers.async_api_network_provider import \
+    AsyncApiNetworkProvider
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.immutable_data_cache import (
+    FileImmutableDataStore, ImmutableDataCache, SQLiteImmutableDataStore)
+from dharitri_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+TX_HASH = "9d47c4b4669cbcaa26f5dec79902dd20e55a0aa5f4b92454a74e7dbd0183ad6c"
+BLOCK_HASH = "d84a9ca8d1ad4b6b5a5ba8d3c1efdb1a2e5b0b6d6c2f6a2e2d6b1a9c1e5d4f3a"
+
+
+def test_memory_tier_evicts_least_recently_used_entries():
+    cache = ImmutableDataCache(memory_max_bytes=30)
+
+    cache.put("a", {"v": "a" * 4})
+    cache.put("b", {"v": "b" * 4})
+    cache.get("a")
+    cache.put("c", {"v": "c" * 4})
+
+    assert cache.get("a") == {"v": "aaaa"}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"v": "cccc"}
+    assert cache.get_memory_size() <= 30
+
+
+def test_too_large_payloads_are_not_held_in_memory():
+    cache = ImmutableDataCache(memory_max_bytes=10)
+    cache.put("a", {"v": "a" * 100})
+
+    assert cache.get("a") is None
+    assert cache.get_memory_size() == 0
+
+
+@pytest.mark.parametrize("store_type", ["sqlite", "file"])
+def test_persistent_store_survives_across_instances(tmp_path: Path, store_type: str):
+    def create_store():
+        if store_type == "sqlite":
+            return SQLiteImmutableDataStore(tmp_path / "cache.sqlite")
+        return FileImmutableDataStore(tmp_path / "cache")
+
+    cache = ImmutableDataCache(store=create_store())
+    cache.put("proxy/transaction/abba", {"transaction": {"nonce": 7}, "processStatus": "success"})
+    cache.close()
+
+    cache = ImmutableDataCache(store=create_store())
+    assert cache.get("proxy/transaction/abba") == {"transaction": {"nonce": 7}, "processStatus": "success"}
+    assert cache.get("proxy/transaction/acdc") is None
+
+    # promoted to the memory tier
+    assert cache.get_memory_size() > 0
+    cache.close()
+
+
+def test_proxy_caches_completed_transactions_only():
+    with MockHttpServer() as server:
+        transaction = {"data": {"transaction": {"nonce": 7, "status": "success"}}, "code": "successful"}
+        pending = {"data": {"status": "pending"}, "code": "successful"}
+        success = {"data": {"status": "success"}, "code": "successful"}
+
+        server.mock_route("GET", f"/transaction/{TX_HASH}", MockHttpResponse(transaction))
+        server.mock_route("GET", f"/transaction/{TX_HASH}/process-status", MockHttpResponse(pending))
+
+        cache = ImmutableDataCache()
+        proxy = ProxyNetworkProvider(server.url, config=NetworkProviderConfig(immutable_data_cache=cache))
+
+        assert not proxy.get_transaction(TX_HASH, with_process_status=True).is_completed
+        assert not proxy.get_transaction(TX_HASH, with_process_status=True).is_completed
+        assert len(server.requests) == 4
+
+        server.mock_route("GET", f"/transaction/{TX_HASH}/process-status", MockHttpResponse(success))
+
+        assert proxy.get_transaction(TX_HASH, with_process_status=True).is_completed
+        assert proxy.get_transaction(TX_HASH).is_completed
+        [result] = proxy.get_transactions([TX_HASH], with_process_status=True)
+        assert result.transaction is not None and result.transaction.nonce == 7
+        assert len(server.requests) == 6
+        proxy.close()
+
+
+def test_proxy_caches_hyperblocks_fetched_by_hash():
+    with MockHttpServer() as server:
+        hyperblock = {"data": {"hyperblock": {"hash": BLOCK_HASH, "nonce": 42}}, "code": "successful"}
+        server.mock_route("GET", f"/hyperblock/by-hash/{BLOCK_HASH}", MockHttpResponse(hyperblock))
+        server.mock_route("GET", "/hyperblock/by-nonce/42", MockHttpResponse(hyperblock))
+
+        proxy = ProxyNetworkProvider(server.url, config=NetworkProviderConfig(immutable_data_cache=ImmutableDataCache()))
+
+        assert proxy.get_hyperblock(BLOCK_HASH)["nonce"] == 42
+        assert proxy.get_hyperblock(BLOCK_HASH)["nonce"] == 42
+        assert proxy.get_hyperblock(42)["nonce"] == 42
+        assert proxy.get_hyperblock(42)["nonce"] == 42
+        assert [request.path for request in server.requests] == [f"/hyperblock/by-hash/{BLOCK_HASH}", "/hyperblock/by-nonce/42", "/hyperblock/by-nonce/42"]
+        proxy.close()
+
+
+def test_providers_of_different_networks_can_share_the_cache():
+    with MockHttpServer() as mainnet, MockHttpServer() as devnet:
+        for server, nonce in [(mainnet, 7), (devnet, 8)]:
+            transaction = {"data": {"transaction": {"nonce": nonce, "status": "success"}}, "code": "successful"}
+            hyperblock = {"data": {"hyperblock": {"hash": BLOCK_HASH, "nonce": nonce}}, "code": "successful"}
+            server.mock_route("GET", f"/transaction/{TX_HASH}", MockHttpResponse(transaction))
+            server.mock_route("GET", f"/transaction/{TX_HASH}/process-status", MockHttpResponse({"data": {"status": "success"}}))
+            server.mock_route("GET", f"/hyperblock/by-hash/{BLOCK_HASH}", MockHttpResponse(hyperblock))
+            server.mock_route("GET", f"/transactions/{TX_HASH}", MockHttpResponse({"txHash": TX_HASH, "status": "success", "nonce": nonce}))
+
+        config = NetworkProviderConfig(immutable_data_cache=ImmutableDataCache())
+        providers = [(ProxyNetworkProvider(mainnet.url, config=config), ApiNetworkProvider(mainnet.url, config=config), 7),
+                     (ProxyNetworkProvider(devnet.url, config=config), ApiNetworkProvider(devnet.url, config=config), 8)]
+
+        for _ in range(2):
+            for proxy, api, nonce in providers:
+                assert proxy.get_transaction(TX_HASH, with_process_status=True).nonce == nonce
+                assert proxy.get_hyperblock(BLOCK_HASH)["nonce"] == nonce
+                assert api.get_transaction(TX_HASH).nonce == nonce
+
+        # each network is only asked once
+        assert len(mainnet.requests) == len(devnet.requests) == 4
+
+        for proxy, api, _ in providers:
+            proxy.close()
+            api.close()
+
+
+def test_api_caches_completed_transactions_only():
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/transactions/{TX_HASH}", MockHttpResponse({"txHash": TX_HASH, "status": "success", "pendingResults": True}))
+
+        api = ApiNetworkProvider(server.url, config=NetworkProviderConfig(immutable_data_cache=ImmutableDataCache()))
+
+        api.get_transaction(TX_HASH)
+        api.get_transaction(TX_HASH)
+        assert len(server.requests) == 2
+
+        server.mock_route("GET", f"/transactions/{TX_HASH}", MockHttpResponse({"txHash": TX_HASH, "status": "success"}))
+
+        api.get_transaction(TX_HASH)
+        assert api.get_transaction(TX_HASH).status.is_successful()
+        assert len(server.requests) == 3
+        api.close()
+
+
+def test_async_providers_use_the_cache():
+    with MockHttpServer() as server:
+        transaction = {"data": {"transaction": {"nonce": 7, "status": "success"}}, "code": "successful"}
+        success = {"data": {"status": "success"}, "code": "successful"}
+        hyperblock = {"data": {"hyperblock": {"hash": BLOCK_HASH, "nonce": 42}}, "code": "successful"}
+
+        server.mock_route("GET", f"/transaction/{TX_HASH}", MockHttpResponse(transaction))
+        server.mock_route("GET", f"/transaction/{TX_HASH}/process-status", MockHttpResponse(success))
+        server.mock_route("GET", f"/hyperblock/by-hash/{BLOCK_HASH}", MockHttpResponse(hyperblock))
+        server.mock_route("GET", f"/transactions/{TX_HASH}", MockHttpResponse({"txHash": TX_HASH, "status": "success"}))
+
+        config = NetworkProviderConfig(immutable_data_cache=ImmutableDataCache())
+
+        async def run() -> None:
+            async with AsyncProxyNetworkProvider(server.url, config=config) as proxy:
+                for _ in range(2):
+                    assert (await proxy.get_transaction(TX_HASH, with_process_status=True)).nonce == 7
+                    assert (await proxy.get_hyperblock(BLOCK_HASH))["nonce"] == 42
+
+            async with AsyncApiNetworkProvider(server.url, config=config) as api:
+                for _ in range(2):
+                    assert (await api.get_transaction(TX_HASH)).status.is_successful()
+
+        asyncio.run(run())
+
+        assert sorted(request.path for request in server.requests) == sorted([
+            f"/transaction/{TX_HASH}", f"/transaction/{TX_HASH}/process-status", f"/hyperblock/by-hash/{BLOCK_HASH}", f"/transactions/{TX_HASH}"
+        ])
@@ -0,0 +1,212 @@
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+import requests
+from requests.auth import AuthBase
+
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import (CircuitBreakerOpenError,
+                                                   GenericError)
+from dharitri_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from dharitri_sdk.network_providers.resources import GenericResponse
+from dharitri_sdk.network_providers.retry_policy import RetryPolicy
+
+DEFAULT_UNHEALTHY_COOLDOWN_IN_SECONDS = 5
+DEFAULT_ERROR_RATE_HALF_LIFE_IN_SECONDS = 60
+EWMA_WEIGHT = 0.2
+ERROR_RATE_PENALTY = 10
+
+
+class EndpointStats:
+    """Rolling (exponentially weighted) latency and error rate of an endpoint."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.latency: Optional[float] = None
+        self.error_rate: float = 0
+        self.updated_at: float = 0
+        self.unhealthy_until: float = 0
+        self.num_requests: int = 0
+        self.num_failures: int = 0
+
+    def get_error_rate(self, now: float, half_life_in_seconds: float) -> float:
+        """The error rate fades away over time, so that an endpoint which recovered gets traffic again."""
+        return self.error_rate * 0.5 ** ((now - self.updated_at) / half_life_in_seconds)
+
+    def get_score(self, now: float, half_life_in_seconds: float) -> float:
+        """Lower is better. Endpoints without any latency sample score best, so that they get explored."""
+        latency = self.latency or 0
+        return latency * (1 + ERROR_RATE_PENALTY * self.get_error_rate(now, half_life_in_seconds))
+
+
+class MultiEndpointNetworkProvider(ProxyNetworkProvider):
+    """
+    A `ProxyNetworkProvider` backed by several (equivalent) proxy URLs. Since the requests use the routes of the proxy, API URLs are not supported.
+
+    Each request is routed to the healthiest endpoint, according to a rolling latency and error rate score.
+    If the endpoint fails (connection error, timeout, 5xx or 429 response), a GET request transparently fails over to the next one.
+    POST requests only fail over if `failover_idempotent_posts` is set, and only for the idempotent resources of the retry policy
+    (see `RetryPolicy.idempotent_post_resources`, e.g. `vm-values/query`): for instance, `transaction/send` is never sent to a second endpoint,
+    since the first one might have received the transaction before failing.
+    Optionally, slow reads are hedged: if an answer does not come within `hedge_after_in_seconds`, the request is also sent to the next endpoint,
+    and the first answer wins.
+
+    Since it exposes the same methods as `ProxyNetworkProvider`, it can be used wherever the latter is used.
+    """
+
+    def __init__(
+            self,
+            urls: Sequence[str],
+            auth: Union[AuthBase, None] = None,
+            address_hrp: Optional[str] = None,
+            config: Optional[NetworkProviderConfig] = None,
+            hedge_after_in_seconds: Optional[float] = None,
+            failover_idempotent_posts: bool = False,
+            unhealthy_cooldown_in_seconds: float = DEFAULT_UNHEALTHY_COOLDOWN_IN_SECONDS,
+            error_rate_half_life_in_seconds: float = DEFAULT_ERROR_RATE_HALF_LIFE_IN_SECONDS
+    ) -> None:
+        """
+        Args:
+            urls (Sequence[str]): The URLs of the endpoints (proxies).
+            auth (Union[AuthBase, None]): The authentication used for all endpoints.
+            address_hrp (Optional[str]): The human-readable part of the addresses.
+            config (Optional[NetworkProviderConfig]): The configuration, shared by all endpoints (e.g. the pool settings are per host).
+            hedge_after_in_seconds (Optional[float]): If set, a GET request still pending after this delay is also sent to the next endpoint.
+            failover_idempotent_posts (bool): Whether the POST requests to idempotent resources (e.g. `vm-values/query`) fail over to the next endpoint, too.
+            unhealthy_cooldown_in_seconds (float): After a failure, an endpoint is only used if all other endpoints are unhealthy, for this long.
+            error_rate_half_life_in_seconds (float): How fast the error rate of an endpoint fades away.
+        """
+        if not urls:
+            raise ValueError("at least one URL is required")
+
+        super().__init__(urls[0], auth, address_hrp, config)
+
+        self.endpoints = [EndpointStats(url.rstrip("/")) for url in urls]
+        self.hedge_after_in_seconds = hedge_after_in_seconds
+        self.failover_idempotent_posts = failover_idempotent_posts
+        self.post_retry_policy = self.config.retry_policy or RetryPolicy()
+        self.unhealthy_cooldown_in_seconds = unhealthy_cooldown_in_seconds
+        self.error_rate_half_life_in_seconds = error_rate_half_life_in_seconds
+
+        self._stats_lock = threading.Lock()
+        self._hedging_executor: Optional[ThreadPoolExecutor] = None
+
+    def do_get_generic(self, resource_url: str) -> GenericResponse:
+        return self._with_failover(lambda endpoint: self.do_get(f"{endpoint.url}/{resource_url}"), can_hedge=True, can_fail_over=True)
+
+    def do_post_generic(self, resource_url: str, payload: Any) -> GenericResponse:
+        can_fail_over = self.failover_idempotent_posts and self.post_retry_policy.is_idempotent_post(resource_url)
+        return self._with_failover(lambda endpoint: self.do_post(f"{endpoint.url}/{resource_url}", payload), can_hedge=False, can_fail_over=can_fail_over)
+
+    def close(self) -> None:
+        with self._executor_lock:
+            if self._hedging_executor is not None:
+                self._hedging_executor.shutdown(wait=False)
+                self._hedging_executor = None
+
+        super().close()
+
+    def get_ranked_endpoints(self) -> List[EndpointStats]:
+        """The endpoints, best first. The ones in their "unhealthy" cooldown come last."""
+        now = time.monotonic()
+
+        with self._stats_lock:
+            return sorted(self.endpoints, key=lambda endpoint: (
+                endpoint.unhealthy_until > now,
+                endpoint.get_score(now, self.error_rate_half_life_in_seconds)
+            ))
+
+    def _with_failover(self, request: Callable[[EndpointStats], GenericResponse], can_hedge: bool, can_fail_over: bool) -> GenericResponse:
+        remaining = self.get_ranked_endpoints()
+        if not can_fail_over:
+            return self._timed(request, remaining[0])
+
+        last_error: Optional[GenericError] = None
+
+        while remaining:
+            endpoint = remaining.pop(0)
+
+            try:
+                if can_hedge and self.hedge_after_in_seconds is not None and remaining:
+                    return self._hedged(request, endpoint, remaining)
+                return self._timed(request, endpoint)
+            except GenericError as error:
+                if not is_endpoint_failure(error):
+                    raise
+                last_error = error
+
+        assert last_error is not None
+        raise last_error
+
+    def _hedged(self, request: Callable[[EndpointStats], GenericResponse], primary: EndpointStats, remaining: List[EndpointStats]) -> GenericResponse:
+        executor = self._get_hedging_executor()
+        pending = {executor.submit(self._timed, request, primary)}
+
+        done, _ = wait(pending, timeout=self.hedge_after_in_seconds)
+        if not done:
+            pending.add(executor.submit(self._timed, request, remaining.pop(0)))
+
+        errors: List[GenericError] = []
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+                if not isinstance(error, GenericError) or not is_endpoint_failure(error):
+                    raise error
+                errors.append(error)
+
+        raise errors[-1]
+
+    def _timed(self, request: Callable[[EndpointStats], GenericResponse], endpoint: EndpointStats) -> GenericResponse:
+        start = time.monotonic()
+
+        try:
+            response = request(endpoint)
+        except GenericError as error:
+            self._record(endpoint, time.monotonic() - start, is_failure=is_endpoint_failure(error))
+            raise
+
+        self._record(endpoint, time.monotonic() - start, is_failure=False)
+        return response
+
+    def _record(self, endpoint: EndpointStats, latency: float, is_failure: bool) -> None:
+        now = time.monotonic()
+
+        with self._stats_lock:
+            error_rate = endpoint.get_error_rate(now, self.error_rate_half_life_in_seconds)
+            endpoint.error_rate = error_rate + EWMA_WEIGHT * ((1 if is_failure else 0) - error_rate)
+            endpoint.updated_at = now
+            endpoint.num_requests += 1
+
+            if is_failure:
+                endpoint.num_failures += 1
+                endpoint.unhealthy_until = now + self.unhealthy_cooldown_in_seconds
+            elif endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency += EWMA_WEIGHT * (latency - endpoint.latency)
+
+    def _get_hedging_executor(self) -> ThreadPoolExecutor:
+        # Hedged requests run on a pool of their own: they may be issued from the workers of the main pool (e.g. by `get_transactions()`).
+        with self._executor_lock:
+            if self._hedging_executor is None:
+                self._hedging_executor = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="hedging")
+            return self._hedging_executor
+
+
+def is_endpoint_failure(error: GenericError) -> bool:
+    """Tells whether the error is due to the endpoint (and not due to the request itself), so that another endpoint could be tried."""
+    cause = error.__context__
+
+    if isinstance(cause, requests.HTTPError):
+        status_code = cause.response.status_code if cause.response is not None else 0
+        return status_code >= 500 or status_code == 429
+
+    return isinstance(cause, (requests.ConnectionError, requests.Timeout, requests.JSONDecodeError, CircuitBreakerOpenError))
@@ -0,0 +1,151 @@
+import time
+
+import pytest
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.multi_endpoint_network_provider import \
+    MultiEndpointNetworkProvider
+from dharitri_sdk.network_providers.transaction_awaiter import \
+    TransactionAwaiter
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+TX_HASH = "9d47c4b4669cbcaa26f5dec79902dd20e55a0aa5f4b92454a74e7dbd0183ad6c"
+
+
+def account_response(nonce: int, delay_in_seconds: float = 0) -> MockHttpResponse:
+    payload = {"data": {"account": {"address": ALICE, "nonce": nonce}}, "code": "successful"}
+    return MockHttpResponse(payload, delay_in_seconds=delay_in_seconds)
+
+
+def get_dead_url() -> str:
+    server = MockHttpServer().start()
+    server.stop()
+    return server.url
+
+
+def test_fails_over_to_a_healthy_endpoint():
+    with MockHttpServer() as unhealthy, MockHttpServer() as healthy:
+        unhealthy.mock_route("GET", f"/address/{ALICE}", MockHttpResponse(status=502))
+        healthy.mock_route("GET", f"/address/{ALICE}", account_response(7))
+
+        provider = MultiEndpointNetworkProvider([get_dead_url(), unhealthy.url, healthy.url])
+        address = Address.new_from_bech32(ALICE)
+
+        assert provider.get_account(address).nonce == 7
+        assert provider.get_account(address).nonce == 7
+
+        # the unhealthy endpoints are not tried again, while in cooldown
+        assert len(unhealthy.requests) == 1
+        assert len(healthy.requests) == 2
+        assert provider.get_ranked_endpoints()[0].url == healthy.url
+        provider.close()
+
+
+def test_application_errors_do_not_fail_over():
+    with MockHttpServer() as first, MockHttpServer() as second:
+        not_found = MockHttpResponse({"error": "transaction not found", "code": "internal_issue"})
+        first.mock_route("GET", f"/transaction/{TX_HASH}", not_found)
+        second.mock_route("GET", f"/transaction/{TX_HASH}", not_found)
+
+        provider = MultiEndpointNetworkProvider([first.url, second.url])
+
+        with pytest.raises(GenericError):
+            provider.get_transaction(TX_HASH)
+
+        assert len(first.requests) + len(second.requests) == 1
+        provider.close()
+
+
+def test_error_is_raised_when_all_endpoints_fail():
+    provider = MultiEndpointNetworkProvider([get_dead_url(), get_dead_url()])
+
+    with pytest.raises(GenericError):
+        provider.get_account(Address.new_from_bech32(ALICE))
+
+    assert all(endpoint.num_failures == 1 for endpoint in provider.endpoints)
+    provider.close()
+
+
+def test_only_idempotent_posts_fail_over_if_enabled():
+    with MockHttpServer() as unhealthy, MockHttpServer() as healthy:
+        query_response = MockHttpResponse({"data": {"data": {"returnData": [], "returnCode": "ok"}}, "code": "successful"})
+        send_response = MockHttpResponse({"data": {"txHash": TX_HASH}, "code": "successful"})
+        unhealthy.mock_route("POST", "/vm-values/query", MockHttpResponse(status=502))
+        unhealthy.mock_route("POST", "/transaction/send", MockHttpResponse(status=502))
+        healthy.mock_route("POST", "/vm-values/query", query_response)
+        healthy.mock_route("POST", "/transaction/send", send_response)
+
+        # by default, POST requests do not fail over
+        provider = MultiEndpointNetworkProvider([unhealthy.url, healthy.url])
+        with pytest.raises(GenericError):
+            provider.do_post_generic("vm-values/query", {})
+        provider.close()
+
+        provider = MultiEndpointNetworkProvider([unhealthy.url, healthy.url], failover_idempotent_posts=True)
+        assert provider.do_post_generic("vm-values/query", {}).get("data") == {"returnData": [], "returnCode": "ok"}
+        provider.close()
+
+        # sending a transaction is not idempotent
+        provider = MultiEndpointNetworkProvider([unhealthy.url, healthy.url], failover_idempotent_posts=True)
+        with pytest.raises(GenericError):
+            provider.do_post_generic("transaction/send", {})
+        provider.close()
+
+        assert [request.path for request in healthy.requests] == ["/vm-values/query"]
+
+
+def test_routes_to_the_fastest_endpoint():
+    with MockHttpServer() as slow, MockHttpServer() as fast:
+        slow.mock_route("GET", f"/address/{ALICE}", account_response(1, delay_in_seconds=0.1))
+        fast.mock_route("GET", f"/address/{ALICE}", account_response(2))
+
+        provider = MultiEndpointNetworkProvider([slow.url, fast.url])
+        address = Address.new_from_bech32(ALICE)
+
+        nonces = [provider.get_account(address).nonce for _ in range(10)]
+
+        # each endpoint is explored once, then the fastest one is preferred
+        assert sorted(nonces[:2]) == [1, 2]
+        assert nonces[2:] == [2] * 8
+        provider.close()
+
+
+def test_slow_reads_are_hedged():
+    with MockHttpServer() as slow, MockHttpServer() as fast:
+        slow.mock_route("GET", f"/address/{ALICE}", account_response(1, delay_in_seconds=1))
+        fast.mock_route("GET", f"/address/{ALICE}", account_response(2))
+
+        provider = MultiEndpointNetworkProvider([slow.url, fast.url], hedge_after_in_seconds=0.05)
+
+        start = time.monotonic()
+        account = provider.get_account(Address.new_from_bech32(ALICE))
+
+        assert account.nonce == 2
+        assert time.monotonic() - start < 0.5
+        assert len(slow.requests) == 1
+        provider.close()
+
+
+def test_can_be_used_by_the_transaction_awaiter():
+    with MockHttpServer() as server:
+        transaction = {"data": {"transaction": {"nonce": 1, "status": "success"}}, "code": "successful"}
+        server.mock_route("GET", f"/transaction/{TX_HASH}", MockHttpResponse(transaction))
+        server.mock_route("GET", f"/transaction/{TX_HASH}/process-status", MockHttpResponse({"data": {"status": "success"}}))
+
+        provider = MultiEndpointNetworkProvider([get_dead_url(), server.url])
+
+        class Fetcher:
+            def get_transaction(self, tx_hash: str):
+                return provider.get_transaction(tx_hash, with_process_status=True)
+
+        awaiter = TransactionAwaiter(Fetcher(), polling_interval_in_milliseconds=10, timeout_interval_in_milliseconds=100)
+        assert awaiter.await_completed(TX_HASH).status.is_successful()
+        provider.close()
+
+
+def test_requires_urls():
+    with pytest.raises(ValueError):
+        MultiEndpointNetworkProvider([])
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import (Any, Awaitable, Callable, Dict, Optional, Set, Tuple,
+                    TypeVar)
+
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+
+logger = logging.getLogger("network_metadata_cache")
+
+T = TypeVar("T")
+
+DEFAULT_ROUND_DURATION_IN_MILLISECONDS = 6000
+DEFAULT_ROUNDS_PER_EPOCH = 2400
+ONE_SECOND_IN_MILLISECONDS = 1000
+
+
+class CacheEntry:
+    def __init__(self, value: Any, ttl_in_seconds: float) -> None:
+        self.value = value
+        self.ttl_in_seconds = ttl_in_seconds
+        self.fetched_at = time.monotonic()
+        self.is_refreshing = False
+
+    def get_age(self, now: float) -> float:
+        return now - self.fetched_at
+
+
+class NetworkMetadataCache:
+    """
+    Caches network metadata (network config, gas configs, network status), keyed by resource.
+
+    The network config and the gas configs only change between epochs, thus they live for the duration of an epoch.
+    The network status changes every round, thus it lives for the duration of a round.
+    The durations are learned from the (cached) `NetworkConfig` itself (`round_duration`, `rounds_per_epoch`).
+
+    With "stale-while-revalidate", an expired entry is still served (for another TTL), while it is refreshed in the background.
+
+    The `*_async` methods are the asyncio counterparts (used by the async providers): they take coroutine functions as fetchers,
+    and refresh the expired entries in tasks (on the running event loop), instead of threads.
+    """
+
+    def __init__(self,
+                 stale_while_revalidate: bool = True,
+                 round_duration_in_milliseconds: int = DEFAULT_ROUND_DURATION_IN_MILLISECONDS,
+                 rounds_per_epoch: int = DEFAULT_ROUNDS_PER_EPOCH) -> None:
+        """
+        Args:
+            stale_while_revalidate (bool): Whether to serve expired entries (for at most another TTL) while refreshing them in the background.
+            round_duration_in_milliseconds (int): The duration of a round, used until a network config is fetched.
+            rounds_per_epoch (int): The number of rounds in an epoch, used until a network config is fetched.
+        """
+        self.stale_while_revalidate = stale_while_revalidate
+        self.round_duration_in_milliseconds = round_duration_in_milliseconds
+        self.rounds_per_epoch = rounds_per_epoch
+
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._refresh_tasks: Set["asyncio.Task[None]"] = set()
+
+    def get_network_config(self, key: str, fetch: Callable[[], NetworkConfig]) -> NetworkConfig:
+        def fetch_and_observe() -> NetworkConfig:
+            network_config = fetch()
+            self.observe_network_config(network_config)
+            return network_config
+
+        return self.get(key, fetch_and_observe, self.get_epoch_ttl)
+
+    def get_network_gas_configs(self, key: str, fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        return self.get(key, fetch, self.get_epoch_ttl)
+
+    def get_network_status(self, key: str, fetch: Callable[[], T]) -> T:
+        return self.get(key, fetch, self.get_round_ttl)
+
+    async def get_network_config_async(self, key: str, fetch: Callable[[], Awaitable[NetworkConfig]]) -> NetworkConfig:
+        async def fetch_and_observe() -> NetworkConfig:
+            network_config = await fetch()
+            self.observe_network_config(network_config)
+            return network_config
+
+        return await self.get_async(key, fetch_and_observe, self.get_epoch_ttl)
+
+    async def get_network_gas_configs_async(self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        return await self.get_async(key, fetch, self.get_epoch_ttl)
+
+    async def get_network_status_async(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        return await self.get_async(key, fetch, self.get_round_ttl)
+
+    def observe_network_config(self, network_config: NetworkConfig) -> None:
+        """Learns the round duration and the epoch length from a network config (zero values are ignored)."""
+        if network_config.round_duration:
+            self.round_duration_in_milliseconds = network_config.round_duration
+        if network_config.rounds_per_epoch:
+            self.rounds_per_epoch = network_config.rounds_per_epoch
+
+    def get_round_ttl(self) -> float:
+        return self.round_duration_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+
+    def get_epoch_ttl(self) -> float:
+        return self.get_round_ttl() * self.rounds_per_epoch
+
+    def get(self, key: str, fetch: Callable[[], T], get_ttl: Callable[[], float]) -> T:
+        entry, should_refresh = self._lookup(key)
+
+        if entry is not None:
+            if should_refresh:
+                threading.Thread(target=self._refresh, args=(key, fetch, get_ttl), daemon=True).start()
+            return entry.value
+
+        value = fetch()
+        self._put(key, value, get_ttl())
+        return value
+
+    async def get_async(self, key: str, fetch: Callable[[], Awaitable[T]], get_ttl: Callable[[], float]) -> T:
+        entry, should_refresh = self._lookup(key)
+
+        if entry is not None:
+            if should_refresh:
+                # A reference to the task is held until it completes (the event loop only keeps weak references to tasks).
+                task = asyncio.ensure_future(self._refresh_async(key, fetch, get_ttl))
+                self._refresh_tasks.add(task)
+                task.add_done_callback(self._refresh_tasks.discard)
+            return entry.value
+
+        value = await fetch()
+        self._put(key, value, get_ttl())
+        return value
+
+    def invalidate(self, resource: Optional[str] = None) -> None:
+        """Drops the entries of the given resource (e.g. `network/status`, for the statuses of all shards), or all entries."""
+        with self._lock:
+            if resource is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if _is_key_of_resource(key, resource)]:
+                del self._entries[key]
+
+    def _lookup(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Returns the entry (if it can still be served) and whether it should be refreshed (by the caller)."""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+
+            age = entry.get_age(now)
+            if age < entry.ttl_in_seconds:
+                return entry, False
+
+            if self.stale_while_revalidate and age < 2 * entry.ttl_in_seconds:
+                should_refresh = not entry.is_refreshing
+                entry.is_refreshing = True
+                return entry, should_refresh
+
+            return None, False
+
+    def _refresh(self, key: str, fetch: Callable[[], Any], get_ttl: Callable[[], float]) -> None:
+        try:
+            value = fetch()
+        except Exception as error:
+            self._on_refresh_failed(key, error)
+            return
+
+        self._put(key, value, get_ttl())
+
+    async def _refresh_async(self, key: str, fetch: Callable[[], Awaitable[Any]], get_ttl: Callable[[], float]) -> None:
+        try:
+            value = await fetch()
+        except Exception as error:
+            self._on_refresh_failed(key, error)
+            return
+
+        self._put(key, value, get_ttl())
+
+    def _on_refresh_failed(self, key: str, error: Exception) -> None:
+        logger.warning(f"Could not refresh [{key}]: {error}")
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.is_refreshing = False
+
+    def _put(self, key: str, value: Any, ttl_in_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(value, ttl_in_seconds)
+
+
+def _is_key_of_resource(key: str, resource: str) -> bool:
+    # The keys are URLs (e.g. "{url}/network/status/{shard}"): a resource matches a whole path segment, possibly followed by more segments.
+    resource = resource.strip("/")
+    if key == resource or key.startswith(f"{resource}/"):
+        return True
+
+    marker = f"/{resource}"
+    start = key.find(marker)
+    while start >= 0:
+        end = start + len(marker)
+        if end == len(key) or key[end] == "/":
+            return True
+        start = key.find(marker, start + 1)
+
+    return False
@@ -0,0 +1,212 @@
+import asyncio
+import time
+from typing import Any, List
+
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.network_metadata_cache import \
+    NetworkMetadataCache
+from dharitri_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+
+class CountingFetcher:
+    def __init__(self, values: List[Any]) -> None:
+        self.values = list(values)
+        self.num_calls = 0
+
+    def __call__(self) -> Any:
+        self.num_calls += 1
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def create_network_config(round_duration: int, rounds_per_epoch: int) -> NetworkConfig:
+    network_config = NetworkConfig()
+    network_config.round_duration = round_duration
+    network_config.rounds_per_epoch = rounds_per_epoch
+    return network_config
+
+
+def wait_until(condition: Any, timeout_in_seconds: float = 1) -> None:
+    deadline = time.monotonic() + timeout_in_seconds
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_entries_are_served_until_they_expire():
+    cache = NetworkMetadataCache(stale_while_revalidate=False, round_duration_in_milliseconds=100)
+    fetch = CountingFetcher(["a", "b"])
+
+    assert cache.get_network_status("status", fetch) == "a"
+    assert cache.get_network_status("status", fetch) == "a"
+    assert fetch.num_calls == 1
+
+    time.sleep(0.1)
+
+    assert cache.get_network_status("status", fetch) == "b"
+    assert fetch.num_calls == 2
+
+
+def test_stale_entries_are_served_while_refreshed_in_background():
+    cache = NetworkMetadataCache(round_duration_in_milliseconds=100)
+    fetch = CountingFetcher(["a", "b"])
+
+    cache.get_network_status("status", fetch)
+    time.sleep(0.1)
+
+    # the stale value is served right away, the fresh one is fetched in the background
+    assert cache.get_network_status("status", fetch) == "a"
+    wait_until(lambda: cache.get_network_status("status", fetch) == "b")
+    assert cache.get_network_status("status", fetch) == "b"
+    assert fetch.num_calls == 2
+
+
+def test_failed_background_refresh_keeps_the_stale_entry():
+    cache = NetworkMetadataCache(round_duration_in_milliseconds=100)
+    fetch = CountingFetcher(["a", Exception("unavailable"), "b"])
+
+    cache.get_network_status("status", fetch)
+    time.sleep(0.1)
+
+    assert cache.get_network_status("status", fetch) == "a"
+    wait_until(lambda: fetch.num_calls == 2)
+    time.sleep(0.01)
+
+    # the refresh is attempted again
+    assert cache.get_network_status("status", fetch) == "a"
+    wait_until(lambda: cache.get_network_status("status", fetch) == "b")
+    assert fetch.num_calls == 3
+
+
+def test_ttls_are_learned_from_the_network_config():
+    cache = NetworkMetadataCache(stale_while_revalidate=False)
+    fetch = CountingFetcher([create_network_config(round_duration=50, rounds_per_epoch=2)])
+
+    cache.get_network_config("config", fetch)
+
+    assert cache.get_round_ttl() == 0.05
+    assert cache.get_epoch_ttl() == 0.1
+
+
+def test_invalidate():
+    cache = NetworkMetadataCache()
+    fetch_gas_configs = CountingFetcher([{"a": 1}, {"a": 2}])
+    fetch_status = CountingFetcher(["a", "b"])
+
+    cache.get_network_gas_configs("http://localhost/network/gas-configs", fetch_gas_configs)
+    cache.get_network_status("http://localhost/network/status/4294967295", fetch_status)
+
+    cache.invalidate("network/gas-configs")
+
+    assert cache.get_network_gas_configs("http://localhost/network/gas-configs", fetch_gas_configs) == {"a": 2}
+    assert cache.get_network_status("http://localhost/network/status/4294967295", fetch_status) == "a"
+
+    cache.invalidate()
+
+    assert cache.get_network_status("http://localhost/network/status/4294967295", fetch_status) == "b"
+
+
+def test_proxy_serves_network_metadata_from_cache():
+    with MockHttpServer() as server:
+        config = {"data": {"config": {"drt_chain_id": "D", "drt_round_duration": 6000, "drt_rounds_per_epoch": 20}}, "code": "successful"}
+        status = {"data": {"status": {"drt_current_round": 42, "drt_nonce": 41}}, "code": "successful"}
+        server.mock_route("GET", "/network/config", MockHttpResponse(config))
+        server.mock_route("GET", "/network/status/4294967295", MockHttpResponse(status))
+        server.mock_route("GET", "/network/status/1", MockHttpResponse(status))
+
+        cache = NetworkMetadataCache()
+        proxy = ProxyNetworkProvider(server.url, config=NetworkProviderConfig(network_metadata_cache=cache))
+
+        for _ in range(3):
+            assert proxy.get_network_config().chain_id == "D"
+            assert proxy.get_network_status().current_round == 42
+            assert proxy.get_network_status(1).current_round == 42
+
+        assert [request.path for request in server.requests] == ["/network/config", "/network/status/4294967295", "/network/status/1"]
+        assert cache.get_epoch_ttl() == 120
+
+
+def test_invalidate_drops_the_entries_of_a_resource_for_all_shards():
+    with MockHttpServer() as server:
+        config = {"data": {"config": {"drt_chain_id": "D"}}, "code": "successful"}
+        status = {"data": {"status": {"drt_current_round": 42, "drt_nonce": 41}}, "code": "successful"}
+        server.mock_route("GET", "/network/config", MockHttpResponse(config))
+        server.mock_route("GET", "/network/status/4294967295", MockHttpResponse(status))
+        server.mock_route("GET", "/network/status/1", MockHttpResponse(status))
+
+        cache = NetworkMetadataCache()
+
+        with ProxyNetworkProvider(server.url, config=NetworkProviderConfig(network_metadata_cache=cache)) as proxy:
+            proxy.get_network_config()
+            proxy.get_network_status()
+            proxy.get_network_status(1)
+
+            cache.invalidate("network/status")
+
+            proxy.get_network_config()
+            proxy.get_network_status()
+            proxy.get_network_status(1)
+
+        assert [request.path for request in server.requests] == [
+            "/network/config", "/network/status/4294967295", "/network/status/1",
+            "/network/status/4294967295", "/network/status/1"
+        ]
+
+
+def test_invalidate_matches_whole_path_segments():
+    cache = NetworkMetadataCache()
+    fetch = CountingFetcher(["a", "b"])
+
+    cache.get_network_status("http://localhost/network/statuses", fetch)
+    cache.invalidate("network/status")
+
+    assert cache.get_network_status("http://localhost/network/statuses", fetch) == "a"
+    assert fetch.num_calls == 1
+
+
+def test_async_stale_entries_are_served_while_refreshed_in_background():
+    cache = NetworkMetadataCache(round_duration_in_milliseconds=100)
+    fetch = CountingFetcher(["a", "b"])
+
+    async def fetch_async() -> Any:
+        return fetch()
+
+    async def run() -> None:
+        assert await cache.get_network_status_async("status", fetch_async) == "a"
+        await asyncio.sleep(0.1)
+
+        # The stale value is served, while the refresh is scheduled on the event loop.
+        assert await cache.get_network_status_async("status", fetch_async) == "a"
+        await asyncio.sleep(0.01)
+        assert await cache.get_network_status_async("status", fetch_async) == "b"
+
+    asyncio.run(run())
+    assert fetch.num_calls == 2
+
+
+def test_async_proxy_serves_network_metadata_from_cache():
+    with MockHttpServer() as server:
+        config = {"data": {"config": {"drt_chain_id": "D", "drt_round_duration": 6000, "drt_rounds_per_epoch": 20}}, "code": "successful"}
+        status = {"data": {"status": {"drt_current_round": 42, "drt_nonce": 41}}, "code": "successful"}
+        server.mock_route("GET", "/network/config", MockHttpResponse(config))
+        server.mock_route("GET", "/network/status/4294967295", MockHttpResponse(status))
+
+        cache = NetworkMetadataCache()
+
+        async def run() -> None:
+            async with AsyncProxyNetworkProvider(server.url, config=NetworkProviderConfig(network_metadata_cache=cache)) as proxy:
+                for _ in range(3):
+                    assert (await proxy.get_network_config()).chain_id == "D"
+                    assert (await proxy.get_network_status()).current_round == 42
+
+        asyncio.run(run())
+
+        assert [request.path for request in server.requests] == ["/network/config", "/network/status/4294967295"]
+        assert cache.get_epoch_ttl() == 120
@@ -0,0 +1,120 @@
+from concurrent.futures import Executor, Future
+from typing import Callable, Generator, Iterator, List, Optional, TypeVar
+
+from dharitri_sdk.network_providers.interface import IPagination
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+# The API (Elasticsearch) does not serve results past this window, when paging by `from` and `size`.
+API_RESULT_WINDOW = 10_000
+
+
+class Pagination(IPagination):
+    def __init__(self, start: int, size: int, before: Optional[int] = None) -> None:
+        self.start = start
+        self.size = size
+        self.before = before
+
+    def get_start(self) -> int:
+        return self.start
+
+    def get_size(self) -> int:
+        return self.size
+
+    def get_before(self) -> Optional[int]:
+        """If set, only the items with a (timestamp) cursor lower than or equal to this one are requested; then, `start` is relative to them."""
+        return self.before
+
+
+class Paginator(Iterator[T]):
+    """
+    Lazily walks a paginated collection, item by item.
+
+    While the caller handles the items of the current page, the next page is fetched in the background (on the given executor).
+    Thus, besides the current page, at most one (prefetched) page is held in memory.
+    The walk stops at the first incomplete page, or once `limit` items have been yielded.
+
+    Past the result window of the API, pages cannot be requested by offset anymore. If `get_cursor` is given (the collection being sorted by it, descending),
+    the walk continues by cursor: the next page holds the items with a cursor lower than or equal to the one of the last item (`before`),
+    skipping the items already yielded for that very cursor.
+    """
+
+    def __init__(self,
+                 fetch_page: Callable[[Pagination], List[T]],
+                 executor: Executor,
+                 page_size: int = DEFAULT_PAGE_SIZE,
+                 limit: Optional[int] = None,
+                 get_cursor: Optional[Callable[[T], int]] = None,
+                 result_window: int = API_RESULT_WINDOW) -> None:
+        """
+        Args:
+            fetch_page (Callable[[Pagination], List[T]]): Fetches (and parses) one page of the collection.
+            executor (Executor): Where the next page is prefetched.
+            page_size (int): The number of items to fetch per request.
+            limit (Optional[int]): The maximum number of items to yield. If not set, the whole collection is walked.
+            get_cursor (Optional[Callable[[T], int]]): Gets the cursor (e.g. the timestamp) of an item, used past the result window. If not set, the walk always pages by offset.
+            result_window (int): How many items can be paged through by offset.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        self.fetch_page = fetch_page
+        self.executor = executor
+        self.page_size = page_size
+        self.limit = limit
+        self.get_cursor = get_cursor
+        self.result_window = result_window
+
+        self._items: Generator[T, None, None] = self._iterate()
+
+    def __next__(self) -> T:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stops the walk (cancelling the prefetch, if any)."""
+        self._items.close()
+
+    def _iterate(self) -> Generator[T, None, None]:
+        num_yielded = 0
+        # The cursor of the last item, and how many of the yielded items share it.
+        cursor: Optional[int] = None
+        num_yielded_at_cursor = 0
+
+        pagination = self._get_next_pagination(num_yielded, cursor, num_yielded_at_cursor)
+        pending = self._submit(pagination)
+
+        try:
+            while pagination is not None and pending is not None:
+                page = pending.result()
+                num_yielded += len(page)
+
+                if self.get_cursor is not None:
+                    for item in page:
+                        item_cursor = self.get_cursor(item)
+                        num_yielded_at_cursor = num_yielded_at_cursor + 1 if item_cursor == cursor else 1
+                        cursor = item_cursor
+
+                # The page is complete: the next one (if any) is fetched while the caller handles this one.
+                is_complete = len(page) == pagination.get_size()
+                pagination = self._get_next_pagination(num_yielded, cursor, num_yielded_at_cursor) if is_complete else None
+                pending = self._submit(pagination)
+
+                yield from page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def _get_next_pagination(self, num_yielded: int, cursor: Optional[int], num_yielded_at_cursor: int) -> Optional[Pagination]:
+        size = self.page_size if self.limit is None else min(self.page_size, self.limit - num_yielded)
+        if size <= 0:
+            return None
+
+        if cursor is None or num_yielded + size <= self.result_window:
+            return Pagination(num_yielded, size)
+        return Pagination(num_yielded_at_cursor, size, before=cursor)
+
+    def _submit(self, pagination: Optional[Pagination]) -> "Optional[Future[List[T]]]":
+        if pagination is None:
+            return None
+        return self.executor.submit(self.fetch_page, pagination)
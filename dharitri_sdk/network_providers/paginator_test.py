@@ -0,0 +1,127 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+from urllib.parse import parse_qs
+
+import pytest
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.network_providers.api_network_provider import \
+    ApiNetworkProvider
+from dharitri_sdk.network_providers.http_requests import \
+    build_pagination_params
+from dharitri_sdk.network_providers.interface import IPagination
+from dharitri_sdk.network_providers.paginator import Pagination, Paginator
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer,
+                                                     RecordedRequest)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+
+
+class FakeCollection:
+    def __init__(self, num_items: int) -> None:
+        self.num_items = num_items
+        self.requested_pages: List[IPagination] = []
+        self.lock = threading.Lock()
+
+    def fetch_page(self, pagination: IPagination) -> List[int]:
+        with self.lock:
+            self.requested_pages.append(pagination)
+
+        start = pagination.get_start()
+        end = min(start + pagination.get_size(), self.num_items)
+        return list(range(start, end))
+
+    def get_requested_pages(self):
+        return [(page.get_start(), page.get_size()) for page in self.requested_pages]
+
+
+def test_walks_all_pages():
+    collection = FakeCollection(25)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        items = list(Paginator(collection.fetch_page, executor, page_size=10))
+
+    assert items == list(range(25))
+    assert collection.get_requested_pages() == [(0, 10), (10, 10), (20, 10)]
+
+
+def test_stops_at_limit():
+    collection = FakeCollection(1000)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        items = list(Paginator(collection.fetch_page, executor, page_size=10, limit=25))
+
+    assert items == list(range(25))
+    assert collection.get_requested_pages() == [(0, 10), (10, 10), (20, 5)]
+
+
+def test_prefetches_one_page_ahead():
+    collection = FakeCollection(1000)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        paginator = Paginator(collection.fetch_page, executor, page_size=10)
+
+        assert next(paginator) == 0
+        executor.submit(lambda: None).result()
+        assert collection.get_requested_pages() == [(0, 10), (10, 10)]
+
+        # stopping early does not fetch anything else
+        paginator.close()
+        executor.submit(lambda: None).result()
+        assert len(collection.requested_pages) == 2
+
+
+def test_continues_by_cursor_past_the_result_window():
+    # (id, timestamp) pairs, sorted by timestamp (descending); some items share a timestamp
+    timestamps = [100, 100, 99, 98, 98, 98, 98, 98, 97, 96, 95, 95, 94, 93, 93, 92, 91, 90]
+    items = list(enumerate(timestamps))
+    requested_pages: List[Pagination] = []
+
+    def fetch_page(pagination: Pagination) -> List[Tuple[int, int]]:
+        requested_pages.append(pagination)
+        before = pagination.get_before()
+        matching = items if before is None else [item for item in items if item[1] <= before]
+        start = pagination.get_start()
+        assert start + pagination.get_size() <= 6 or before is not None, "past the result window"
+        return matching[start:start + pagination.get_size()]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        walked = list(Paginator(fetch_page, executor, page_size=3, get_cursor=lambda item: item[1], result_window=6))
+
+    assert walked == items
+    assert [(page.get_start(), page.get_before()) for page in requested_pages] == [
+        (0, None), (3, None), (3, 98), (1, 97), (2, 95), (2, 93), (1, 90)
+    ]
+    assert build_pagination_params(requested_pages[2]) == "from=3&size=3&before=98"
+    assert build_pagination_params(requested_pages[0]) == "from=0&size=3"
+
+
+def test_empty_collection():
+    collection = FakeCollection(0)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert list(Paginator(collection.fetch_page, executor, page_size=10)) == []
+        assert list(Paginator(collection.fetch_page, executor, limit=0)) == []
+
+    with pytest.raises(ValueError):
+        Paginator(collection.fetch_page, executor, page_size=0)
+
+
+def test_api_iterates_account_transactions():
+    def respond(request: RecordedRequest) -> MockHttpResponse:
+        query = parse_qs(request.query)
+        start, size = int(query["from"][0]), int(query["size"][0])
+        transactions = [{"txHash": f"{nonce:064x}", "nonce": nonce} for nonce in range(start, min(start + size, 7))]
+        return MockHttpResponse(transactions)
+
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/accounts/{ALICE}/transactions", respond)
+        api = ApiNetworkProvider(server.url)
+
+        transactions = api.iter_account_transactions(Address.new_from_bech32(ALICE), page_size=3)
+
+        assert [transaction.nonce for transaction in transactions] == list(range(7))
+        assert [request.query for request in server.requests] == ["from=0&size=3", "from=3&size=3", "from=6&size=3"]
+        api.close()
@@ -0,0 +1,96 @@
+import time
+from typing import Callable, Protocol
+
+from dharitri_sdk.network_providers.completion_detector import \
+    TransactionCompletionDetector
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+
+ONE_SECOND_IN_MILLISECONDS = 1000
+DEFAULT_NUM_FAST_POLLS = 6
+DEFAULT_BACKOFF_MULTIPLIER = 2
+DEFAULT_MAX_ROUNDS_BETWEEN_POLLS = 8
+DEFAULT_ROUND_OFFSET_RATIO = 0.1
+
+
+class IPollingSchedule(Protocol):
+    def get_delay_in_milliseconds(self, attempt: int) -> int:
+        """The delay before the next poll, given the number of polls done so far."""
+        ...
+
+
+class FixedPollingSchedule:
+    """Polls at a fixed interval."""
+
+    def __init__(self, interval_in_milliseconds: int) -> None:
+        self.interval_in_milliseconds = interval_in_milliseconds
+
+    def get_delay_in_milliseconds(self, attempt: int) -> int:
+        return self.interval_in_milliseconds
+
+
+class RoundAlignedPollingSchedule:
+    """
+    Polls right after the round boundaries, since the state of a transaction only changes when a block is committed.
+
+    While completion is likely (the first `num_fast_polls` rounds, which cover intra-shard and cross-shard finality), it polls once per round.
+    Afterwards, the number of rounds between polls grows geometrically, up to `max_rounds_between_polls`.
+    """
+
+    def __init__(self,
+                 round_duration_in_milliseconds: int,
+                 start_time: int = 0,
+                 num_fast_polls: int = DEFAULT_NUM_FAST_POLLS,
+                 backoff_multiplier: float = DEFAULT_BACKOFF_MULTIPLIER,
+                 max_rounds_between_polls: int = DEFAULT_MAX_ROUNDS_BETWEEN_POLLS,
+                 round_offset_ratio: float = DEFAULT_ROUND_OFFSET_RATIO,
+                 clock: Callable[[], float] = time.time) -> None:
+        """
+        Args:
+            round_duration_in_milliseconds (int): The duration of a round (see `NetworkConfig.round_duration`).
+            start_time (int): The (Unix) timestamp of the genesis, in seconds (see `NetworkConfig.start_time`). Rounds begin at `start_time + k * round_duration`.
+            num_fast_polls (int): The number of polls done once per round, before backing off.
+            backoff_multiplier (float): By how much the number of rounds between polls grows, after the fast polls.
+            max_rounds_between_polls (int): The upper bound of the number of rounds between polls.
+            round_offset_ratio (float): How far into a round (as a fraction of its duration) to poll, so that the block of the round is (most likely) committed.
+            clock (Callable[[], float]): Gives the current (Unix) time, in seconds.
+        """
+        if round_duration_in_milliseconds <= 0:
+            raise ValueError("round_duration_in_milliseconds must be positive")
+
+        self.round_duration_in_milliseconds = round_duration_in_milliseconds
+        self.start_time = start_time
+        self.num_fast_polls = num_fast_polls
+        self.backoff_multiplier = backoff_multiplier
+        self.max_rounds_between_polls = max_rounds_between_polls
+        self.round_offset_in_milliseconds = int(round_duration_in_milliseconds * round_offset_ratio)
+        self.clock = clock
+
+    @classmethod
+    def from_network_config(cls, network_config: NetworkConfig) -> "RoundAlignedPollingSchedule":
+        return cls(network_config.round_duration, network_config.start_time)
+
+    def get_delay_in_milliseconds(self, attempt: int) -> int:
+        return self.get_delay_until_next_round() + (self.get_num_rounds_between_polls(attempt) - 1) * self.round_duration_in_milliseconds
+
+    def get_num_rounds_between_polls(self, attempt: int) -> int:
+        if attempt < self.num_fast_polls:
+            return 1
+
+        num_rounds = self.backoff_multiplier ** (attempt - self.num_fast_polls + 1)
+        return int(min(num_rounds, self.max_rounds_between_polls))
+
+    def get_delay_until_next_round(self) -> int:
+        """The delay until the next round boundary (plus the offset)."""
+        now = int(self.clock() * ONE_SECOND_IN_MILLISECONDS)
+        since_start = now - self.start_time * ONE_SECOND_IN_MILLISECONDS - self.round_offset_in_milliseconds
+        into_round = since_start % self.round_duration_in_milliseconds
+        return self.round_duration_in_milliseconds - into_round
+
+
+def is_outcome_final(transaction: TransactionOnNetwork) -> bool:
+    """
+    Tells whether the outcome (contract results, events and logs) of a completed transaction is final,
+    i.e. there are no pending results, and the contract results (if any) are complete (see `TransactionCompletionDetector`).
+    """
+    return TransactionCompletionDetector().is_outcome_final(transaction)
@@ -0,0 +1,132 @@
+import time
+
+import pytest
+
+from dharitri_sdk.network_providers.contract_results import (
+    ContractResultItem, ContractResults)
+from dharitri_sdk.network_providers.errors import \
+    ExpectedTransactionStatusNotReached
+from dharitri_sdk.network_providers.network_config import NetworkConfig
+from dharitri_sdk.network_providers.polling_schedule import (
+    FixedPollingSchedule, RoundAlignedPollingSchedule, is_outcome_final)
+from dharitri_sdk.network_providers.transaction_awaiter import \
+    TransactionAwaiter
+from dharitri_sdk.network_providers.transaction_events import TransactionEvent
+from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SequenceFetcher:
+    def __init__(self, *transactions: TransactionOnNetwork) -> None:
+        self.transactions = list(transactions)
+        self.num_calls = 0
+
+    def get_transaction(self, tx_hash: str) -> TransactionOnNetwork:
+        self.num_calls += 1
+        return self.transactions[min(self.num_calls, len(self.transactions)) - 1]
+
+
+def create_transaction(is_completed: bool, pending_results: bool = False, with_contract_result: bool = False, final_event: str = "") -> TransactionOnNetwork:
+    transaction = TransactionOnNetwork()
+    transaction.hash = "abba"
+    transaction.is_completed = is_completed
+    transaction.raw_response = {"pendingResults": True} if pending_results else {}
+
+    if with_contract_result:
+        item = ContractResultItem()
+        item.hash = "aa"
+        if final_event:
+            event = TransactionEvent()
+            event.identifier = final_event
+            item.logs.events.append(event)
+        transaction.contract_results = ContractResults([item])
+
+    return transaction
+
+
+def test_polls_are_aligned_to_round_boundaries():
+    clock = FakeClock(1000.0)
+    schedule = RoundAlignedPollingSchedule(6000, start_time=994, round_offset_ratio=0.1, clock=clock)
+
+    # exactly at a round boundary, the next poll is after the offset
+    assert schedule.get_delay_in_milliseconds(0) == 600
+
+    clock.now = 1001.0
+    assert schedule.get_delay_in_milliseconds(0) == 5600
+
+    clock.now = 1000.7
+    assert schedule.get_delay_in_milliseconds(0) == 5900
+
+
+def test_polls_back_off_after_the_fast_polls():
+    clock = FakeClock(0)
+    schedule = RoundAlignedPollingSchedule(1000, num_fast_polls=2, backoff_multiplier=2, max_rounds_between_polls=8, round_offset_ratio=0, clock=clock)
+
+    assert [schedule.get_num_rounds_between_polls(attempt) for attempt in range(7)] == [1, 1, 2, 4, 8, 8, 8]
+    assert schedule.get_delay_in_milliseconds(3) == 4000
+
+
+def test_schedule_from_network_config():
+    network_config = NetworkConfig()
+    network_config.round_duration = 4000
+    network_config.start_time = 12
+
+    schedule = RoundAlignedPollingSchedule.from_network_config(network_config)
+    assert schedule.round_duration_in_milliseconds == 4000
+    assert schedule.start_time == 12
+
+    with pytest.raises(ValueError):
+        RoundAlignedPollingSchedule(0)
+
+
+def test_is_outcome_final():
+    assert is_outcome_final(create_transaction(True))
+    assert not is_outcome_final(create_transaction(True, pending_results=True))
+    assert not is_outcome_final(create_transaction(True, with_contract_result=True))
+    assert is_outcome_final(create_transaction(True, with_contract_result=True, final_event="completedTxEvent"))
+    assert is_outcome_final(create_transaction(True, with_contract_result=True, final_event="signalError"))
+
+
+def test_awaiter_stops_waiting_once_outcome_is_final():
+    fetcher = SequenceFetcher(
+        create_transaction(False),
+        create_transaction(True, with_contract_result=True),
+        create_transaction(True, with_contract_result=True, final_event="completedTxEvent")
+    )
+    awaiter = TransactionAwaiter(fetcher, patience_time_in_milliseconds=10_000, polling_schedule=FixedPollingSchedule(10))
+
+    start = time.monotonic()
+    transaction = awaiter.await_completed("abba")
+
+    assert is_outcome_final(transaction)
+    assert fetcher.num_calls == 3
+    assert time.monotonic() - start < 1
+
+
+def test_awaiter_patience_is_an_upper_bound():
+    fetcher = SequenceFetcher(create_transaction(True, pending_results=True))
+    awaiter = TransactionAwaiter(fetcher, patience_time_in_milliseconds=100, polling_schedule=FixedPollingSchedule(30))
+
+    start = time.monotonic()
+    transaction = awaiter.await_completed("abba")
+
+    assert not is_outcome_final(transaction)
+    assert 0.1 <= time.monotonic() - start < 0.5
+    assert 4 <= fetcher.num_calls <= 5
+
+
+def test_awaiter_on_schedule_times_out():
+    fetcher = SequenceFetcher(create_transaction(False))
+    awaiter = TransactionAwaiter(fetcher, timeout_interval_in_milliseconds=100, polling_schedule=FixedPollingSchedule(30))
+
+    with pytest.raises(ExpectedTransactionStatusNotReached):
+        awaiter.await_completed("abba")
+
+    assert 3 <= fetcher.num_calls <= 4
@@ -1,7 +1,9 @@
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple,
+                    TypeVar, Union)
 
-import requests
 from requests.auth import AuthBase
 
 from dharitri_sdk.core.address import Address
@@ -9,6 +11,11 @@ from dharitri_sdk.core.config import LibraryConfig
 from dharitri_sdk.core.constants import DCDT_CONTRACT_ADDRESS_HEX
 from dharitri_sdk.network_providers.accounts import (AccountOnNetwork,
                                                      GuardianData)
+from dharitri_sdk.network_providers.cached_resources import (
+    cache_hyperblock, cache_proxy_transaction, get_cached_hyperblock,
+    get_cached_proxy_transaction)
+from dharitri_sdk.network_providers.completion_detector import \
+    TransactionCompletionDetector
 from dharitri_sdk.network_providers.config import NetworkProviderConfig
 from dharitri_sdk.network_providers.constants import (BASE_USER_AGENT,
                                                       METACHAIN_ID)
@@ -16,21 +23,29 @@ from dharitri_sdk.network_providers.contract_query_requests import \
     ContractQueryRequest
 from dharitri_sdk.network_providers.contract_query_response import \
     ContractQueryResponse
-from dharitri_sdk.network_providers.errors import GenericError
+from dharitri_sdk.network_providers.http_requests import (get_proxy_data,
+                                                          perform_request)
+from dharitri_sdk.network_providers.http_session import PooledHttpSession
 from dharitri_sdk.network_providers.interface import IAddress, IContractQuery
 from dharitri_sdk.network_providers.network_config import NetworkConfig
 from dharitri_sdk.network_providers.network_status import NetworkStatus
 from dharitri_sdk.network_providers.resources import (GenericResponse,
                                                       SimulateResponse)
+from dharitri_sdk.network_providers.single_flight import SingleFlight
 from dharitri_sdk.network_providers.token_definitions import (
     DefinitionOfFungibleTokenOnNetwork, DefinitionOfTokenCollectionOnNetwork)
 from dharitri_sdk.network_providers.tokens import (
     FungibleTokenOfAccountOnNetwork, NonFungibleTokenOfAccountOnNetwork)
 from dharitri_sdk.network_providers.transaction_status import TransactionStatus
 from dharitri_sdk.network_providers.transactions import (
-    ITransaction, TransactionOnNetwork, transaction_to_dictionary)
+    ITransaction, TransactionLookupResult, TransactionOnNetwork,
+    transaction_to_dictionary)
+from dharitri_sdk.network_providers.transactions_batch_sender import \
+    TransactionsBatchSender
 from dharitri_sdk.network_providers.user_agent import extend_user_agent
 
+T = TypeVar("T")
+
 
 class ProxyNetworkProvider:
     def __init__(
@@ -48,16 +63,57 @@ class ProxyNetworkProvider:
         self.user_agent_prefix = f"{BASE_USER_AGENT}/proxy"
         extend_user_agent(self.user_agent_prefix, self.config)
 
+        self.session = PooledHttpSession(self.config)
+        self._single_flight: Optional[SingleFlight[GenericResponse]] = SingleFlight() if self.config.coalesce_requests else None
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._worker_thread_state = threading.local()
+        self._transactions_sender = TransactionsBatchSender(self.do_post_generic, self.config, self._get_executor)
+
+    def close(self) -> None:
+        """Stops the worker pool (if any) and releases the pooled HTTP connections."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        self.session.close()
+
+    def __enter__(self) -> "ProxyNetworkProvider":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def get_network_config(self) -> NetworkConfig:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return cache.get_network_config(f"{self.url}/network/config", self._fetch_network_config)
+        return self._fetch_network_config()
+
+    def _fetch_network_config(self) -> NetworkConfig:
         response = self.do_get_generic('network/config')
         network_config = NetworkConfig.from_http_response(response.get('config', ''))
         return network_config
 
     def get_network_gas_configs(self) -> Dict[str, Any]:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return cache.get_network_gas_configs(f"{self.url}/network/gas-configs", self._fetch_network_gas_configs)
+        return self._fetch_network_gas_configs()
+
+    def _fetch_network_gas_configs(self) -> Dict[str, Any]:
         response = self.do_get_generic("network/gas-configs").to_dictionary()
         return response
 
     def get_network_status(self, shard: Optional[int] = METACHAIN_ID) -> NetworkStatus:
+        cache = self.config.network_metadata_cache
+        if cache is not None:
+            return cache.get_network_status(f"{self.url}/network/status/{shard}", lambda: self._fetch_network_status(shard))
+        return self._fetch_network_status(shard)
+
+    def _fetch_network_status(self, shard: Optional[int]) -> NetworkStatus:
         response = self.do_get_generic(f'network/status/{shard}')
         network_status = NetworkStatus.from_http_response(response.get('status', ''))
         return network_status
@@ -99,26 +155,78 @@ class ProxyNetworkProvider:
         return token
 
     def get_transaction(self, tx_hash: str, with_process_status: Optional[bool] = False) -> TransactionOnNetwork:
-        def get_process_status() -> TransactionStatus:
-            return self.get_transaction_status(tx_hash)
-
-        def get_tx() -> Dict[str, Any]:
-            url = f"transaction/{tx_hash}?withResults=true"
-            return self.do_get_generic(url).get('transaction', '')
+        cached = get_cached_proxy_transaction(self.config.immutable_data_cache, self.url, tx_hash)
+        if cached is not None:
+            return cached
 
-        status_task = None
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            if with_process_status:
-                status_task = executor.submit(get_process_status)
-
-            tx_task = executor.submit(get_tx)
+        # The process status is fetched on the worker pool, while the transaction itself is fetched on the calling thread.
+        should_fetch_status = with_process_status and not self.config.detect_completion_locally
+        status_task = self._submit(self.get_transaction_status, tx_hash) if should_fetch_status else None
 
+        tx = self._get_transaction_payload(tx_hash)
         process_status = status_task.result() if status_task else None
-        tx = tx_task.result()
+        if with_process_status and self.config.detect_completion_locally:
+            process_status = self._detect_process_status(tx_hash, tx)
         transaction = TransactionOnNetwork.from_proxy_http_response(tx_hash, tx, process_status)
+        cache_proxy_transaction(self.config.immutable_data_cache, self.url, tx_hash, tx, process_status)
 
         return transaction
 
+    def get_transactions(self, tx_hashes: Sequence[str], with_process_status: Optional[bool] = False) -> List[TransactionLookupResult]:
+        """
+        Fetches many transactions concurrently, on the worker pool of the provider (see `NetworkProviderConfig.max_workers`).
+
+        The results preserve the order of the input hashes. A failed lookup does not fail the whole batch;
+        instead, its error is reported on the corresponding result.
+        """
+        cached: Dict[str, TransactionOnNetwork] = {}
+        tasks: Dict[str, Tuple[Future[Dict[str, Any]], Optional[Future[TransactionStatus]]]] = {}
+
+        for tx_hash in tx_hashes:
+            if tx_hash in cached or tx_hash in tasks:
+                continue
+
+            cached_transaction = get_cached_proxy_transaction(self.config.immutable_data_cache, self.url, tx_hash)
+            if cached_transaction is not None:
+                cached[tx_hash] = cached_transaction
+                continue
+
+            tx_task = self._submit(self._get_transaction_payload, tx_hash)
+            should_fetch_status = with_process_status and not self.config.detect_completion_locally
+            status_task = self._submit(self.get_transaction_status, tx_hash) if should_fetch_status else None
+            tasks[tx_hash] = (tx_task, status_task)
+
+        results: List[TransactionLookupResult] = []
+
+        for tx_hash in tx_hashes:
+            if tx_hash in cached:
+                results.append(TransactionLookupResult(tx_hash, transaction=cached[tx_hash]))
+                continue
+
+            tx_task, status_task = tasks[tx_hash]
+
+            try:
+                tx = tx_task.result()
+                process_status = status_task.result() if status_task else None
+                if with_process_status and self.config.detect_completion_locally:
+                    process_status = self._detect_process_status(tx_hash, tx)
+
+                transaction = TransactionOnNetwork.from_proxy_http_response(tx_hash, tx, process_status)
+                cache_proxy_transaction(self.config.immutable_data_cache, self.url, tx_hash, tx, process_status)
+                results.append(TransactionLookupResult(tx_hash, transaction=transaction))
+            except Exception as error:
+                results.append(TransactionLookupResult(tx_hash, error=error))
+
+        return results
+
+    def _get_transaction_payload(self, tx_hash: str) -> Dict[str, Any]:
+        url = f"transaction/{tx_hash}?withResults=true"
+        return self.do_get_generic(url).get('transaction', '')
+
+    def _detect_process_status(self, tx_hash: str, tx: Dict[str, Any]) -> TransactionStatus:
+        transaction = TransactionOnNetwork.from_proxy_http_response(tx_hash, tx)
+        return TransactionCompletionDetector().get_process_status(transaction)
+
     def get_transaction_status(self, tx_hash: str) -> TransactionStatus:
         response = self.do_get_generic(f'transaction/{tx_hash}/process-status')
         status = TransactionStatus(response.get('status', ''))
@@ -129,16 +237,21 @@ class ProxyNetworkProvider:
         return response.get('txHash', '')
 
     def send_transactions(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
-        transactions_as_dictionaries = [transaction_to_dictionary(transaction) for transaction in transactions]
-        response = self.do_post_generic('transaction/send-multiple', transactions_as_dictionaries)
-        # Proxy and Observers have different response format:
-        num_sent = response.get("numOfSentTxs", 0) or response.get("txsSent", 0)
-        hashes = response.get("txsHashes")
-        return num_sent, hashes
+        """
+        Sends the transactions in chunks (see `NetworkProviderConfig`); the hashes are keyed by the index of each transaction within the input.
+        Raises `TransactionsNotSentError` (holding the indices of the transactions not sent) if some of the chunks could not be sent.
+        """
+        return self._transactions_sender.send(transactions)
 
     def query_contract(self, query: IContractQuery) -> ContractQueryResponse:
         request = ContractQueryRequest(query).to_http_request()
-        response = self.do_post_generic('vm-values/query', request)
+
+        if self._single_flight is not None:
+            key = f"POST {self.url}/vm-values/query {json.dumps(request, sort_keys=True)}"
+            response = self._single_flight.do(key, lambda: self.do_post_generic('vm-values/query', request))
+        else:
+            response = self.do_post_generic('vm-values/query', request)
+
         return ContractQueryResponse.from_http_response(response.get('data', ''))
 
     def get_definition_of_fungible_token(self, token_identifier: str) -> DefinitionOfFungibleTokenOnNetwork:
@@ -168,10 +281,40 @@ class ProxyNetworkProvider:
         if str(key).isnumeric():
             url = f"hyperblock/by-nonce/{key}"
 
+        cached = get_cached_hyperblock(self.config.immutable_data_cache, self.url, key)
+        if cached is not None:
+            return cached
+
         response = self.do_get_generic(url)
         response = response.get("hyperblock", {})
+        cache_hyperblock(self.config.immutable_data_cache, self.url, key, response)
+
         return response
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.config.max_workers, thread_name_prefix="proxy", initializer=self._mark_worker_thread)
+            return self._executor
+
+    def _mark_worker_thread(self) -> None:
+        self._worker_thread_state.is_worker = True
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """
+        Runs the function on the worker pool. If called from one of the workers (e.g. a nested lookup), the function runs inline instead:
+        a worker blocked on tasks queued behind it would otherwise deadlock a saturated pool.
+        """
+        if not getattr(self._worker_thread_state, "is_worker", False):
+            return self._get_executor().submit(fn, *args)
+
+        future: "Future[T]" = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
     def do_get_generic(self, resource_url: str) -> GenericResponse:
         url = f'{self.url}/{resource_url}'
         response = self.do_get(url)
@@ -183,48 +326,18 @@ class ProxyNetworkProvider:
         return response
 
     def do_get(self, url: str) -> GenericResponse:
-        try:
-            response = requests.get(url, auth=self.auth, **self.config.requests_options)
-            response.raise_for_status()
-            parsed = response.json()
-            return self.get_data(parsed, url)
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
-        except requests.ConnectionError as err:
-            raise GenericError(url, err)
-        except Exception as err:
-            raise GenericError(url, err)
+        if self._single_flight is not None:
+            return self._single_flight.do(f"GET {url}", lambda: self._do_get(url))
+        return self._do_get(url)
+
+    def _do_get(self, url: str) -> GenericResponse:
+        return perform_request(self.session, "GET", url, self.get_data, self.auth, self.config.requests_options)
 
     def do_post(self, url: str, payload: Any) -> GenericResponse:
-        try:
-            response = requests.post(url, json=payload, auth=self.auth, **self.config.requests_options)
-            response.raise_for_status()
-            parsed = response.json()
-            return self.get_data(parsed, url)
-        except requests.HTTPError as err:
-            error_data = self._extract_error_from_response(err.response)
-            raise GenericError(url, error_data)
-        except requests.ConnectionError as err:
-            raise GenericError(url, err)
-        except Exception as err:
-            raise GenericError(url, err)
+        return perform_request(self.session, "POST", url, self.get_data, self.auth, self.config.requests_options, payload)
 
     def get_data(self, parsed: Dict[str, Any], url: str) -> GenericResponse:
-        err = parsed.get("error")
-        code = parsed.get("code")
-
-        if err:
-            raise GenericError(url, f"code:{code}, error: {err}")
-
-        data: Dict[str, Any] = parsed.get("data", dict())
-        return GenericResponse(data)
-
-    def _extract_error_from_response(self, response: Any):
-        try:
-            return response.json()
-        except Exception:
-            return response.text
+        return get_proxy_data(parsed, url)
 
 
 class ContractQuery(IContractQuery):
@@ -4,8 +4,11 @@ import requests
 from dharitri_sdk.core.address import Address
 from dharitri_sdk.core.transaction import Transaction
 from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import GenericError
 from dharitri_sdk.network_providers.proxy_network_provider import (
     ContractQuery, ProxyNetworkProvider)
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
 
 
 @pytest.mark.networkInteraction
@@ -248,3 +251,62 @@ class TestProxy:
         response = requests.get(proxy.url + "/network/config", **proxy.config.requests_options)
         headers = response.request.headers
         assert headers.get("User-Agent") == "dharitri-sdk-py/proxy/test-client"
+
+
+class TestProxyOnMockServer:
+    alice = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+    bob = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+
+    def mock_transaction(self, server: MockHttpServer, tx_hash: str, nonce: int, status: str):
+        transaction = {"nonce": nonce, "sender": self.alice, "receiver": self.bob, "status": "pending"}
+        server.mock_route("GET", f"/transaction/{tx_hash}", MockHttpResponse({"data": {"transaction": transaction}, "code": "successful"}))
+        server.mock_route("GET", f"/transaction/{tx_hash}/process-status", MockHttpResponse({"data": {"status": status}, "code": "successful"}))
+
+    def test_get_transactions(self):
+        hashes = [f"{i:064x}" for i in range(50)]
+
+        with MockHttpServer() as server:
+            for i, tx_hash in enumerate(hashes):
+                self.mock_transaction(server, tx_hash, i, "success" if i % 2 else "pending")
+
+            with ProxyNetworkProvider(server.url, config=NetworkProviderConfig(max_workers=4)) as proxy:
+                results = proxy.get_transactions(hashes, with_process_status=True)
+
+        assert [result.hash for result in results] == hashes
+        assert all(result.is_ok() for result in results)
+        assert [result.transaction.nonce for result in results if result.transaction] == list(range(50))
+        assert results[0].transaction and results[0].transaction.is_completed is False
+        assert results[1].transaction and results[1].transaction.is_completed is True
+        assert len(server.requests) == 100
+
+    def test_get_transactions_reports_errors_per_hash(self):
+        found, missing = "aa" * 32, "bb" * 32
+
+        with MockHttpServer() as server:
+            self.mock_transaction(server, found, 7, "success")
+
+            with ProxyNetworkProvider(server.url) as proxy:
+                results = proxy.get_transactions([missing, found])
+
+        assert not results[0].is_ok()
+        assert isinstance(results[0].error, GenericError)
+        assert results[1].is_ok()
+        assert results[1].transaction and results[1].transaction.nonce == 7
+        assert results[1].transaction.is_completed is None
+
+    def test_get_transaction_reuses_the_worker_pool(self):
+        tx_hash = "aa" * 32
+
+        with MockHttpServer() as server:
+            self.mock_transaction(server, tx_hash, 7, "success")
+
+            with ProxyNetworkProvider(server.url, config=NetworkProviderConfig(max_workers=1)) as proxy:
+                transactions = [proxy.get_transaction(tx_hash, with_process_status=True) for _ in range(20)]
+
+                assert all(transaction.is_completed for transaction in transactions)
+                # a single (lazily created) worker, instead of a new pool per call
+                assert len(proxy._get_executor()._threads) == 1
+
+                # nested lookups, issued from the workers themselves, do not deadlock the (saturated) pool
+                future = proxy._get_executor().submit(proxy.get_transaction, tx_hash, True)
+                assert future.result(timeout=5).is_completed
@@ -0,0 +1,162 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Sequence
+from urllib.parse import urlsplit
+
+from dharitri_sdk.network_providers.errors import CircuitBreakerOpenError
+
+DEFAULT_RETRIABLE_STATUS_CODES = (429, 502, 503, 504)
+DEFAULT_IDEMPOTENT_POST_RESOURCES = ("vm-values/query", "transaction/simulate", "transaction/cost")
+
+
+class CircuitBreaker:
+    """
+    Tracks the health of a single endpoint. After a number of consecutive failures, the circuit "opens" and requests are rejected (fail fast).
+    Once the reset timeout elapses, one trial request is let through: if it succeeds, the circuit closes again; otherwise, it re-opens.
+    """
+
+    def __init__(self, endpoint: str, failure_threshold: int, reset_timeout_in_seconds: float) -> None:
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_in_seconds = reset_timeout_in_seconds
+
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._is_trial_in_progress = False
+
+    def before_request(self) -> None:
+        """Raises `CircuitBreakerOpenError` if the request should not be attempted."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            elapsed = time.monotonic() - self._opened_at
+            if elapsed < self.reset_timeout_in_seconds or self._is_trial_in_progress:
+                raise CircuitBreakerOpenError(self.endpoint, max(self.reset_timeout_in_seconds - elapsed, 0))
+
+            self._is_trial_in_progress = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._is_trial_in_progress = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._is_trial_in_progress = False
+
+            if self._opened_at is not None or self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def release_trial(self) -> None:
+        """Called when a request is interrupted (e.g. cancelled), without an outcome: it neither counts as a success, nor as a failure."""
+        with self._lock:
+            self._is_trial_in_progress = False
+
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+
+class RetryPolicy:
+    """
+    Describes how the network providers retry failed requests: exponential backoff with (full) jitter, `Retry-After` honoring,
+    separate retry budgets for idempotent reads (GET requests) and for idempotent POST requests (e.g. `vm-values/query`),
+    plus a circuit breaker for each endpoint (scheme and host). Other POST requests (e.g. `transaction/send`) are never retried.
+
+    A policy can be shared by several providers; then, they also share the circuit breakers.
+    """
+
+    def __init__(self,
+                 max_retries_for_reads: int = 3,
+                 max_retries_for_idempotent_posts: int = 1,
+                 idempotent_post_resources: Sequence[str] = DEFAULT_IDEMPOTENT_POST_RESOURCES,
+                 retriable_status_codes: Sequence[int] = DEFAULT_RETRIABLE_STATUS_CODES,
+                 backoff_base_in_seconds: float = 0.25,
+                 backoff_max_in_seconds: float = 8,
+                 max_retry_after_in_seconds: float = 30,
+                 circuit_breaker_failure_threshold: int = 5,
+                 circuit_breaker_reset_timeout_in_seconds: float = 30) -> None:
+        """
+        Args:
+            max_retries_for_reads (int): How many times a GET request is retried.
+            max_retries_for_idempotent_posts (int): How many times a POST request to one of the `idempotent_post_resources` is retried.
+            idempotent_post_resources (Sequence[str]): The routes (e.g. `vm-values/query`) that are safe to POST more than once. A route matches the last segments of the path, as a whole
+                (`vm-values/query` does not match `/other-values/query`, nor `/vm-values/query/extra`).
+            retriable_status_codes (Sequence[int]): The HTTP status codes that trigger a retry. Connection errors and timeouts are always retried.
+            backoff_base_in_seconds (float): The (maximum) delay before the first retry; it doubles with each subsequent retry.
+            backoff_max_in_seconds (float): The upper bound of the backoff delay.
+            max_retry_after_in_seconds (float): If the server asks (by `Retry-After`) for a longer wait than this, the request is not retried.
+            circuit_breaker_failure_threshold (int): The number of consecutive failures (connection errors, 5xx responses) after which an endpoint is considered unhealthy.
+            circuit_breaker_reset_timeout_in_seconds (float): For how long requests to an unhealthy endpoint are rejected, before a trial request is let through.
+        """
+        self.max_retries_for_reads = max_retries_for_reads
+        self.max_retries_for_idempotent_posts = max_retries_for_idempotent_posts
+        # With a leading "/", the resources only match whole path segments.
+        self.idempotent_post_resources = tuple(f"/{resource.strip('/')}" for resource in idempotent_post_resources)
+        self.retriable_status_codes = set(retriable_status_codes)
+        self.backoff_base_in_seconds = backoff_base_in_seconds
+        self.backoff_max_in_seconds = backoff_max_in_seconds
+        self.max_retry_after_in_seconds = max_retry_after_in_seconds
+        self.circuit_breaker_failure_threshold = circuit_breaker_failure_threshold
+        self.circuit_breaker_reset_timeout_in_seconds = circuit_breaker_reset_timeout_in_seconds
+
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get_max_retries(self, method: str, url: str) -> int:
+        if method.upper() == "GET":
+            return self.max_retries_for_reads
+
+        if method.upper() == "POST" and self.is_idempotent_post(url):
+            return self.max_retries_for_idempotent_posts
+
+        return 0
+
+    def is_idempotent_post(self, url: str) -> bool:
+        """Tells whether the URL (or resource) is one of the `idempotent_post_resources`, i.e. it is safe to POST to it more than once."""
+        path = f"/{urlsplit(url).path.strip('/')}"
+        return path.endswith(self.idempotent_post_resources)
+
+    def is_retriable_status(self, status_code: int) -> bool:
+        return status_code in self.retriable_status_codes
+
+    def is_failure_status(self, status_code: int) -> bool:
+        """Tells whether a response counts as a failure of the endpoint, for the circuit breaker."""
+        return status_code >= 500
+
+    def get_backoff_delay(self, attempt: int) -> float:
+        """The delay before the retry number `attempt + 1`: a random value up to an exponentially growing (but bounded) ceiling."""
+        ceiling = min(self.backoff_max_in_seconds, self.backoff_base_in_seconds * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def get_retry_after_delay(self, retry_after: Optional[str]) -> Optional[float]:
+        """Parses a `Retry-After` header, given either as a number of seconds or as an HTTP date."""
+        if not retry_after:
+            return None
+
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+
+        try:
+            return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return None
+
+    def get_circuit_breaker(self, url: str) -> CircuitBreaker:
+        parts = urlsplit(url)
+        endpoint = f"{parts.scheme}://{parts.netloc}"
+
+        with self._lock:
+            breaker = self._circuit_breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.circuit_breaker_failure_threshold, self.circuit_breaker_reset_timeout_in_seconds)
+                self._circuit_breakers[endpoint] = breaker
+            return breaker
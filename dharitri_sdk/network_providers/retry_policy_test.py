@@ -0,0 +1,222 @@
+import time
+from typing import Any, List
+
+import pytest
+import requests
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.core.transaction import Transaction
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import (CircuitBreakerOpenError,
+                                                   GenericError)
+from dharitri_sdk.network_providers.http_session import PooledHttpSession
+from dharitri_sdk.network_providers.proxy_network_provider import (
+    ContractQuery, ProxyNetworkProvider)
+from dharitri_sdk.network_providers.retry_policy import (CircuitBreaker,
+                                                         RetryPolicy)
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer,
+                                                     RecordedRequest)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+
+
+class FlakyResponder:
+    def __init__(self, failures: List[MockHttpResponse], success: MockHttpResponse) -> None:
+        self.failures = list(failures)
+        self.success = success
+
+    def __call__(self, request: RecordedRequest) -> MockHttpResponse:
+        if self.failures:
+            return self.failures.pop(0)
+        return self.success
+
+
+def account_response() -> MockHttpResponse:
+    return MockHttpResponse({"data": {"account": {"address": ALICE, "nonce": 7}}, "code": "successful"})
+
+
+def create_proxy(server: MockHttpServer, policy: RetryPolicy) -> ProxyNetworkProvider:
+    return ProxyNetworkProvider(server.url, config=NetworkProviderConfig(retry_policy=policy))
+
+
+def test_get_is_retried_on_transient_errors():
+    with MockHttpServer() as server:
+        failures = [MockHttpResponse(status=502), MockHttpResponse(status=503)]
+        server.mock_route("GET", f"/address/{ALICE}", FlakyResponder(failures, account_response()))
+        proxy = create_proxy(server, RetryPolicy(backoff_base_in_seconds=0.01))
+
+        account = proxy.get_account(Address.new_from_bech32(ALICE))
+
+        assert account.nonce == 7
+        assert len(server.requests) == 3
+
+
+def test_get_fails_when_retries_are_exhausted():
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/address/{ALICE}", MockHttpResponse({"error": "bad gateway"}, status=502))
+        proxy = create_proxy(server, RetryPolicy(max_retries_for_reads=2, backoff_base_in_seconds=0.01))
+
+        with pytest.raises(GenericError):
+            proxy.get_account(Address.new_from_bech32(ALICE))
+
+        assert len(server.requests) == 3
+
+
+def test_posts_follow_their_own_rules():
+    with MockHttpServer() as server:
+        server.mock_route("POST", "/vm-values/query", MockHttpResponse(status=503))
+        server.mock_route("POST", "/transaction/send", MockHttpResponse(status=503))
+        proxy = create_proxy(server, RetryPolicy(max_retries_for_idempotent_posts=2, backoff_base_in_seconds=0.01))
+
+        with pytest.raises(GenericError):
+            proxy.query_contract(ContractQuery(Address.new_from_bech32(ALICE), "getSum", 0, []))
+
+        assert len(server.requests) == 3
+
+        with pytest.raises(GenericError):
+            proxy.send_transaction(Transaction(sender=ALICE, receiver=ALICE, gas_limit=50000, chain_id="D"))
+
+        # sending transactions is never retried
+        assert len(server.requests) == 4
+
+
+def test_retry_after_is_honored():
+    with MockHttpServer() as server:
+        failures = [MockHttpResponse(status=429, headers={"Retry-After": "0.3"})]
+        server.mock_route("GET", f"/address/{ALICE}", FlakyResponder(failures, account_response()))
+        proxy = create_proxy(server, RetryPolicy(backoff_base_in_seconds=0))
+
+        start = time.monotonic()
+        proxy.get_account(Address.new_from_bech32(ALICE))
+
+        assert time.monotonic() - start >= 0.3
+        assert len(server.requests) == 2
+
+
+def test_too_long_retry_after_is_not_waited_for():
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/address/{ALICE}", MockHttpResponse(status=429, headers={"Retry-After": "120"}))
+        proxy = create_proxy(server, RetryPolicy(max_retry_after_in_seconds=10))
+
+        with pytest.raises(GenericError):
+            proxy.get_account(Address.new_from_bech32(ALICE))
+
+        assert len(server.requests) == 1
+
+
+def test_circuit_breaker_fails_fast_while_endpoint_is_unhealthy():
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/address/{ALICE}", MockHttpResponse(status=502))
+        policy = RetryPolicy(max_retries_for_reads=0, circuit_breaker_failure_threshold=3, circuit_breaker_reset_timeout_in_seconds=0.3)
+        proxy = create_proxy(server, policy)
+        address = Address.new_from_bech32(ALICE)
+
+        for _ in range(3):
+            with pytest.raises(GenericError):
+                proxy.get_account(address)
+
+        with pytest.raises(GenericError) as error:
+            proxy.get_account(address)
+
+        assert isinstance(error.value.data, CircuitBreakerOpenError)
+        assert len(server.requests) == 3
+
+        # after the reset timeout, a trial request is let through
+        server.mock_route("GET", f"/address/{ALICE}", account_response())
+        time.sleep(0.3)
+
+        assert proxy.get_account(address).nonce == 7
+        assert not policy.get_circuit_breaker(server.url).is_open()
+
+
+def test_circuit_breaker_reopens_if_trial_fails():
+    breaker = CircuitBreaker("http://localhost", failure_threshold=1, reset_timeout_in_seconds=0)
+    breaker.record_failure()
+    assert breaker.is_open()
+
+    # the trial request is let through, but a concurrent one is not
+    breaker.before_request()
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.before_request()
+
+    breaker.record_failure()
+    assert breaker.is_open()
+
+
+def test_circuit_breaker_recovers_after_trial_fails_with_any_error():
+    class FakeSession:
+        def __init__(self, outcomes: List[Any]) -> None:
+            self.outcomes = outcomes
+
+        def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+            outcome = self.outcomes.pop(0)
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+    response = requests.Response()
+    response.status_code = 200
+
+    policy = RetryPolicy(max_retries_for_reads=0, circuit_breaker_failure_threshold=1, circuit_breaker_reset_timeout_in_seconds=0)
+    session = PooledHttpSession(NetworkProviderConfig(retry_policy=policy))
+    fake_session = FakeSession([requests.ConnectionError(), requests.exceptions.ChunkedEncodingError(), response])
+    session._acquire_session = lambda: fake_session  # type: ignore
+
+    with pytest.raises(requests.ConnectionError):
+        session.get("http://localhost/network/config")
+
+    # the trial request fails with an error which is not a connection error
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        session.get("http://localhost/network/config")
+
+    # nevertheless, another trial is let through
+    assert session.get("http://localhost/network/config").status_code == 200
+    assert not policy.get_circuit_breaker("http://localhost").is_open()
+
+
+def test_interrupted_trial_is_not_a_failure():
+    class InterruptedSession:
+        def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+            raise KeyboardInterrupt()
+
+    policy = RetryPolicy(max_retries_for_reads=0, circuit_breaker_failure_threshold=1, circuit_breaker_reset_timeout_in_seconds=0)
+    breaker = policy.get_circuit_breaker("http://localhost")
+    breaker.record_failure()
+
+    session = PooledHttpSession(NetworkProviderConfig(retry_policy=policy))
+    session._acquire_session = lambda: InterruptedSession()  # type: ignore
+
+    with pytest.raises(KeyboardInterrupt):
+        session.get("http://localhost/network/config")
+
+    # the interruption is not counted as a failure, and another trial is let through
+    assert breaker._consecutive_failures == 1
+    breaker.before_request()
+
+
+def test_backoff_delay_is_bounded():
+    policy = RetryPolicy(backoff_base_in_seconds=1, backoff_max_in_seconds=5)
+
+    assert all(0 <= policy.get_backoff_delay(0) <= 1 for _ in range(100))
+    assert all(0 <= policy.get_backoff_delay(10) <= 5 for _ in range(100))
+
+
+def test_retry_after_parsing():
+    policy = RetryPolicy()
+
+    assert policy.get_retry_after_delay(None) is None
+    assert policy.get_retry_after_delay("7") == 7
+    assert policy.get_retry_after_delay("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert policy.get_retry_after_delay("soon") is None
+
+
+def test_idempotent_posts_match_whole_routes():
+    policy = RetryPolicy(max_retries_for_idempotent_posts=2)
+
+    assert policy.get_max_retries("POST", "http://localhost/vm-values/query") == 2
+    assert policy.get_max_retries("POST", "http://localhost/gateway/vm-values/query/") == 2
+    assert policy.get_max_retries("POST", "http://localhost/query") == 0
+    assert policy.get_max_retries("POST", "http://localhost/other-values/query") == 0
+    assert policy.get_max_retries("POST", "http://localhost/vm-values/query/extra") == 0
+    assert policy.get_max_retries("POST", "http://localhost/transaction/send") == 0
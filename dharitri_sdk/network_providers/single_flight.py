@@ -0,0 +1,79 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import (Any, Awaitable, Callable, Dict, Generic, Hashable, Tuple,
+                    TypeVar)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Collapses concurrent calls having the same key into a single in-flight call.
+
+    The first caller (for a key) runs the function, while the callers arriving in the meantime wait for it and get the very same result (or error).
+    Nothing is cached: once the call completes, the next caller (for the same key) runs the function again.
+    Safe to be used from many threads.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "Future[T]"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if call is None:
+                call = Future()
+                self._calls[key] = call
+
+        if not is_leader:
+            return call.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def get_num_in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    The asyncio counterpart of `SingleFlight`: collapses concurrent awaits having the same key (within an event loop) into a single in-flight call.
+
+    A waiter being cancelled does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Future[T]"] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        call_key = (loop, key)
+        call = self._calls.get(call_key)
+
+        if call is None:
+            call = asyncio.ensure_future(function())
+            self._calls[call_key] = call
+            call.add_done_callback(lambda _: self._forget(call_key, call))
+
+        return await asyncio.shield(call)
+
+    def get_num_in_flight(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, call_key: Tuple[asyncio.AbstractEventLoop, Hashable], call: "asyncio.Future[Any]") -> None:
+        if self._calls.get(call_key) is call:
+            del self._calls[call_key]
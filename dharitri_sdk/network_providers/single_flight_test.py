@@ -0,0 +1,127 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dharitri_sdk.core.address import Address
+from dharitri_sdk.network_providers.async_proxy_network_provider import \
+    AsyncProxyNetworkProvider
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.proxy_network_provider import \
+    ProxyNetworkProvider
+from dharitri_sdk.network_providers.single_flight import (AsyncSingleFlight,
+                                                          SingleFlight)
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+
+
+def account_response() -> MockHttpResponse:
+    payload = {"data": {"account": {"address": ALICE, "nonce": 7}}, "code": "successful"}
+    return MockHttpResponse(payload, delay_in_seconds=0.2)
+
+
+def test_concurrent_calls_are_collapsed():
+    single_flight: SingleFlight[int] = SingleFlight()
+    num_calls = 0
+    release = threading.Event()
+
+    def function() -> int:
+        nonlocal num_calls
+        num_calls += 1
+        release.wait()
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(single_flight.do, "key", function) for _ in range(8)]
+
+        while single_flight.get_num_in_flight() == 0:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        release.set()
+
+        assert [future.result() for future in futures] == [42] * 8
+
+    assert num_calls == 1
+    assert single_flight.get_num_in_flight() == 0
+
+    # nothing is cached
+    assert single_flight.do("key", function) == 42
+    assert num_calls == 2
+
+
+def test_errors_are_shared_by_all_waiters():
+    single_flight: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+
+    def function() -> int:
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(single_flight.do, "key", function) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert single_flight.get_num_in_flight() == 0
+
+
+def test_async_concurrent_calls_are_collapsed():
+    single_flight: AsyncSingleFlight[int] = AsyncSingleFlight()
+    num_calls = 0
+
+    async def function() -> int:
+        nonlocal num_calls
+        num_calls += 1
+        await asyncio.sleep(0.05)
+        return 42
+
+    async def main():
+        waiters = [asyncio.ensure_future(single_flight.do("key", function)) for _ in range(8)]
+
+        # a cancelled waiter does not cancel the shared call
+        await asyncio.sleep(0)
+        waiters[0].cancel()
+
+        results = await asyncio.gather(*waiters[1:])
+        assert results == [42] * 7
+
+    asyncio.run(main())
+
+    assert num_calls == 1
+    assert single_flight.get_num_in_flight() == 0
+
+
+def test_proxy_coalesces_identical_reads():
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/address/{ALICE}", account_response())
+        proxy = ProxyNetworkProvider(server.url, config=NetworkProviderConfig(coalesce_requests=True))
+        address = Address.new_from_bech32(ALICE)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            nonces = list(executor.map(lambda _: proxy.get_account(address).nonce, range(8)))
+
+        assert nonces == [7] * 8
+        assert len(server.requests) == 1
+
+
+def test_async_proxy_coalesces_identical_reads():
+    with MockHttpServer() as server:
+        server.mock_route("GET", f"/address/{ALICE}", account_response())
+        proxy = AsyncProxyNetworkProvider(server.url, config=NetworkProviderConfig(coalesce_requests=True))
+        address = Address.new_from_bech32(ALICE)
+
+        async def main():
+            accounts = await asyncio.gather(*[proxy.get_account(address) for _ in range(8)])
+            return [account.nonce for account in accounts]
+
+        assert asyncio.run(main()) == [7] * 8
+        assert len(server.requests) == 1
+        proxy.close()
@@ -1,18 +1,60 @@
+import asyncio
+import logging
+import threading
 import time
-from typing import Callable, Optional, Protocol, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Protocol,
+                    Sequence, Union, runtime_checkable)
 
 from dharitri_sdk.network_providers.errors import (
-    ExpectedTransactionStatusNotReached, IsCompletedFieldMissingOnTransaction)
-from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+    ExpectedTransactionStatusNotReached, IsCompletedFieldMissingOnTransaction,
+    TransactionNotFoundError)
+from dharitri_sdk.network_providers.polling_schedule import (IPollingSchedule,
+                                                             is_outcome_final)
+from dharitri_sdk.network_providers.transactions import (
+    TransactionLookupResult, TransactionOnNetwork)
+
+logger = logging.getLogger("transaction_awaiter")
 
 ONE_SECOND_IN_MILLISECONDS = 1000
+DEFAULT_BUNCH_SIZE = 50
+DEFAULT_MAX_CONCURRENT_FETCHES = 16
 
 
+@runtime_checkable
 class ITransactionFetcher(Protocol):
     def get_transaction(self, tx_hash: str) -> TransactionOnNetwork:
         ...
 
 
+@runtime_checkable
+class ITransactionBulkFetcher(Protocol):
+    """Fetches many transactions with a single request (e.g. `ApiNetworkProvider`); the ones not found (yet) are missing from the result."""
+
+    def get_bunch_of_transactions(self, tx_hashes: List[str]) -> List[TransactionOnNetwork]:
+        ...
+
+
+@runtime_checkable
+class ITransactionLookupsFetcher(Protocol):
+    """Fetches many transactions concurrently (e.g. `ProxyNetworkProvider`), reporting a lookup result for each one."""
+
+    def get_transactions(self, tx_hashes: Sequence[str], with_process_status: Optional[bool] = False) -> List[TransactionLookupResult]:
+        ...
+
+
+class PendingTransactionWait:
+    def __init__(self, tx_hash: str, condition: Callable[[TransactionOnNetwork], bool], deadline: float) -> None:
+        self.hash = tx_hash
+        self.condition = condition
+        self.deadline = deadline
+        self.future: "Future[TransactionOnNetwork]" = Future()
+        self.attempt = 0
+        self.next_poll_at = 0.0
+        self.patience_deadline: Optional[float] = None
+        self.transaction: Optional[TransactionOnNetwork] = None
+
+
 class TransactionAwaiter:
     """TransactionAwaiter allows one to await until a specific event (such as transaction completion) occurs on a given transaction."""
     default_polling_interval = 6000
@@ -20,16 +62,20 @@ class TransactionAwaiter:
     default_patience = 0
 
     def __init__(self,
-                 fetcher: ITransactionFetcher,
+                 fetcher: Union[ITransactionFetcher, ITransactionBulkFetcher],
                  polling_interval_in_milliseconds: Optional[int] = None,
                  timeout_interval_in_milliseconds: Optional[int] = None,
-                 patience_time_in_milliseconds: Optional[int] = None) -> None:
+                 patience_time_in_milliseconds: Optional[int] = None,
+                 polling_schedule: Optional[IPollingSchedule] = None) -> None:
         """
         Args:
-            fetcher (ITransactionFetcher): Used to fetch the transaction of the network.
+            fetcher (Union[ITransactionFetcher, ITransactionBulkFetcher]): Used to fetch the transaction of the network. If it can fetch transactions in bulk
+                (`ITransactionBulkFetcher` or `ITransactionLookupsFetcher`), the many transactions awaited at once are fetched that way.
             polling_interval_in_milliseconds (Optional[int]): The polling interval, in milliseconds.
             timeout_interval_in_milliseconds (Optional[int]): The timeout, in milliseconds.
             patience_time_in_milliseconds (Optional[int]): The patience, an extra time (in milliseconds) to wait, after the transaction has reached its desired status. Currently there's a delay between the moment a transaction is marked as "completed" and the moment its outcome (contract results, events and logs) is available.
+            polling_schedule (Optional[IPollingSchedule]): If set, it decides the delays between polls (instead of the fixed polling interval), until the timeout elapses (e.g. `RoundAlignedPollingSchedule`).
+                Moreover, the patience time becomes an upper bound: the transaction is polled (following the schedule) only until its outcome is final (see `is_outcome_final()`).
         """
         self.fetcher = fetcher
 
@@ -48,6 +94,13 @@ class TransactionAwaiter:
         else:
             self.patience_time_in_milliseconds = patience_time_in_milliseconds
 
+        self.polling_schedule = polling_schedule
+
+        self._pending_waits: List[PendingTransactionWait] = []
+        self._worker_condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._is_closed = False
+
     def await_completed(self, tx_hash: str) -> TransactionOnNetwork:
         """Waits until the transaction is completely processed."""
         def is_completed(tx: TransactionOnNetwork):
@@ -57,7 +110,7 @@ class TransactionAwaiter:
             return tx.is_completed
 
         def do_fetch():
-            return self.fetcher.get_transaction(tx_hash)
+            return self._fetch_one(tx_hash)
 
         return self._await_conditionally(
             is_satisfied=is_completed,
@@ -68,7 +121,7 @@ class TransactionAwaiter:
     def await_on_condition(self, tx_hash: str, condition: Callable[[TransactionOnNetwork], bool]) -> TransactionOnNetwork:
         """Waits until the condition is satisfied."""
         def do_fetch():
-            return self.fetcher.get_transaction(tx_hash)
+            return self._fetch_one(tx_hash)
 
         return self._await_conditionally(
             is_satisfied=condition,
@@ -76,10 +129,342 @@ class TransactionAwaiter:
             error=ExpectedTransactionStatusNotReached()
         )
 
+    def submit(self,
+               tx_hash: str,
+               condition: Optional[Callable[[TransactionOnNetwork], bool]] = None,
+               callback: Optional[Callable[["Future[TransactionOnNetwork]"], None]] = None) -> "Future[TransactionOnNetwork]":
+        """
+        Starts awaiting the transaction, without blocking. The returned future is resolved once the condition is satisfied
+        (and the patience, if any, has elapsed), or fails (e.g. with `ExpectedTransactionStatusNotReached`, on timeout).
+
+        A single background worker polls (in bulk, see `await_completed_many()`) on behalf of all the outstanding futures;
+        it is started on the first call, and stopped by `close()`.
+
+        Args:
+            tx_hash (str): The hash of the transaction to await.
+            condition (Optional[Callable[[TransactionOnNetwork], bool]]): The condition to await. By default, the transaction to be completed.
+            callback (Optional[Callable[[Future[TransactionOnNetwork]], None]]): If set, called (on the worker thread) with the future, once it is resolved.
+        """
+        wait = PendingTransactionWait(
+            tx_hash=tx_hash,
+            condition=condition or self._is_completed,
+            deadline=time.monotonic() + self.timeout_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        )
+
+        if callback is not None:
+            wait.future.add_done_callback(callback)
+
+        with self._worker_condition:
+            if self._is_closed:
+                raise RuntimeError("the awaiter is closed")
+
+            self._pending_waits.append(wait)
+            self._ensure_worker_started()
+            self._worker_condition.notify()
+
+        return wait.future
+
+    async def await_completed_async(self, tx_hash: str) -> TransactionOnNetwork:
+        """Waits (without blocking the event loop) until the transaction is completely processed (see `submit()`)."""
+        return await asyncio.wrap_future(self.submit(tx_hash))
+
+    async def await_on_condition_async(self, tx_hash: str, condition: Callable[[TransactionOnNetwork], bool]) -> TransactionOnNetwork:
+        """Waits (without blocking the event loop) until the condition is satisfied (see `submit()`)."""
+        return await asyncio.wrap_future(self.submit(tx_hash, condition))
+
+    def close(self) -> None:
+        """Stops the background worker (if started). The futures still pending are cancelled."""
+        with self._worker_condition:
+            self._is_closed = True
+            worker = self._worker
+            waits = self._pending_waits
+            self._pending_waits = []
+            self._worker_condition.notify()
+
+        if worker is not None:
+            worker.join()
+
+        for wait in waits:
+            wait.future.cancel()
+
+    def __enter__(self) -> "TransactionAwaiter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def await_completed_many(self,
+                             tx_hashes: Sequence[str],
+                             timeouts_in_milliseconds: Optional[Dict[str, int]] = None,
+                             max_concurrent_fetches: int = DEFAULT_MAX_CONCURRENT_FETCHES) -> Iterator[TransactionLookupResult]:
+        """
+        Waits until the transactions are completely processed, yielding each one as soon as it is completed (thus, not in the input order).
+
+        A single polling loop serves all the transactions: at each polling interval, only the ones still pending are fetched.
+        If the fetcher supports it, they are fetched in bulk, with `get_bunch_of_transactions()` (API) or `get_transactions()` (proxy);
+        otherwise, with at most `max_concurrent_fetches` concurrent calls of `get_transaction()`.
+
+        A transaction which times out, or cannot be fetched, does not stop the others: its result holds the error.
+
+        Args:
+            tx_hashes (Sequence[str]): The hashes of the transactions to await.
+            timeouts_in_milliseconds (Optional[Dict[str, int]]): Per-hash timeouts. Hashes not in here use the timeout of the awaiter.
+            max_concurrent_fetches (int): The maximum number of concurrent `get_transaction()` calls, for fetchers without bulk support.
+        """
+        return self.await_on_condition_many(tx_hashes, self._is_completed, timeouts_in_milliseconds, max_concurrent_fetches)
+
+    def await_on_condition_many(self,
+                                tx_hashes: Sequence[str],
+                                condition: Callable[[TransactionOnNetwork], bool],
+                                timeouts_in_milliseconds: Optional[Dict[str, int]] = None,
+                                max_concurrent_fetches: int = DEFAULT_MAX_CONCURRENT_FETCHES) -> Iterator[TransactionLookupResult]:
+        """Waits until the condition is satisfied, for each transaction (see `await_completed_many()`)."""
+        timeouts = timeouts_in_milliseconds or {}
+        start = time.monotonic()
+        deadlines = {tx_hash: start + timeouts.get(tx_hash, self.timeout_interval_in_milliseconds) / ONE_SECOND_IN_MILLISECONDS for tx_hash in tx_hashes}
+        patience_deadlines: Dict[str, float] = {}
+        attempt = 0
+
+        with ThreadPoolExecutor(max_workers=max_concurrent_fetches, thread_name_prefix="awaiter") as executor:
+            while deadlines or patience_deadlines:
+                now = time.monotonic()
+
+                for tx_hash in [tx_hash for tx_hash, deadline in deadlines.items() if now >= deadline]:
+                    del deadlines[tx_hash]
+                    yield TransactionLookupResult(tx_hash, error=ExpectedTransactionStatusNotReached())
+
+                after_patience = [tx_hash for tx_hash, deadline in patience_deadlines.items() if now >= deadline]
+                fetched = self._fetch_many(list(deadlines) + after_patience, executor)
+
+                for tx_hash in after_patience:
+                    del patience_deadlines[tx_hash]
+                    yield fetched.get(tx_hash) or TransactionLookupResult(tx_hash, error=ExpectedTransactionStatusNotReached())
+
+                for tx_hash in list(deadlines):
+                    result = fetched.get(tx_hash)
+                    if result is None:
+                        continue
+
+                    try:
+                        is_condition_satisfied = result.transaction is not None and condition(result.transaction)
+                    except Exception as error:
+                        result = TransactionLookupResult(tx_hash, error=error)
+                        is_condition_satisfied = False
+
+                    if result.error is not None:
+                        del deadlines[tx_hash]
+                        yield result
+                    elif is_condition_satisfied:
+                        del deadlines[tx_hash]
+
+                        if self.patience_time_in_milliseconds and not self._is_outcome_known_final(result.transaction):
+                            patience_deadlines[tx_hash] = time.monotonic() + self.patience_time_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+                        else:
+                            yield result
+
+                if deadlines or patience_deadlines:
+                    time.sleep(self._get_sleep_duration(attempt, deadlines, patience_deadlines))
+                    attempt += 1
+
+    def _ensure_worker_started(self) -> None:
+        if self._worker is not None:
+            return
+
+        self._worker = threading.Thread(target=self._poll_pending_waits, name="awaiter-worker", daemon=True)
+        self._worker.start()
+
+    def _poll_pending_waits(self) -> None:
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENT_FETCHES, thread_name_prefix="awaiter") as executor:
+            while True:
+                with self._worker_condition:
+                    while not self._is_closed and not self._has_due_waits():
+                        self._worker_condition.wait(self._get_time_until_next_wake_up())
+
+                    if self._is_closed:
+                        return
+
+                    now = time.monotonic()
+                    due = [wait for wait in self._pending_waits if now >= wait.next_poll_at or self._is_expired(wait, now)]
+
+                try:
+                    self._poll(due, executor)
+                except Exception as error:
+                    logger.error(f"Could not poll the transactions: {error}")
+
+                    for wait in due:
+                        self._settle(wait, error=error)
+
+    def _has_due_waits(self) -> bool:
+        now = time.monotonic()
+        return any(now >= wait.next_poll_at or self._is_expired(wait, now) for wait in self._pending_waits)
+
+    def _get_time_until_next_wake_up(self) -> Optional[float]:
+        if not self._pending_waits:
+            return None
+
+        wake_up_at = min(min(wait.next_poll_at, wait.patience_deadline or wait.deadline) for wait in self._pending_waits)
+        return max(wake_up_at - time.monotonic(), 0)
+
+    def _is_expired(self, wait: PendingTransactionWait, now: float) -> bool:
+        if wait.patience_deadline is not None:
+            return now >= wait.patience_deadline
+        return now >= wait.deadline
+
+    def _poll(self, waits: List[PendingTransactionWait], executor: ThreadPoolExecutor) -> None:
+        for wait in [wait for wait in waits if wait.future.cancelled()]:
+            self._settle(wait)
+            waits.remove(wait)
+
+        now = time.monotonic()
+        expired = [wait for wait in waits if self._is_expired(wait, now) and wait.patience_deadline is None]
+        to_fetch = [wait for wait in waits if wait not in expired]
+
+        for wait in expired:
+            self._settle(wait, error=ExpectedTransactionStatusNotReached())
+
+        fetched = self._fetch_many(list(dict.fromkeys(wait.hash for wait in to_fetch)), executor)
+
+        for wait in to_fetch:
+            self._handle_fetched(wait, fetched.get(wait.hash))
+
+    def _handle_fetched(self, wait: PendingTransactionWait, result: Optional[TransactionLookupResult]) -> None:
+        now = time.monotonic()
+
+        if result is not None and result.error is not None:
+            self._settle(wait, error=result.error)
+            return
+
+        transaction = result.transaction if result is not None else None
+
+        if wait.patience_deadline is not None:
+            wait.transaction = transaction or wait.transaction
+
+            if now >= wait.patience_deadline or self._is_outcome_known_final(wait.transaction):
+                self._settle(wait, transaction=wait.transaction)
+            else:
+                self._schedule_next_poll(wait, wait.patience_deadline)
+            return
+
+        try:
+            is_condition_satisfied = transaction is not None and wait.condition(transaction)
+        except Exception as error:
+            self._settle(wait, error=error)
+            return
+
+        if not is_condition_satisfied:
+            self._schedule_next_poll(wait, wait.deadline)
+        elif self.patience_time_in_milliseconds and not self._is_outcome_known_final(transaction):
+            # Same as for the blocking variants: without a schedule, fetch once more, after the patience time.
+            wait.transaction = transaction
+            wait.patience_deadline = now + self.patience_time_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+            wait.attempt = 0
+            self._schedule_next_poll(wait, wait.patience_deadline)
+        else:
+            self._settle(wait, transaction=transaction)
+
+    def _schedule_next_poll(self, wait: PendingTransactionWait, not_after: float) -> None:
+        if self.polling_schedule is None and wait.patience_deadline is not None:
+            wait.next_poll_at = wait.patience_deadline
+            return
+
+        delay = self._get_polling_delay_in_milliseconds(wait.attempt) / ONE_SECOND_IN_MILLISECONDS
+        wait.next_poll_at = min(time.monotonic() + delay, not_after)
+        wait.attempt += 1
+
+    def _settle(self,
+                wait: PendingTransactionWait,
+                transaction: Optional[TransactionOnNetwork] = None,
+                error: Optional[Exception] = None) -> None:
+        with self._worker_condition:
+            if wait not in self._pending_waits:
+                return
+            self._pending_waits.remove(wait)
+
+        # The caller may have cancelled the future in the meantime.
+        if wait.future.done():
+            return
+
+        if error is not None:
+            wait.future.set_exception(error)
+        elif transaction is None:
+            wait.future.set_exception(ExpectedTransactionStatusNotReached())
+        else:
+            wait.future.set_result(transaction)
+
+    def _fetch_one(self, tx_hash: str) -> TransactionOnNetwork:
+        if isinstance(self.fetcher, ITransactionFetcher):
+            return self.fetcher.get_transaction(tx_hash)
+
+        for transaction in self.fetcher.get_bunch_of_transactions([tx_hash]):
+            if transaction.hash == tx_hash:
+                return transaction
+
+        raise TransactionNotFoundError(tx_hash)
+
+    def _fetch_many(self, tx_hashes: List[str], executor: ThreadPoolExecutor) -> Dict[str, TransactionLookupResult]:
+        """Fetches the transactions; the ones not found (yet) are missing from the result."""
+        if not tx_hashes:
+            return {}
+
+        fetcher = self.fetcher
+
+        if isinstance(fetcher, ITransactionBulkFetcher):
+            results: Dict[str, TransactionLookupResult] = {}
+
+            for i in range(0, len(tx_hashes), DEFAULT_BUNCH_SIZE):
+                bunch = tx_hashes[i:i + DEFAULT_BUNCH_SIZE]
+
+                try:
+                    transactions = fetcher.get_bunch_of_transactions(bunch)
+                except Exception as error:
+                    results.update({tx_hash: TransactionLookupResult(tx_hash, error=error) for tx_hash in bunch})
+                    continue
+
+                for transaction in transactions:
+                    results[transaction.hash] = TransactionLookupResult(transaction.hash, transaction=transaction)
+
+            return results
+
+        if isinstance(fetcher, ITransactionLookupsFetcher):
+            lookups = fetcher.get_transactions(tx_hashes, with_process_status=True)
+            return {result.hash: result for result in lookups}
+
+        def fetch(tx_hash: str) -> TransactionLookupResult:
+            try:
+                return TransactionLookupResult(tx_hash, transaction=self._fetch_one(tx_hash))
+            except Exception as error:
+                return TransactionLookupResult(tx_hash, error=error)
+
+        return {result.hash: result for result in executor.map(fetch, tx_hashes)}
+
+    def _is_completed(self, transaction: TransactionOnNetwork) -> bool:
+        if transaction.is_completed is None:
+            raise IsCompletedFieldMissingOnTransaction()
+
+        return transaction.is_completed
+
+    def _get_sleep_duration(self, attempt: int, deadlines: Dict[str, float], patience_deadlines: Dict[str, float]) -> float:
+        now = time.monotonic()
+        wake_up_at = now + self._get_polling_delay_in_milliseconds(attempt) / ONE_SECOND_IN_MILLISECONDS
+        wake_up_at = min([wake_up_at, *deadlines.values(), *patience_deadlines.values()])
+        return max(wake_up_at - now, 0)
+
+    def _get_polling_delay_in_milliseconds(self, attempt: int) -> int:
+        if self.polling_schedule is None:
+            return self.polling_interval_in_milliseconds
+        return self.polling_schedule.get_delay_in_milliseconds(attempt)
+
+    def _is_outcome_known_final(self, transaction: Optional[TransactionOnNetwork]) -> bool:
+        # Without a schedule, the patience time is always waited for (as it used to be).
+        return self.polling_schedule is not None and transaction is not None and is_outcome_final(transaction)
+
     def _await_conditionally(self,
                              is_satisfied: Callable[[TransactionOnNetwork], bool],
                              do_fetch: Callable[[], TransactionOnNetwork],
                              error: Exception) -> TransactionOnNetwork:
+        if self.polling_schedule is not None:
+            return self._await_on_schedule(self.polling_schedule, is_satisfied, do_fetch, error)
+
         is_condition_satisfied = False
         fetched_data: Union[TransactionOnNetwork, None] = None
         max_number_of_retries = self.timeout_interval_in_milliseconds // self.polling_interval_in_milliseconds
@@ -106,3 +491,36 @@ class TransactionAwaiter:
             return do_fetch()
 
         return fetched_data
+
+    def _await_on_schedule(self,
+                           schedule: IPollingSchedule,
+                           is_satisfied: Callable[[TransactionOnNetwork], bool],
+                           do_fetch: Callable[[], TransactionOnNetwork],
+                           error: Exception) -> TransactionOnNetwork:
+        deadline = time.monotonic() + self.timeout_interval_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        attempt = 0
+
+        fetched_data = do_fetch()
+        while not is_satisfied(fetched_data):
+            delay = schedule.get_delay_in_milliseconds(attempt) / ONE_SECOND_IN_MILLISECONDS
+            if time.monotonic() + delay > deadline:
+                raise error
+
+            attempt += 1
+            time.sleep(delay)
+            fetched_data = do_fetch()
+
+        # The patience time is an upper bound: polling stops as soon as the outcome is final.
+        patience_deadline = time.monotonic() + self.patience_time_in_milliseconds / ONE_SECOND_IN_MILLISECONDS
+        attempt = 0
+
+        while self.patience_time_in_milliseconds and not is_outcome_final(fetched_data):
+            remaining = patience_deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            time.sleep(min(schedule.get_delay_in_milliseconds(attempt) / ONE_SECOND_IN_MILLISECONDS, remaining))
+            attempt += 1
+            fetched_data = do_fetch()
+
+        return fetched_data
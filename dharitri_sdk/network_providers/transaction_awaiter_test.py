@@ -1,14 +1,22 @@
+import asyncio
+from concurrent.futures import Future
+from typing import Dict, List
+
 import pytest
 
 from dharitri_sdk.core.address import Address
 from dharitri_sdk.core.transaction import Transaction
 from dharitri_sdk.core.transaction_computer import TransactionComputer
+from dharitri_sdk.network_providers.errors import \
+    ExpectedTransactionStatusNotReached
 from dharitri_sdk.network_providers.proxy_network_provider import \
     ProxyNetworkProvider
 from dharitri_sdk.network_providers.transaction_awaiter import \
     TransactionAwaiter
 from dharitri_sdk.network_providers.transaction_status import TransactionStatus
 from dharitri_sdk.network_providers.transactions import TransactionOnNetwork
+from dharitri_sdk.testutils.mock_http_server import (MockHttpResponse,
+                                                     MockHttpServer)
 from dharitri_sdk.testutils.mock_network_provider import (
     MockNetworkProvider, TimelinePointMarkCompleted, TimelinePointWait)
 from dharitri_sdk.testutils.wallets import load_wallets
@@ -82,3 +90,149 @@ class TestTransactionAwaiter:
 
         tx_from_network = self.watcher.await_on_condition(tx_hash, condition)
         assert tx_from_network.status.is_failed()
+
+
+class BunchFetcher:
+    def __init__(self, completed_after: Dict[str, int]) -> None:
+        self.completed_after = completed_after
+        self.requested_bunches: List[List[str]] = []
+
+    def get_bunch_of_transactions(self, tx_hashes: List[str]) -> List[TransactionOnNetwork]:
+        self.requested_bunches.append(list(tx_hashes))
+        transactions: List[TransactionOnNetwork] = []
+
+        for tx_hash in tx_hashes:
+            transaction = TransactionOnNetwork()
+            transaction.hash = tx_hash
+            transaction.is_completed = len(self.requested_bunches) >= self.completed_after[tx_hash]
+            transactions.append(transaction)
+
+        return transactions
+
+
+class TestTransactionAwaiterForMany:
+    def test_await_completed_many_with_bunches(self):
+        fetcher = BunchFetcher({"a": 1, "b": 3, "c": 2})
+        awaiter = TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, timeout_interval_in_milliseconds=1000)
+
+        results = list(awaiter.await_completed_many(["a", "b", "c"]))
+
+        assert [result.hash for result in results] == ["a", "c", "b"]
+        assert all(result.is_ok() for result in results)
+        # only the pending transactions are polled
+        assert fetcher.requested_bunches == [["a", "b", "c"], ["b", "c"], ["b"]]
+
+    def test_await_completed_with_bulk_fetcher(self):
+        fetcher = BunchFetcher({"a": 2})
+        awaiter = TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, timeout_interval_in_milliseconds=1000)
+
+        assert awaiter.await_completed("a").is_completed
+        assert fetcher.requested_bunches == [["a"], ["a"]]
+
+    def test_await_completed_many_with_per_hash_timeouts(self):
+        fetcher = BunchFetcher({"a": 1, "b": 1000, "c": 1000})
+        awaiter = TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, timeout_interval_in_milliseconds=200)
+
+        results = list(awaiter.await_completed_many(["a", "b", "c"], timeouts_in_milliseconds={"b": 50}))
+
+        assert [result.hash for result in results] == ["a", "b", "c"]
+        assert results[0].is_ok()
+        assert isinstance(results[1].error, ExpectedTransactionStatusNotReached)
+        assert isinstance(results[2].error, ExpectedTransactionStatusNotReached)
+
+    def test_await_completed_many_with_single_fetches(self):
+        provider = MockNetworkProvider()
+        hashes = [f"{i:064x}" for i in range(20)]
+
+        for i, tx_hash in enumerate(hashes):
+            transaction = TransactionOnNetwork()
+            transaction.status = TransactionStatus("pending")
+            provider.mock_put_transaction(tx_hash, transaction)
+            provider.mock_transaction_timeline_by_hash(tx_hash, [TimelinePointWait(10 * (i % 4)), TransactionStatus("success"), TimelinePointMarkCompleted()])
+
+        awaiter = TransactionAwaiter(fetcher=provider, polling_interval_in_milliseconds=20, timeout_interval_in_milliseconds=2000)
+        results = list(awaiter.await_completed_many(hashes, max_concurrent_fetches=4))
+
+        assert sorted(result.hash for result in results) == hashes
+        assert all(result.is_ok() and result.transaction.status.is_successful() for result in results if result.transaction)
+
+    def test_await_completed_many_with_patience(self):
+        fetcher = BunchFetcher({"a": 1})
+        awaiter = TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, patience_time_in_milliseconds=50)
+
+        [result] = list(awaiter.await_completed_many(["a"]))
+
+        assert result.is_ok()
+        # the transaction is fetched once more, after the patience time
+        assert fetcher.requested_bunches == [["a"], ["a"]]
+
+    def test_await_completed_many_with_proxy(self):
+        with MockHttpServer() as server:
+            transaction = {"data": {"transaction": {"nonce": 7, "status": "success"}}, "code": "successful"}
+            server.mock_route("GET", f"/transaction/{'a' * 64}", MockHttpResponse(transaction))
+            server.mock_route("GET", f"/transaction/{'a' * 64}/process-status", MockHttpResponse({"data": {"status": "success"}}))
+
+            with ProxyNetworkProvider(server.url) as proxy:
+                awaiter = TransactionAwaiter(fetcher=proxy, polling_interval_in_milliseconds=10)
+                [completed, missing] = list(awaiter.await_completed_many(["a" * 64, "b" * 64]))
+
+            assert completed.is_ok() and completed.transaction and completed.transaction.nonce == 7
+            assert missing.hash == "b" * 64 and missing.error is not None
+
+
+class TestTransactionAwaiterWithFutures:
+    def test_submit_many(self):
+        fetcher = BunchFetcher({"a": 1, "b": 3, "c": 2})
+        resolved: List[str] = []
+
+        with TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, timeout_interval_in_milliseconds=1000) as awaiter:
+            futures = [awaiter.submit(tx_hash, callback=lambda future: resolved.append(future.result().hash)) for tx_hash in ["a", "b", "c"]]
+
+            assert [future.result(timeout=1).hash for future in futures] == ["a", "b", "c"]
+            # a single worker polls for all the futures, in bulk
+            assert any(len(bunch) > 1 for bunch in fetcher.requested_bunches)
+            assert fetcher.requested_bunches[-1] == ["b"]
+
+        # the callbacks are called on the worker, which is joined on close
+        assert sorted(resolved) == ["a", "b", "c"]
+
+    def test_submit_with_timeout(self):
+        fetcher = BunchFetcher({"a": 1000})
+
+        with TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, timeout_interval_in_milliseconds=50) as awaiter:
+            future = awaiter.submit("a")
+
+            with pytest.raises(ExpectedTransactionStatusNotReached):
+                future.result(timeout=1)
+
+    def test_submit_with_patience(self):
+        fetcher = BunchFetcher({"a": 1})
+
+        with TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10, patience_time_in_milliseconds=50) as awaiter:
+            assert awaiter.submit("a").result(timeout=1).is_completed
+            # the transaction is fetched once more, after the patience time
+            assert fetcher.requested_bunches == [["a"], ["a"]]
+
+    def test_close_cancels_pending_futures(self):
+        awaiter = TransactionAwaiter(fetcher=BunchFetcher({"a": 1000}), polling_interval_in_milliseconds=10)
+        future: "Future[TransactionOnNetwork]" = awaiter.submit("a")
+        awaiter.close()
+
+        assert future.cancelled()
+
+        with pytest.raises(RuntimeError):
+            awaiter.submit("a")
+
+    def test_await_completed_async(self):
+        fetcher = BunchFetcher({"a": 2, "b": 1})
+
+        async def await_both(awaiter: TransactionAwaiter):
+            return await asyncio.gather(
+                awaiter.await_completed_async("a"),
+                awaiter.await_on_condition_async("b", lambda tx: bool(tx.is_completed))
+            )
+
+        with TransactionAwaiter(fetcher=fetcher, polling_interval_in_milliseconds=10) as awaiter:
+            [a, b] = asyncio.run(await_both(awaiter))
+
+        assert (a.hash, b.hash) == ("a", "b")
@@ -156,6 +156,18 @@ class TransactionOnNetwork:
         }
 
 
+class TransactionLookupResult:
+    """The outcome of looking up a single transaction, as part of a bulk fetch."""
+
+    def __init__(self, hash: str, transaction: Optional[TransactionOnNetwork] = None, error: Optional[Exception] = None) -> None:
+        self.hash = hash
+        self.transaction = transaction
+        self.error = error
+
+    def is_ok(self) -> bool:
+        return self.error is None and self.transaction is not None
+
+
 class TransactionInMempool:
     def __init__(self) -> None:
         self.hash: str = ""
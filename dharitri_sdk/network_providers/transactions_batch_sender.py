@@ -0,0 +1,180 @@
+import json
+import logging
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Set, Tuple,
+                    Union)
+
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import TransactionsNotSentError
+from dharitri_sdk.network_providers.transactions import (
+    ITransaction, transaction_to_dictionary)
+
+logger = logging.getLogger("transactions_batch_sender")
+
+SEND_MULTIPLE_RESOURCE = "transaction/send-multiple"
+
+
+class TransactionsChunk:
+    def __init__(self, offset: int, payloads: List[Dict[str, Any]]) -> None:
+        self.offset = offset
+        self.payloads = payloads
+        self.senders = {payload.get("sender") for payload in payloads}
+
+
+class TransactionsBatchSender:
+    """
+    Sends a (possibly large) sequence of transactions through `transaction/send-multiple`, in chunks.
+
+    The input is split by count and by serialized size. Chunks are submitted concurrently, as long as they do not share a sender:
+    the chunks holding transactions of the same sender are sent one after another, in input order, so that their nonces reach the network in order.
+    Failed chunks are retried, and the `txsHashes` maps of the responses are merged back, keyed by the position of each transaction within the input
+    (just like the response of a single `transaction/send-multiple` request).
+    """
+
+    def __init__(self,
+                 post: Callable[[str, Any], Any],
+                 config: NetworkProviderConfig,
+                 get_executor: Callable[[], Executor]) -> None:
+        """
+        Args:
+            post (Callable[[str, Any], Any]): Posts a payload to a resource of the network provider, and returns the (dictionary-like) response data.
+            config (NetworkProviderConfig): Holds the chunking, concurrency and retry settings.
+            get_executor (Callable[[], Executor]): Provides the worker pool used to submit the chunks concurrently.
+        """
+        self.post = post
+        self.get_executor = get_executor
+        self.chunk_size = config.send_transactions_chunk_size
+        self.chunk_max_bytes = config.send_transactions_chunk_max_bytes
+        self.max_concurrency = config.send_transactions_max_concurrency
+        self.chunk_retries = config.send_transactions_chunk_retries
+
+    def send(self, transactions: Sequence[ITransaction]) -> Tuple[int, Dict[str, str]]:
+        """
+        Returns the number of accepted transactions, and their hashes, keyed by their (stringified) index within the input.
+
+        If a chunk still fails after the retries, `TransactionsNotSentError` is raised, holding the indices of the transactions that were not sent,
+        along with the (partial) result of the other chunks. The subsequent chunks of the same sender(s) are not sent at all, and are reported as failed, too.
+        """
+        payloads = [transaction_to_dictionary(transaction) for transaction in transactions]
+        chunks = self.split_into_chunks(payloads)
+        if not chunks:
+            return 0, {}
+
+        responses: Dict[int, Tuple[int, Dict[str, str]]] = {}
+        failed_indices: List[int] = []
+        first_error: Optional[Exception] = None
+
+        for chunk, outcome in sorted(self._send_chunks(chunks), key=lambda item: item[0].offset):
+            if isinstance(outcome, Exception):
+                failed_indices.extend(range(chunk.offset, chunk.offset + len(chunk.payloads)))
+                first_error = first_error or outcome
+            else:
+                responses[chunk.offset] = outcome
+
+        num_sent, hashes = self._merge_responses(responses)
+
+        if first_error is not None:
+            raise TransactionsNotSentError(failed_indices, num_sent, hashes, first_error)
+
+        return num_sent, hashes
+
+    def split_into_chunks(self, payloads: List[Dict[str, Any]]) -> List[TransactionsChunk]:
+        chunks: List[TransactionsChunk] = []
+        current: List[Dict[str, Any]] = []
+        current_size = 0
+        offset = 0
+
+        for index, payload in enumerate(payloads):
+            # Each item of the JSON array is followed by a separator (", ").
+            size = len(json.dumps(payload)) + 2
+            is_full = len(current) >= self.chunk_size or current_size + size > self.chunk_max_bytes
+
+            if current and is_full:
+                chunks.append(TransactionsChunk(offset, current))
+                current, current_size, offset = [], 0, index
+
+            current.append(payload)
+            current_size += size
+
+        if current:
+            chunks.append(TransactionsChunk(offset, current))
+
+        return chunks
+
+    def _send_chunks(self, chunks: List[TransactionsChunk]) -> List[Tuple[TransactionsChunk, Union[Tuple[int, Dict[str, str]], Exception]]]:
+        if len(chunks) == 1:
+            return [(chunks[0], self._try_send_chunk(chunks[0]))]
+
+        # Each chunk waits for the previous chunks holding transactions of the same sender(s).
+        predecessors: List[Set[int]] = []
+        last_chunk_by_sender: Dict[Any, int] = {}
+
+        for index, chunk in enumerate(chunks):
+            predecessors.append({last_chunk_by_sender[sender] for sender in chunk.senders if sender in last_chunk_by_sender})
+            last_chunk_by_sender.update((sender, index) for sender in chunk.senders)
+
+        executor = self.get_executor()
+        waiting: List[int] = list(range(len(chunks)))
+        in_flight: Dict[Future[Union[Tuple[int, Dict[str, str]], Exception]], int] = {}
+        outcomes: Dict[int, Union[Tuple[int, Dict[str, str]], Exception]] = {}
+
+        def submit_ready() -> None:
+            for index in list(waiting):
+                if len(in_flight) >= self.max_concurrency:
+                    return
+                if not predecessors[index].issubset(outcomes):
+                    continue
+
+                waiting.remove(index)
+                failed_predecessor = next((outcomes[i] for i in sorted(predecessors[index]) if isinstance(outcomes[i], Exception)), None)
+
+                if failed_predecessor is not None:
+                    # Sending it would leave a gap within the nonces of the sender. Since the predecessors of a chunk
+                    # come before it, the chunks depending on this one are handled further within the same pass.
+                    outcomes[index] = failed_predecessor
+                else:
+                    in_flight[executor.submit(self._try_send_chunk, chunks[index])] = index
+
+        submit_ready()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                outcomes[in_flight.pop(future)] = future.result()
+
+            submit_ready()
+
+        return [(chunks[index], outcome) for index, outcome in outcomes.items()]
+
+    def _try_send_chunk(self, chunk: TransactionsChunk) -> Union[Tuple[int, Dict[str, str]], Exception]:
+        attempt = 0
+
+        while True:
+            try:
+                return self._send_chunk(chunk)
+            except Exception as error:
+                if attempt >= self.chunk_retries:
+                    return error
+                logger.warning(f"Could not send the transactions [{chunk.offset}, {chunk.offset + len(chunk.payloads)}), retrying: {error}")
+
+            attempt += 1
+
+    def _send_chunk(self, chunk: TransactionsChunk) -> Tuple[int, Dict[str, str]]:
+        response = self.post(SEND_MULTIPLE_RESOURCE, chunk.payloads)
+
+        # Proxy and Observers have different response format:
+        num_sent = response.get("numOfSentTxs", 0) or response.get("txsSent", 0)
+        hashes = response.get("txsHashes") or {}
+        return num_sent, hashes
+
+    def _merge_responses(self, responses: Dict[int, Tuple[int, Dict[str, str]]]) -> Tuple[int, Dict[str, str]]:
+        total_sent = 0
+        indexed_hashes: List[Tuple[int, str]] = []
+
+        for offset, (num_sent, hashes) in responses.items():
+            total_sent += num_sent
+            indexed_hashes.extend((offset + int(index), tx_hash) for index, tx_hash in hashes.items())
+
+        indexed_hashes.sort()
+        return total_sent, {str(index): tx_hash for index, tx_hash in indexed_hashes}
@@ -0,0 +1,158 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+
+from dharitri_sdk.core.transaction import Transaction
+from dharitri_sdk.network_providers.config import NetworkProviderConfig
+from dharitri_sdk.network_providers.errors import (GenericError,
+                                                   TransactionsNotSentError)
+from dharitri_sdk.network_providers.transactions_batch_sender import \
+    TransactionsBatchSender
+
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+BOB = "drt18s6a06ktr2v6fgxv4ffhauxvptssnaqlds45qgsrucemlwc8rawqfgxqg5"
+
+
+class FakeNetwork:
+    def __init__(self, failures_by_first_nonce: Dict[int, int] = {}) -> None:
+        self.failures_by_first_nonce = dict(failures_by_first_nonce)
+        self.posted_chunks: List[List[Dict[str, Any]]] = []
+        self.lock = threading.Lock()
+
+    def post(self, resource_url: str, payload: Any) -> Dict[str, Any]:
+        assert resource_url == "transaction/send-multiple"
+
+        with self.lock:
+            self.posted_chunks.append(payload)
+            first_nonce = payload[0]["nonce"]
+            if self.failures_by_first_nonce.get(first_nonce, 0) > 0:
+                self.failures_by_first_nonce[first_nonce] -= 1
+                raise GenericError(resource_url, "502 Bad Gateway")
+
+        # transactions with an odd nonce are "rejected" by the network
+        hashes = {str(i): f"hash-{tx['nonce']}" for i, tx in enumerate(payload) if tx["nonce"] % 2 == 0}
+        return {"numOfSentTxs": len(hashes), "txsHashes": hashes}
+
+
+def create_transactions(count: int, data: bytes = b"", sender: str = ALICE) -> List[Transaction]:
+    return [Transaction(sender=sender, receiver=ALICE, gas_limit=50000, chain_id="D", nonce=nonce, data=data) for nonce in range(count)]
+
+
+def create_sender(network: FakeNetwork, **kwargs: Any) -> TransactionsBatchSender:
+    executor = ThreadPoolExecutor(max_workers=4)
+    return TransactionsBatchSender(network.post, NetworkProviderConfig(**kwargs), lambda: executor)
+
+
+def test_send_in_chunks_and_merge_in_input_order():
+    network = FakeNetwork()
+    sender = create_sender(network, send_transactions_chunk_size=7, send_transactions_max_concurrency=3)
+
+    num_sent, hashes = sender.send(create_transactions(50))
+
+    assert len(network.posted_chunks) == 8
+    assert max(len(chunk) for chunk in network.posted_chunks) == 7
+    assert num_sent == 25
+    assert list(hashes.keys()) == [str(i) for i in range(0, 50, 2)]
+    assert all(hashes[str(i)] == f"hash-{i}" for i in range(0, 50, 2))
+
+
+def test_split_by_serialized_size():
+    network = FakeNetwork()
+    sender = create_sender(network, send_transactions_chunk_max_bytes=2000)
+    chunks = sender.split_into_chunks([{"nonce": i, "data": "a" * 900} for i in range(5)])
+
+    assert [len(chunk.payloads) for chunk in chunks] == [2, 2, 1]
+    assert [chunk.offset for chunk in chunks] == [0, 2, 4]
+
+    # a transaction larger than the limit is sent on its own
+    chunks = sender.split_into_chunks([{"nonce": 0, "data": "a" * 5000}, {"nonce": 1}])
+    assert [len(chunk.payloads) for chunk in chunks] == [1, 1]
+
+
+def test_only_failed_chunks_are_retried():
+    network = FakeNetwork(failures_by_first_nonce={10: 2})
+    sender = create_sender(network, send_transactions_chunk_size=10, send_transactions_chunk_retries=2)
+
+    num_sent, hashes = sender.send(create_transactions(30))
+
+    first_nonces = [chunk[0]["nonce"] for chunk in network.posted_chunks]
+    assert first_nonces == [0, 10, 10, 10, 20]
+    assert num_sent == 15
+    assert hashes["10"] == "hash-10"
+
+
+def test_chunks_of_a_sender_are_sent_in_order_and_senders_concurrently():
+    network = FakeNetwork()
+    in_flight: List[str] = []
+    max_in_flight = 0
+    both_senders_started = threading.Barrier(2, timeout=5)
+
+    def post(resource_url: str, payload: Any) -> Dict[str, Any]:
+        nonlocal max_in_flight
+        with network.lock:
+            in_flight.append(payload[0]["sender"])
+            max_in_flight = max(max_in_flight, len(in_flight))
+            assert len(set(in_flight)) == len(in_flight), "chunks of the same sender sent concurrently"
+
+        if payload[0]["nonce"] == 0:
+            both_senders_started.wait()
+
+        try:
+            return network.post(resource_url, payload)
+        finally:
+            with network.lock:
+                in_flight.remove(payload[0]["sender"])
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    sender = TransactionsBatchSender(post, NetworkProviderConfig(send_transactions_chunk_size=5), lambda: executor)
+
+    num_sent, hashes = sender.send(create_transactions(20, sender=ALICE) + create_transactions(20, sender=BOB))
+
+    assert max_in_flight == 2
+    for address in [ALICE, BOB]:
+        nonces = [chunk[0]["nonce"] for chunk in network.posted_chunks if chunk[0]["sender"] == address]
+        assert nonces == [0, 5, 10, 15]
+
+    assert num_sent == 20
+    assert hashes["20"] == "hash-0"
+
+
+def test_error_is_raised_when_chunks_fail_after_retries():
+    network = FakeNetwork(failures_by_first_nonce={10: 5})
+    sender = create_sender(network, send_transactions_chunk_size=10, send_transactions_chunk_retries=1)
+
+    with pytest.raises(TransactionsNotSentError) as error:
+        sender.send(create_transactions(30, sender=ALICE) + create_transactions(10, sender=BOB))
+
+    # the chunk after the failed one (of the same sender) is not sent at all
+    first_nonces = [(chunk[0]["sender"], chunk[0]["nonce"]) for chunk in network.posted_chunks]
+    assert sorted(first_nonces) == [(BOB, 0), (ALICE, 0), (ALICE, 10), (ALICE, 10)]
+
+    assert error.value.failed_indices == list(range(10, 30))
+    assert isinstance(error.value.cause, GenericError)
+    assert error.value.num_sent == 10
+    assert error.value.hashes["0"] == "hash-0"
+    assert error.value.hashes["30"] == "hash-0"
+    assert "12" not in error.value.hashes
+
+
+def test_error_is_raised_when_all_chunks_fail():
+    network = FakeNetwork(failures_by_first_nonce={0: 5})
+    sender = create_sender(network, send_transactions_chunk_retries=1)
+
+    with pytest.raises(TransactionsNotSentError) as error:
+        sender.send(create_transactions(3))
+
+    assert len(network.posted_chunks) == 2
+    assert error.value.failed_indices == [0, 1, 2]
+    assert error.value.num_sent == 0
+
+
+def test_send_nothing():
+    network = FakeNetwork()
+    sender = create_sender(network)
+
+    assert sender.send([]) == (0, {})
+    assert network.posted_chunks == []
@@ -0,0 +1,123 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+
+class RecordedRequest:
+    def __init__(self, method: str, path: str, query: str, headers: Dict[str, str], body: bytes) -> None:
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class MockHttpResponse:
+    def __init__(self, payload: Any = None, status: int = 200, headers: Optional[Dict[str, str]] = None, delay_in_seconds: float = 0) -> None:
+        self.payload = payload
+        self.status = status
+        self.headers = headers or {}
+        self.delay_in_seconds = delay_in_seconds
+
+
+Responder = Union[MockHttpResponse, Callable[[RecordedRequest], MockHttpResponse]]
+
+
+class _BacklogHTTPServer(ThreadingHTTPServer):
+    # Many clients may connect at once (the default backlog, of 5 connections, would delay them).
+    request_queue_size = 1024
+
+
+class MockHttpServer:
+    """A local HTTP/1.1 server (with keep-alive), used to test the network providers without reaching the real network."""
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], Responder] = {}
+        self.requests: List[RecordedRequest] = []
+        self.num_connections = 0
+        self._lock = threading.Lock()
+        self._server = _BacklogHTTPServer(("127.0.0.1", 0), self._create_handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def mock_route(self, method: str, path: str, responder: Responder) -> None:
+        self.routes[(method, path)] = responder
+
+    def start(self) -> "MockHttpServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockHttpServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _handle(self, request: RecordedRequest) -> MockHttpResponse:
+        with self._lock:
+            self.requests.append(request)
+
+        responder = self.routes.get((request.method, request.path))
+        if responder is None:
+            return MockHttpResponse({"error": "not found", "code": "not_found"}, status=404)
+        if isinstance(responder, MockHttpResponse):
+            return responder
+        return responder(request)
+
+    def _on_connection(self) -> None:
+        with self._lock:
+            self.num_connections += 1
+
+    def _create_handler_class(self) -> Any:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                server._on_connection()
+
+            def do_GET(self) -> None:
+                self._respond("GET")
+
+            def do_POST(self) -> None:
+                self._respond("POST")
+
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                parts = urlsplit(self.path)
+                request = RecordedRequest(method, parts.path, parts.query, dict(self.headers), body)
+                response = server._handle(request)
+
+                if response.delay_in_seconds:
+                    threading.Event().wait(response.delay_in_seconds)
+
+                content = json.dumps(response.payload).encode()
+                self.send_response(response.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -1,8 +1,10 @@
 from dharitri_sdk.wallet.mnemonic import Mnemonic
+from dharitri_sdk.wallet.transaction_signing_engine import (
+    SigningReport, TransactionSigningEngine)
 from dharitri_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
 from dharitri_sdk.wallet.user_pem import UserPEM
 from dharitri_sdk.wallet.user_signer import UserSigner
-from dharitri_sdk.wallet.user_verifer import UserVerifier
+from dharitri_sdk.wallet.user_verifer import UserVerifier, verify_transactions
 from dharitri_sdk.wallet.user_wallet import UserWallet
 from dharitri_sdk.wallet.validator_keys import (ValidatorPublicKey,
                                                 ValidatorSecretKey)
@@ -15,5 +17,6 @@ __all__ = [
     "UserPublicKey", "ValidatorSecretKey",
     "ValidatorPublicKey", "UserVerifier",
     "ValidatorSigner", "ValidatorVerifier", "ValidatorPEM",
-    "UserWallet", "UserPEM"
+    "UserWallet", "UserPEM", "TransactionSigningEngine", "SigningReport",
+    "verify_transactions"
 ]
@@ -1,5 +1,8 @@
 
-from typing import Protocol
+from typing import List, Protocol, Sequence
+
+# The transactions are serialized (for signing and verifying) by the transaction computer of the core package, thus they share its protocol.
+from dharitri_sdk.core.interfaces import ITransaction
 
 ISignature = bytes
 
@@ -16,3 +19,11 @@ class IAddress(Protocol):
 
     def to_hex(self) -> str:
         ...
+
+
+class ITransactionComputer(Protocol):
+    def compute_bytes_for_verifying(self, transaction: ITransaction) -> bytes:
+        ...
+
+    def compute_bytes_for_verifying_many(self, transactions: Sequence[ITransaction]) -> List[bytes]:
+        ...
@@ -0,0 +1,145 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Any, List, Optional, Sequence, Tuple
+
+from dharitri_sdk.core.transaction_computer import TransactionComputer
+from dharitri_sdk.wallet.interfaces import ITransaction
+from dharitri_sdk.wallet.user_keys import UserSecretKey
+from dharitri_sdk.wallet.user_signer import UserSigner
+
+DEFAULT_BATCH_SIZE = 2000
+SIGNATURE_LENGTH = 64
+
+# The fields read by the transaction computer (when serializing for signing), in the order they are shipped to the workers.
+TransactionRecord = Tuple[int, int, str, str, str, str, int, int, bytes, str, int, int, str, str]
+
+_worker_signer: Optional[UserSigner] = None
+_worker_computer: Optional[TransactionComputer] = None
+
+
+class SigningReport:
+    def __init__(self, num_transactions: int, num_batches: int, duration_in_seconds: float) -> None:
+        self.num_transactions = num_transactions
+        self.num_batches = num_batches
+        self.duration_in_seconds = duration_in_seconds
+
+    @property
+    def transactions_per_second(self) -> float:
+        if not self.duration_in_seconds:
+            return 0.0
+        return self.num_transactions / self.duration_in_seconds
+
+    def __repr__(self) -> str:
+        return f"SigningReport(num_transactions={self.num_transactions}, num_batches={self.num_batches}, transactions_per_second={self.transactions_per_second:.0f})"
+
+
+class TransactionSigningEngine:
+    """
+    Signs (very) large sets of transactions of a single sender, by spreading them (in batches) across a pool of processes.
+
+    The secret key is handed to each worker process once, when the process starts. Then, the workers receive compact records
+    (tuples of the fields to be signed, instead of pickled transactions), and send back only the signatures.
+    Sets smaller than a batch are signed in the current process.
+
+    Args:
+        signer: the signer of the transactions
+        num_processes: the number of worker processes (defaults to the number of CPUs)
+        batch_size: the number of transactions handed to a worker at once
+        mp_context: the multiprocessing context of the pool (e.g. `multiprocessing.get_context("spawn")`)
+    """
+
+    def __init__(self,
+                 signer: UserSigner,
+                 num_processes: Optional[int] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 mp_context: Optional[BaseContext] = None) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        self.signer = signer
+        self.num_processes = num_processes or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.mp_context = mp_context
+        self.computer = TransactionComputer()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def sign_transactions(self, transactions: Sequence[ITransaction]) -> SigningReport:
+        """Signs the transactions and sets their `signature` field. Returns the throughput of the operation."""
+        started_at = time.perf_counter()
+        batches = [transactions[i:i + self.batch_size] for i in range(0, len(transactions), self.batch_size)]
+
+        if len(batches) <= 1:
+            self.signer.sign_transactions(transactions, self.computer)
+        else:
+            executor = self._get_executor()
+            records = ([_to_record(transaction) for transaction in batch] for batch in batches)
+
+            for batch, signatures in zip(batches, executor.map(_sign_records, records)):
+                for i, transaction in enumerate(batch):
+                    transaction.signature = signatures[i * SIGNATURE_LENGTH:(i + 1) * SIGNATURE_LENGTH]
+
+        duration = time.perf_counter() - started_at
+        return SigningReport(len(transactions), len(batches), duration)
+
+    def close(self) -> None:
+        """Shuts down the worker processes (if started)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "TransactionSigningEngine":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_processes,
+                mp_context=self.mp_context,
+                initializer=_initialize_worker,
+                initargs=(self.signer.secret_key.buffer,)
+            )
+
+        return self._executor
+
+
+class _TransactionRecordView:
+    """
+    Exposes a record as a transaction (to the computer), without the defaults applied by the `Transaction` constructor.
+    The signatures are not shipped to the workers (they are not signed), thus they are empty.
+    """
+
+    __slots__ = ("nonce", "value", "receiver", "sender", "sender_username", "receiver_username",
+                 "gas_price", "gas_limit", "data", "chain_id", "version", "options", "guardian", "relayer",
+                 "signature", "guardian_signature", "relayer_signature")
+
+    def __init__(self, record: TransactionRecord) -> None:
+        (self.nonce, self.value, self.receiver, self.sender, self.sender_username, self.receiver_username,
+         self.gas_price, self.gas_limit, self.data, self.chain_id, self.version, self.options, self.guardian, self.relayer) = record
+        self.signature = b""
+        self.guardian_signature = b""
+        self.relayer_signature = b""
+
+
+def _to_record(transaction: Any) -> TransactionRecord:
+    return (transaction.nonce, transaction.value, transaction.receiver, transaction.sender, transaction.sender_username, transaction.receiver_username,
+            transaction.gas_price, transaction.gas_limit, transaction.data, transaction.chain_id, transaction.version, transaction.options,
+            transaction.guardian, transaction.relayer)
+
+
+def _initialize_worker(secret_key: bytes) -> None:
+    global _worker_signer, _worker_computer
+    _worker_signer = UserSigner(UserSecretKey(secret_key))
+    _worker_computer = TransactionComputer()
+
+
+def _sign_records(records: List[TransactionRecord]) -> bytes:
+    assert _worker_signer is not None and _worker_computer is not None
+
+    transactions = [_TransactionRecordView(record) for record in records]
+    payloads = _worker_computer.compute_bytes_for_verifying_many(transactions)
+    return b"".join(_worker_signer.sign_many(payloads))
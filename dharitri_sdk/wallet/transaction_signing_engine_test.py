@@ -0,0 +1,51 @@
+from pathlib import Path
+from typing import List
+
+from dharitri_sdk.core.transaction import Transaction
+from dharitri_sdk.core.transaction_computer import TransactionComputer
+from dharitri_sdk.wallet.transaction_signing_engine import \
+    TransactionSigningEngine
+from dharitri_sdk.wallet.user_signer import UserSigner
+
+testwallets = Path(__file__).parent.parent / "testutils" / "testwallets"
+ALICE = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+BOB = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+
+
+def create_transactions(count: int) -> List[Transaction]:
+    transactions = [
+        Transaction(sender=ALICE, receiver=BOB, gas_limit=50000, chain_id="D", nonce=nonce, value=nonce * 10**18, data=f"nonce {nonce}".encode())
+        for nonce in range(count)
+    ]
+
+    TransactionComputer().apply_options_for_hash_signing(transactions[0])
+    return transactions
+
+
+def test_sign_transactions_in_worker_processes():
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    transactions = create_transactions(10)
+    expected = create_transactions(10)
+    signer.sign_transactions(expected, TransactionComputer())
+
+    with TransactionSigningEngine(signer, num_processes=2, batch_size=3) as engine:
+        report = engine.sign_transactions(transactions)
+
+    assert [tx.signature for tx in transactions] == [tx.signature for tx in expected]
+    assert report.num_transactions == 10
+    assert report.num_batches == 4
+    assert report.transactions_per_second > 0
+
+
+def test_sign_small_set_of_transactions_in_current_process():
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    transactions = create_transactions(5)
+    expected = create_transactions(5)
+    signer.sign_transactions(expected, TransactionComputer())
+
+    engine = TransactionSigningEngine(signer, num_processes=2, batch_size=5)
+    report = engine.sign_transactions(transactions)
+
+    assert [tx.signature for tx in transactions] == [tx.signature for tx in expected]
+    assert report.num_batches == 1
+    assert engine._executor is None
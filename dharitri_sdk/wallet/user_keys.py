@@ -15,6 +15,7 @@ class UserSecretKey:
             raise ErrBadSecretKeyLength()
 
         self.buffer = buffer
+        self._signing_key: Optional[nacl.signing.SigningKey] = None
 
     @classmethod
     def generate(cls) -> 'UserSecretKey':
@@ -28,15 +29,21 @@ class UserSecretKey:
         return UserSecretKey(buffer)
 
     def generate_public_key(self) -> 'UserPublicKey':
-        public_key = bytes(nacl.signing.SigningKey(self.buffer).verify_key)
+        public_key = bytes(self._get_signing_key().verify_key)
         return UserPublicKey(public_key)
 
     def sign(self, data: bytes) -> ISignature:
-        signing_key = nacl.signing.SigningKey(self.buffer)
+        signing_key = self._get_signing_key()
         signed = signing_key.sign(data)
         signature = signed.signature
         return signature
 
+    def _get_signing_key(self) -> nacl.signing.SigningKey:
+        # The key is expanded (and its public key derived) only once, then reused for all signatures.
+        if self._signing_key is None:
+            self._signing_key = nacl.signing.SigningKey(self.buffer)
+        return self._signing_key
+
     def hex(self) -> str:
         return self.buffer.hex()
 
@@ -53,9 +60,10 @@ class UserPublicKey:
             raise ErrBadPublicKeyLength()
 
         self.buffer = bytes(buffer)
+        self._verify_key: Optional[nacl.signing.VerifyKey] = None
 
     def verify(self, data: bytes, signature: ISignature) -> bool:
-        verify_key = nacl.signing.VerifyKey(self.buffer)
+        verify_key = self._get_verify_key()
 
         try:
             verify_key.verify(data, signature)
@@ -63,6 +71,11 @@ class UserPublicKey:
         except Exception:
             return False
 
+    def _get_verify_key(self) -> nacl.signing.VerifyKey:
+        if self._verify_key is None:
+            self._verify_key = nacl.signing.VerifyKey(self.buffer)
+        return self._verify_key
+
     def to_address(self, hrp: Optional[str] = None) -> Address:
         return Address(self.buffer, hrp)
 
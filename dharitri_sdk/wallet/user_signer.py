@@ -1,8 +1,9 @@
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
 from dharitri_sdk.wallet.errors import ErrCannotSign
-from dharitri_sdk.wallet.interfaces import ISignature
+from dharitri_sdk.wallet.interfaces import (ISignature, ITransaction,
+                                            ITransactionComputer)
 from dharitri_sdk.wallet.user_keys import UserPublicKey, UserSecretKey
 from dharitri_sdk.wallet.user_pem import UserPEM
 from dharitri_sdk.wallet.user_wallet import UserWallet
@@ -37,6 +38,26 @@ class UserSigner:
         except Exception as err:
             raise ErrCannotSign() from err
 
+    def sign_many(self, payloads: Sequence[bytes]) -> List[ISignature]:
+        try:
+            return [self._try_sign(data) for data in payloads]
+        except Exception as err:
+            raise ErrCannotSign() from err
+
+    def sign_transactions(self, transactions: Sequence[ITransaction], computer: ITransactionComputer) -> None:
+        """
+        Signs the transactions and sets their `signature` field.
+
+        Args:
+            transactions: the transactions to sign (all must have this signer as sender)
+            computer: the transaction computer (e.g. `TransactionComputer`) which serializes the transactions for signing
+        """
+        payloads = computer.compute_bytes_for_verifying_many(transactions)
+        signatures = self.sign_many(payloads)
+
+        for transaction, signature in zip(transactions, signatures):
+            transaction.signature = signature
+
     def _try_sign(self, data: bytes) -> ISignature:
         signature = self.secret_key.sign(data)
         return signature
@@ -1,15 +1,17 @@
 import json
 from pathlib import Path
+from typing import List
 
 import pytest
 
 from dharitri_sdk.core import (Address, Message, MessageComputer, Transaction,
                                TransactionComputer)
 from dharitri_sdk.wallet.crypto.randomness import Randomness
+from dharitri_sdk.wallet.interfaces import ITransactionComputer
 from dharitri_sdk.wallet.user_keys import UserSecretKey
 from dharitri_sdk.wallet.user_pem import UserPEM
 from dharitri_sdk.wallet.user_signer import UserSigner
-from dharitri_sdk.wallet.user_verifer import UserVerifier
+from dharitri_sdk.wallet.user_verifer import UserVerifier, verify_transactions
 from dharitri_sdk.wallet.user_wallet import UserWallet
 
 testwallets = Path(__file__).parent.parent / "testutils" / "testwallets"
@@ -138,6 +140,80 @@ def test_sign_transaction():
     assert verifier.verify(transaction_computer.compute_bytes_for_signing(tx), tx.signature)
 
 
+def test_sign_many():
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    payloads = [b"hello", b"", b"world" * 100]
+
+    signatures = signer.sign_many(payloads)
+
+    assert signatures == [signer.sign(payload) for payload in payloads]
+    assert signer.sign_many([]) == []
+
+
+def test_sign_transactions():
+    alice = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+    bob = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+    transactions = [Transaction(sender=alice, receiver=bob, gas_limit=50000, chain_id="D", nonce=nonce) for nonce in range(5)]
+
+    transaction_computer = TransactionComputer()
+    transaction_computer.apply_options_for_hash_signing(transactions[-1])
+
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    verifier = UserVerifier.from_address(Address.new_from_bech32(alice))
+    signer.sign_transactions(transactions, transaction_computer)
+
+    for transaction in transactions:
+        assert verifier.verify(transaction_computer.compute_bytes_for_verifying(transaction), transaction.signature)
+
+    assert transactions[-1].signature == signer.sign(transaction_computer.compute_hash_for_signing(transactions[-1]))
+
+
+def test_verify_many():
+    signer = UserSigner.from_pem_file(testwallets / "alice.pem")
+    verifier = UserVerifier(signer.get_pubkey())
+    payloads = [f"payload {i}".encode() for i in range(20)]
+    signatures = signer.sign_many(payloads)
+    signatures[3] = bytes(64)
+    signatures[7] = b"short"
+
+    expected = [i not in [3, 7] for i in range(20)]
+    assert verifier.verify_many(payloads, signatures) == expected
+    assert verifier.verify_many(payloads, signatures, max_workers=4) == expected
+
+    with pytest.raises(ValueError):
+        verifier.verify_many(payloads, signatures[1:])
+
+
+def test_verify_transactions():
+    alice = "drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"
+    bob = "drt1spyavw0956vq68xj8y4tenjpq2wd5a9p2c6j8gsz7ztyrnpxrruqlqde3c"
+    # the computer of the core package satisfies the protocol expected by the wallet
+    transaction_computer: ITransactionComputer = TransactionComputer()
+    transactions: List[Transaction] = []
+
+    for sender, pem in [(alice, "alice.pem"), (bob, "bob.pem")]:
+        batch = [Transaction(sender=sender, receiver=alice, gas_limit=50000, chain_id="D", nonce=nonce) for nonce in range(5)]
+        TransactionComputer().apply_options_for_hash_signing(batch[0])
+        UserSigner.from_pem_file(testwallets / pem).sign_transactions(batch, transaction_computer)
+        transactions.extend(batch)
+
+    transactions[2].nonce = 42
+    transactions[6].signature = transactions[1].signature
+
+    expected = [i not in [2, 6] for i in range(10)]
+    assert verify_transactions(transactions, transaction_computer) == expected
+    assert verify_transactions(transactions, transaction_computer, max_workers=3) == expected
+
+    # Malformed transactions (which cannot be serialized) are not verified, while the others still are.
+    transactions[4].version = 1
+    transactions[4].options = 2
+    transactions[8].sender = alice[:-1]
+
+    expected = [i not in [2, 4, 6, 8] for i in range(10)]
+    assert verify_transactions(transactions, transaction_computer) == expected
+    assert verify_transactions(transactions, transaction_computer, max_workers=3) == expected
+
+
 def test_sign_message():
     message = Message("hello".encode(), address=Address.new_from_bech32("drt1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssey5egf"))
     message_computer = MessageComputer()
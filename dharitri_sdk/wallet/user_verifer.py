@@ -1,7 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from dharitri_sdk.core.address import Address
-from dharitri_sdk.wallet.interfaces import IAddress, ISignature
+from dharitri_sdk.wallet.interfaces import (IAddress, ISignature, ITransaction,
+                                            ITransactionComputer)
 from dharitri_sdk.wallet.user_keys import UserPublicKey
 
+CHUNKS_PER_WORKER = 4
+
+VerificationItem = Tuple[Optional[UserPublicKey], bytes, ISignature]
+
 
 class UserVerifier:
     def __init__(self, public_key: UserPublicKey) -> None:
@@ -15,3 +23,89 @@ class UserVerifier:
 
     def verify(self, data: bytes, signature: ISignature) -> bool:
         return self.public_key.verify(data, signature)
+
+    def verify_many(self, payloads: Sequence[bytes], signatures: Sequence[ISignature], max_workers: Optional[int] = None) -> List[bool]:
+        """
+        Verifies many signatures (of the same signer).
+
+        Args:
+            payloads: the signed data
+            signatures: the signatures, one for each payload
+            max_workers: if greater than 1, the verification is spread across this many threads (the underlying library releases the GIL)
+
+        Returns:
+            whether each signature is valid, in the order of the payloads
+        """
+        if len(payloads) != len(signatures):
+            raise ValueError("payloads and signatures must have the same length")
+
+        items: List[VerificationItem] = [(self.public_key, data, signature) for data, signature in zip(payloads, signatures)]
+        return _verify_items(items, max_workers)
+
+
+def verify_transactions(transactions: Sequence[ITransaction], computer: ITransactionComputer, max_workers: Optional[int] = None) -> List[bool]:
+    """
+    Verifies the signatures of the transactions against their senders. The public key of each sender is decoded (and expanded) only once.
+
+    Args:
+        transactions: the transactions to verify (possibly of different senders)
+        computer: the transaction computer (e.g. `TransactionComputer`) which serializes the transactions for verifying
+        max_workers: if greater than 1, the verification is spread across this many threads
+
+    Returns:
+        whether each transaction is properly signed by its sender, in the order of the transactions
+        (`False` for senders that are not valid addresses, and for transactions that cannot be serialized, e.g. with options not supported by their version)
+    """
+    payloads = _compute_payloads(transactions, computer)
+    public_keys: Dict[str, Optional[UserPublicKey]] = {}
+    items: List[VerificationItem] = []
+
+    for transaction, data in zip(transactions, payloads):
+        if data is None:
+            items.append((None, b"", transaction.signature))
+            continue
+
+        sender = transaction.sender
+        if sender not in public_keys:
+            public_keys[sender] = _get_public_key_or_none(sender)
+        items.append((public_keys[sender], data, transaction.signature))
+
+    return _verify_items(items, max_workers)
+
+
+def _compute_payloads(transactions: Sequence[ITransaction], computer: ITransactionComputer) -> List[Optional[bytes]]:
+    # The batch is serialized at once; if (at least) one transaction is malformed, the transactions are serialized one by one,
+    # so that only the malformed ones fail the verification.
+    try:
+        return list(computer.compute_bytes_for_verifying_many(transactions))
+    except Exception:
+        return [_compute_payload_or_none(transaction, computer) for transaction in transactions]
+
+
+def _compute_payload_or_none(transaction: ITransaction, computer: ITransactionComputer) -> Optional[bytes]:
+    try:
+        return computer.compute_bytes_for_verifying(transaction)
+    except Exception:
+        return None
+
+
+def _get_public_key_or_none(address: str) -> Optional[UserPublicKey]:
+    try:
+        return UserPublicKey(Address.new_from_bech32(address).get_public_key())
+    except Exception:
+        return None
+
+
+def _verify_items(items: List[VerificationItem], max_workers: Optional[int]) -> List[bool]:
+    if not max_workers or max_workers <= 1 or len(items) < 2:
+        return _verify_chunk(items)
+
+    chunk_size = max(1, -(-len(items) // (max_workers * CHUNKS_PER_WORKER)))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [result for results in executor.map(_verify_chunk, chunks) for result in results]
+
+
+def _verify_chunk(items: List[VerificationItem]) -> List[bool]:
+    return [public_key is not None and public_key.verify(data, signature) for public_key, data, signature in items]
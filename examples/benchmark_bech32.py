@@ -0,0 +1,84 @@
+"""
+Compares the throughput of the bech32 codec used by `Address` (`dharitri_sdk.core.bech32_codec`)
+with the one of the reference implementation (`dharitri_sdk.core.bech32`), on random public keys.
+
+Usage (from the root of the repository, if the package is not installed):
+    PYTHONPATH=. python examples/benchmark_bech32.py [--count N] [--repeat R] [--hrp HRP]
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Callable, List, Tuple
+
+from dharitri_sdk.core import bech32, bech32_codec
+
+PUBKEY_LENGTH = 32
+
+
+def reference_encode(hrp: str, pubkey: bytes) -> str:
+    data = bech32.convertbits(pubkey, 8, 5)
+    assert data is not None
+    return bech32.bech32_encode(hrp, data)
+
+
+def reference_decode(value: str) -> Tuple[str, bytes]:
+    hrp, data = bech32.bech32_decode(value)
+    assert hrp is not None and data is not None
+    pubkey = bech32.convertbits(data, 5, 8, False)
+    assert pubkey is not None
+    return hrp, bytes(pubkey)
+
+
+def codec_decode(value: str) -> Tuple[str, bytes]:
+    hrp, pubkey = bech32_codec.decode(value)
+    assert hrp is not None and pubkey is not None
+    return hrp, pubkey
+
+
+def measure(function: Callable[[], List[Any]], repeat: int) -> Tuple[float, List[Any]]:
+    """Runs the function `repeat` times; returns the best duration (in seconds) and the last result."""
+    best = float("inf")
+    result: List[Any] = []
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started_at)
+
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compares bech32_codec with the reference bech32 implementation.")
+    parser.add_argument("--count", type=int, default=100_000, help="the number of public keys")
+    parser.add_argument("--repeat", type=int, default=3, help="how many times each measurement is repeated (the best one is kept)")
+    parser.add_argument("--hrp", default="drt", help="the human-readable part of the addresses")
+    args = parser.parse_args()
+
+    hrp: str = args.hrp
+    pubkeys = [os.urandom(PUBKEY_LENGTH) for _ in range(args.count)]
+
+    reference_encode_time, reference_encoded = measure(lambda: [reference_encode(hrp, pubkey) for pubkey in pubkeys], args.repeat)
+    codec_encode_time, codec_encoded = measure(lambda: [bech32_codec.encode(hrp, pubkey) for pubkey in pubkeys], args.repeat)
+    assert codec_encoded == reference_encoded, "the implementations disagree (encode)"
+
+    addresses: List[str] = codec_encoded
+    reference_decode_time, reference_decoded = measure(lambda: [reference_decode(value) for value in addresses], args.repeat)
+    codec_decode_time, codec_decoded = measure(lambda: [codec_decode(value) for value in addresses], args.repeat)
+    assert codec_decoded == reference_decoded, "the implementations disagree (decode)"
+
+    print(f"{args.count} public keys, best of {args.repeat} runs")
+    print(f"{'operation':<10}{'bech32.py':>16}{'bech32_codec':>16}{'speedup':>10}")
+
+    for operation, reference_time, codec_time in [
+        ("encode", reference_encode_time, codec_encode_time),
+        ("decode", reference_decode_time, codec_decode_time)
+    ]:
+        reference_rate = args.count / reference_time
+        codec_rate = args.count / codec_time
+        print(f"{operation:<10}{reference_rate:>12.0f} op/s{codec_rate:>12.0f} op/s{reference_time / codec_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()